@@ -0,0 +1,2077 @@
+"""Auto-generated module for autoload definitions."""
+
+# This is generated code. Do not modify.
+
+content_map = {
+    'common': {
+        'sections': {
+            (66666666, 'Group',): 'distance._impl.level_objects.group',
+        },
+        'interesting': set(),
+        'classes': {
+            'NamedPropertiesFragment': {
+                'fields': {
+                },
+                'noversion_cls': ('distance._impl.fragments.npfragments', 'NamedPropertiesFragment',),
+            },
+            'Group': {
+                'base_container': (66666666, 'Group',),
+                'noversion_cls': ('distance._impl.level_objects.group', 'Group',),
+            },
+            'GoldenSimple': {
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'OldSimple': {
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Replay': {
+                'noversion_cls': ('distance._nonlevel', 'Replay',),
+            },
+        },
+        'key_tags': {
+            (66666666, 'Group',): 'Group',
+        },
+    },
+    'level_objects': {
+        'sections': {
+            (66666666, 'Group',): 'distance._impl.level_objects.group',
+            (66666666, 'Teleporter',): 'distance._impl.level_objects.objects',
+            (66666666, 'TeleporterVirus',): 'distance._impl.level_objects.objects',
+            (66666666, 'TeleporterAndAmbientChangeTrigger',): 'distance._impl.level_objects.objects',
+            (66666666, 'TeleporterExit',): 'distance._impl.level_objects.objects',
+            (66666666, 'WorldText',): 'distance._impl.level_objects.objects',
+            (66666666, 'InfoDisplayBox',): 'distance._impl.level_objects.objects',
+            (66666666, 'CarScreenTextDecodeTrigger',): 'distance._impl.level_objects.objects',
+            (66666666, 'GravityTrigger',): 'distance._impl.level_objects.objects',
+            (66666666, 'ForceZoneBox',): 'distance._impl.level_objects.objects',
+            (66666666, 'EnableAbilitiesBox',): 'distance._impl.level_objects.objects',
+            (66666666, 'SetAbilitiesTrigger',): 'distance._impl.level_objects.objects',
+            (66666666, 'WarpAnchor',): 'distance._impl.level_objects.objects',
+            (66666666, 'EventTriggerBox',): 'distance._impl.level_objects.objects',
+            (66666666, 'EventTriggerSphere',): 'distance._impl.level_objects.objects',
+            (66666666, 'WingCorruptionZone',): 'distance._impl.level_objects.objects',
+            (66666666, 'WingCorruptionZoneLarge',): 'distance._impl.level_objects.objects',
+            (66666666, 'VirusSpiritSpawner',): 'distance._impl.level_objects.objects',
+            (66666666, 'KillGridBox',): 'distance._impl.level_objects.objects',
+            (66666666, 'KillGridCylinder',): 'distance._impl.level_objects.objects',
+            (66666666, 'CheckpointNoVisual',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmpireCheckpoint',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmpireCheckpointHalf',): 'distance._impl.level_objects.objects',
+            (66666666, 'AbilityCheckpoint',): 'distance._impl.level_objects.objects',
+            (66666666, 'AbilityCheckpointOLD',): 'distance._impl.level_objects.objects',
+            (66666666, 'NitronicCheckpoint',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmpirePowerFlyingRing',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmpirePowerRoadRing',): 'distance._impl.level_objects.objects',
+            (66666666, 'CooldownTriggerNoVisual',): 'distance._impl.level_objects.objects',
+            (66666666, 'VirusMazeTowerFat',): 'distance._impl.level_objects.objects',
+            (66666666, 'VirusMazeCeiling001',): 'distance._impl.level_objects.objects',
+            (66666666, 'VirusMazeTowerFat002',): 'distance._impl.level_objects.objects',
+            (66666666, 'VirusMazeTowerFat003',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmpireMovingPillar',): 'distance._impl.level_objects.objects',
+            (66666666, 'PlanetWithSphericalGravity',): 'distance._impl.level_objects.objects',
+            (66666666, 'AppleGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'ArchGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'ArchQuarterGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'CapsuleGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'CheeseGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'CircleFrustumGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'ConeGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'CubeGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'CylinderGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'CylinderHDGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'DodecahedronGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'FrustumGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'HemisphereGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'HexagonGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IcosahedronGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularCapsule1GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularCapsule2GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularConeGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularCubeGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularCylinderGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularDodecahedronGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularFlatDropGS 1',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularHexagonGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularIcosahedronGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularOctahedronGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularPlaneGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularPyramid001GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularPyramid002GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularRectangle001GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularRectangle002GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularRectangle003GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularRectangle004GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularRingGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularSphere001GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularSphere002GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularTeardropGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularTube001GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularTube002GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'OctahedronGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'PeanutGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'PentagonGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'PlaneGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'PlaneOneSidedGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'PointyGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'PyramidGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'QuadGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'RingGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'RingHalfGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'Rock1GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'Rock2GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'Rock3GS',): 'distance._impl.level_objects.objects',
+            (66666666, 'SphereGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'SphereHDGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'TeardropGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'TetrahedronGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'TrapezoidGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'TubeGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'WedgeGS',): 'distance._impl.level_objects.objects',
+            (66666666, 'Capsule',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveCapsule',): 'distance._impl.level_objects.objects',
+            (66666666, 'CapsuleWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveCapsuleWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'Cone',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveCone',): 'distance._impl.level_objects.objects',
+            (66666666, 'ConeWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveConeWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'Cube',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveCube',): 'distance._impl.level_objects.objects',
+            (66666666, 'CubeWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveCubeWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'Cylinder',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveCylinder',): 'distance._impl.level_objects.objects',
+            (66666666, 'CylinderWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveCylinderWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'CylinderTapered',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveCylinderTapered',): 'distance._impl.level_objects.objects',
+            (66666666, 'CylinderTaperedWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveCylinderTaperedWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'Dodecahedron',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveDodecahedron',): 'distance._impl.level_objects.objects',
+            (66666666, 'DodecahedronWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveDodecahedronWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'FlatDrop',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveFlatDrop',): 'distance._impl.level_objects.objects',
+            (66666666, 'FlatDropWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveFlatDropWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'Hexagon',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveHexagon',): 'distance._impl.level_objects.objects',
+            (66666666, 'HexagonWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveHexagonWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'Icosahedron',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveIcosahedron',): 'distance._impl.level_objects.objects',
+            (66666666, 'IcosahedronWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveIcosahedronWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularCapsule001',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveIrregularCapsule001',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularCapsule001WithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveIrregularCapsule001WithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularCapsule002',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveIrregularCapsule002',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularCapsule002WithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveIrregularCapsule002WithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularFlatDrop',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveIrregularFlatDrop',): 'distance._impl.level_objects.objects',
+            (66666666, 'IrregularFlatDropWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveIrregularFlatDropWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'Octahedron',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveOctahedron',): 'distance._impl.level_objects.objects',
+            (66666666, 'OctahedronWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveOctahedronWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'Plane',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissivePlane',): 'distance._impl.level_objects.objects',
+            (66666666, 'PlaneWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissivePlaneWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'Pyramid',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissivePyramid',): 'distance._impl.level_objects.objects',
+            (66666666, 'PyramidWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissivePyramidWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'Ring',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveRing',): 'distance._impl.level_objects.objects',
+            (66666666, 'RingWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveRingWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'RingHalf',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveRingHalf',): 'distance._impl.level_objects.objects',
+            (66666666, 'RingHalfWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveRingHalfWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'Sphere',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveSphere',): 'distance._impl.level_objects.objects',
+            (66666666, 'SphereWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveSphereWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'Teardrop',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveTeardrop',): 'distance._impl.level_objects.objects',
+            (66666666, 'TeardropWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveTeardropWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'TrueCone',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveTrueCone',): 'distance._impl.level_objects.objects',
+            (66666666, 'TrueConeWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveTrueConeWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'Tube',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveTube',): 'distance._impl.level_objects.objects',
+            (66666666, 'TubeWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveTubeWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'Wedge',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveWedge',): 'distance._impl.level_objects.objects',
+            (66666666, 'WedgeWithCollision',): 'distance._impl.level_objects.objects',
+            (66666666, 'EmissiveWedgeWithCollision',): 'distance._impl.level_objects.objects',
+        },
+        'interesting': set(),
+        'classes': {
+            'Group': {
+                'base_container': (66666666, 'Group',),
+                'noversion_cls': ('distance._impl.level_objects.group', 'Group',),
+            },
+            'Teleporter': {
+                'base_container': (66666666, 'Teleporter',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'Teleporter',),
+            },
+            'TeleporterVirus': {
+                'base_container': (66666666, 'TeleporterVirus',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'Teleporter',),
+            },
+            'TeleporterAndAmbientChangeTrigger': {
+                'base_container': (66666666, 'TeleporterAndAmbientChangeTrigger',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'Teleporter',),
+            },
+            'TeleporterExit': {
+                'base_container': (66666666, 'TeleporterExit',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'Teleporter',),
+            },
+            'WorldText': {
+                'base_container': (66666666, 'WorldText',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'WorldText',),
+            },
+            'InfoDisplayBox': {
+                'base_container': (66666666, 'InfoDisplayBox',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'InfoDisplayBox',),
+            },
+            'CarScreenTextDecodeTrigger': {
+                'base_container': (66666666, 'CarScreenTextDecodeTrigger',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'CarScreenTextDecodeTrigger',),
+            },
+            'GravityTrigger': {
+                'base_container': (66666666, 'GravityTrigger',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GravityTrigger',),
+            },
+            'ForceZoneBox': {
+                'base_container': (66666666, 'ForceZoneBox',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'ForceZoneBox',),
+            },
+            'EnableAbilitiesBox': {
+                'base_container': (66666666, 'EnableAbilitiesBox',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'EnableAbilitiesBox',),
+            },
+            'SetAbilitiesTrigger': {
+                'base_container': (66666666, 'SetAbilitiesTrigger',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'SetAbilitiesTrigger',),
+            },
+            'WarpAnchor': {
+                'base_container': (66666666, 'WarpAnchor',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'WarpAnchor',),
+            },
+            'EventTriggerBox': {
+                'base_container': (66666666, 'EventTriggerBox',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'EventTrigger',),
+            },
+            'EventTriggerSphere': {
+                'base_container': (66666666, 'EventTriggerSphere',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'EventTrigger',),
+            },
+            'WingCorruptionZone': {
+                'base_container': (66666666, 'WingCorruptionZone',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'WingCorruptionZone',),
+            },
+            'WingCorruptionZoneLarge': {
+                'base_container': (66666666, 'WingCorruptionZoneLarge',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'WingCorruptionZoneLarge',),
+            },
+            'VirusSpiritSpawner': {
+                'base_container': (66666666, 'VirusSpiritSpawner',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'VirusSpiritSpawner',),
+            },
+            'KillGridBox': {
+                'base_container': (66666666, 'KillGridBox',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'KillGridBox',),
+            },
+            'KillGridCylinder': {
+                'base_container': (66666666, 'KillGridCylinder',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'KillGridCylinder',),
+            },
+            'CheckpointNoVisual': {
+                'base_container': (66666666, 'CheckpointNoVisual',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'Checkpoint',),
+            },
+            'EmpireCheckpoint': {
+                'base_container': (66666666, 'EmpireCheckpoint',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'Checkpoint',),
+            },
+            'EmpireCheckpointHalf': {
+                'base_container': (66666666, 'EmpireCheckpointHalf',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'Checkpoint',),
+            },
+            'AbilityCheckpoint': {
+                'base_container': (66666666, 'AbilityCheckpoint',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'AbilityCheckpoint',),
+            },
+            'AbilityCheckpointOLD': {
+                'base_container': (66666666, 'AbilityCheckpointOLD',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'AbilityCheckpoint',),
+            },
+            'NitronicCheckpoint': {
+                'base_container': (66666666, 'NitronicCheckpoint',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'NitronicCheckpoint',),
+            },
+            'EmpirePowerFlyingRing': {
+                'base_container': (66666666, 'EmpirePowerFlyingRing',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'EmpirePowerFlyingRing',),
+            },
+            'EmpirePowerRoadRing': {
+                'base_container': (66666666, 'EmpirePowerRoadRing',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'EmpirePowerRoadRing',),
+            },
+            'CooldownTriggerNoVisual': {
+                'base_container': (66666666, 'CooldownTriggerNoVisual',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'CooldownTriggerNoVisual',),
+            },
+            'VirusMazeTowerFat': {
+                'base_container': (66666666, 'VirusMazeTowerFat',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'VirusMazeBuilding',),
+            },
+            'VirusMazeCeiling001': {
+                'base_container': (66666666, 'VirusMazeCeiling001',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'VirusMazeBuilding',),
+            },
+            'VirusMazeTowerFat002': {
+                'base_container': (66666666, 'VirusMazeTowerFat002',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'VirusMazeBuilding',),
+            },
+            'VirusMazeTowerFat003': {
+                'base_container': (66666666, 'VirusMazeTowerFat003',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'VirusMazeBuilding',),
+            },
+            'EmpireMovingPillar': {
+                'base_container': (66666666, 'EmpireMovingPillar',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'VirusMazeBuilding',),
+            },
+            'PlanetWithSphericalGravity': {
+                'base_container': (66666666, 'PlanetWithSphericalGravity',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'PlanetWithSphericalGravity',),
+            },
+            'AppleGS': {
+                'base_container': (66666666, 'AppleGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'ArchGS': {
+                'base_container': (66666666, 'ArchGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'ArchQuarterGS': {
+                'base_container': (66666666, 'ArchQuarterGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'CapsuleGS': {
+                'base_container': (66666666, 'CapsuleGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'CheeseGS': {
+                'base_container': (66666666, 'CheeseGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'CircleFrustumGS': {
+                'base_container': (66666666, 'CircleFrustumGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'ConeGS': {
+                'base_container': (66666666, 'ConeGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'CubeGS': {
+                'base_container': (66666666, 'CubeGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'CylinderGS': {
+                'base_container': (66666666, 'CylinderGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'CylinderHDGS': {
+                'base_container': (66666666, 'CylinderHDGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'DodecahedronGS': {
+                'base_container': (66666666, 'DodecahedronGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'FrustumGS': {
+                'base_container': (66666666, 'FrustumGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'HemisphereGS': {
+                'base_container': (66666666, 'HemisphereGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'HexagonGS': {
+                'base_container': (66666666, 'HexagonGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IcosahedronGS': {
+                'base_container': (66666666, 'IcosahedronGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularCapsule1GS': {
+                'base_container': (66666666, 'IrregularCapsule1GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularCapsule2GS': {
+                'base_container': (66666666, 'IrregularCapsule2GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularConeGS': {
+                'base_container': (66666666, 'IrregularConeGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularCubeGS': {
+                'base_container': (66666666, 'IrregularCubeGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularCylinderGS': {
+                'base_container': (66666666, 'IrregularCylinderGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularDodecahedronGS': {
+                'base_container': (66666666, 'IrregularDodecahedronGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularFlatDropGS 1': {
+                'base_container': (66666666, 'IrregularFlatDropGS 1',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularHexagonGS': {
+                'base_container': (66666666, 'IrregularHexagonGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularIcosahedronGS': {
+                'base_container': (66666666, 'IrregularIcosahedronGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularOctahedronGS': {
+                'base_container': (66666666, 'IrregularOctahedronGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularPlaneGS': {
+                'base_container': (66666666, 'IrregularPlaneGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularPyramid001GS': {
+                'base_container': (66666666, 'IrregularPyramid001GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularPyramid002GS': {
+                'base_container': (66666666, 'IrregularPyramid002GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularRectangle001GS': {
+                'base_container': (66666666, 'IrregularRectangle001GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularRectangle002GS': {
+                'base_container': (66666666, 'IrregularRectangle002GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularRectangle003GS': {
+                'base_container': (66666666, 'IrregularRectangle003GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularRectangle004GS': {
+                'base_container': (66666666, 'IrregularRectangle004GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularRingGS': {
+                'base_container': (66666666, 'IrregularRingGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularSphere001GS': {
+                'base_container': (66666666, 'IrregularSphere001GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularSphere002GS': {
+                'base_container': (66666666, 'IrregularSphere002GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularTeardropGS': {
+                'base_container': (66666666, 'IrregularTeardropGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularTube001GS': {
+                'base_container': (66666666, 'IrregularTube001GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'IrregularTube002GS': {
+                'base_container': (66666666, 'IrregularTube002GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'OctahedronGS': {
+                'base_container': (66666666, 'OctahedronGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'PeanutGS': {
+                'base_container': (66666666, 'PeanutGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'PentagonGS': {
+                'base_container': (66666666, 'PentagonGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'PlaneGS': {
+                'base_container': (66666666, 'PlaneGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'PlaneOneSidedGS': {
+                'base_container': (66666666, 'PlaneOneSidedGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'PointyGS': {
+                'base_container': (66666666, 'PointyGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'PyramidGS': {
+                'base_container': (66666666, 'PyramidGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'QuadGS': {
+                'base_container': (66666666, 'QuadGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'RingGS': {
+                'base_container': (66666666, 'RingGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'RingHalfGS': {
+                'base_container': (66666666, 'RingHalfGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'Rock1GS': {
+                'base_container': (66666666, 'Rock1GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'Rock2GS': {
+                'base_container': (66666666, 'Rock2GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'Rock3GS': {
+                'base_container': (66666666, 'Rock3GS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'SphereGS': {
+                'base_container': (66666666, 'SphereGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'SphereHDGS': {
+                'base_container': (66666666, 'SphereHDGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'TeardropGS': {
+                'base_container': (66666666, 'TeardropGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'TetrahedronGS': {
+                'base_container': (66666666, 'TetrahedronGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'TrapezoidGS': {
+                'base_container': (66666666, 'TrapezoidGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'TubeGS': {
+                'base_container': (66666666, 'TubeGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'WedgeGS': {
+                'base_container': (66666666, 'WedgeGS',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'GoldenSimple',),
+            },
+            'Capsule': {
+                'base_container': (66666666, 'Capsule',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveCapsule': {
+                'base_container': (66666666, 'EmissiveCapsule',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'CapsuleWithCollision': {
+                'base_container': (66666666, 'CapsuleWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveCapsuleWithCollision': {
+                'base_container': (66666666, 'EmissiveCapsuleWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Cone': {
+                'base_container': (66666666, 'Cone',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveCone': {
+                'base_container': (66666666, 'EmissiveCone',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'ConeWithCollision': {
+                'base_container': (66666666, 'ConeWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveConeWithCollision': {
+                'base_container': (66666666, 'EmissiveConeWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Cube': {
+                'base_container': (66666666, 'Cube',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveCube': {
+                'base_container': (66666666, 'EmissiveCube',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'CubeWithCollision': {
+                'base_container': (66666666, 'CubeWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveCubeWithCollision': {
+                'base_container': (66666666, 'EmissiveCubeWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Cylinder': {
+                'base_container': (66666666, 'Cylinder',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveCylinder': {
+                'base_container': (66666666, 'EmissiveCylinder',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'CylinderWithCollision': {
+                'base_container': (66666666, 'CylinderWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveCylinderWithCollision': {
+                'base_container': (66666666, 'EmissiveCylinderWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'CylinderTapered': {
+                'base_container': (66666666, 'CylinderTapered',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveCylinderTapered': {
+                'base_container': (66666666, 'EmissiveCylinderTapered',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'CylinderTaperedWithCollision': {
+                'base_container': (66666666, 'CylinderTaperedWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveCylinderTaperedWithCollision': {
+                'base_container': (66666666, 'EmissiveCylinderTaperedWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Dodecahedron': {
+                'base_container': (66666666, 'Dodecahedron',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveDodecahedron': {
+                'base_container': (66666666, 'EmissiveDodecahedron',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'DodecahedronWithCollision': {
+                'base_container': (66666666, 'DodecahedronWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveDodecahedronWithCollision': {
+                'base_container': (66666666, 'EmissiveDodecahedronWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'FlatDrop': {
+                'base_container': (66666666, 'FlatDrop',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveFlatDrop': {
+                'base_container': (66666666, 'EmissiveFlatDrop',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'FlatDropWithCollision': {
+                'base_container': (66666666, 'FlatDropWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveFlatDropWithCollision': {
+                'base_container': (66666666, 'EmissiveFlatDropWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Hexagon': {
+                'base_container': (66666666, 'Hexagon',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveHexagon': {
+                'base_container': (66666666, 'EmissiveHexagon',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'HexagonWithCollision': {
+                'base_container': (66666666, 'HexagonWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveHexagonWithCollision': {
+                'base_container': (66666666, 'EmissiveHexagonWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Icosahedron': {
+                'base_container': (66666666, 'Icosahedron',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveIcosahedron': {
+                'base_container': (66666666, 'EmissiveIcosahedron',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'IcosahedronWithCollision': {
+                'base_container': (66666666, 'IcosahedronWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveIcosahedronWithCollision': {
+                'base_container': (66666666, 'EmissiveIcosahedronWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'IrregularCapsule001': {
+                'base_container': (66666666, 'IrregularCapsule001',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveIrregularCapsule001': {
+                'base_container': (66666666, 'EmissiveIrregularCapsule001',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'IrregularCapsule001WithCollision': {
+                'base_container': (66666666, 'IrregularCapsule001WithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveIrregularCapsule001WithCollision': {
+                'base_container': (66666666, 'EmissiveIrregularCapsule001WithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'IrregularCapsule002': {
+                'base_container': (66666666, 'IrregularCapsule002',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveIrregularCapsule002': {
+                'base_container': (66666666, 'EmissiveIrregularCapsule002',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'IrregularCapsule002WithCollision': {
+                'base_container': (66666666, 'IrregularCapsule002WithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveIrregularCapsule002WithCollision': {
+                'base_container': (66666666, 'EmissiveIrregularCapsule002WithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'IrregularFlatDrop': {
+                'base_container': (66666666, 'IrregularFlatDrop',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveIrregularFlatDrop': {
+                'base_container': (66666666, 'EmissiveIrregularFlatDrop',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'IrregularFlatDropWithCollision': {
+                'base_container': (66666666, 'IrregularFlatDropWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveIrregularFlatDropWithCollision': {
+                'base_container': (66666666, 'EmissiveIrregularFlatDropWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Octahedron': {
+                'base_container': (66666666, 'Octahedron',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveOctahedron': {
+                'base_container': (66666666, 'EmissiveOctahedron',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'OctahedronWithCollision': {
+                'base_container': (66666666, 'OctahedronWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveOctahedronWithCollision': {
+                'base_container': (66666666, 'EmissiveOctahedronWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Plane': {
+                'base_container': (66666666, 'Plane',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissivePlane': {
+                'base_container': (66666666, 'EmissivePlane',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'PlaneWithCollision': {
+                'base_container': (66666666, 'PlaneWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissivePlaneWithCollision': {
+                'base_container': (66666666, 'EmissivePlaneWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Pyramid': {
+                'base_container': (66666666, 'Pyramid',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissivePyramid': {
+                'base_container': (66666666, 'EmissivePyramid',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'PyramidWithCollision': {
+                'base_container': (66666666, 'PyramidWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissivePyramidWithCollision': {
+                'base_container': (66666666, 'EmissivePyramidWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Ring': {
+                'base_container': (66666666, 'Ring',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveRing': {
+                'base_container': (66666666, 'EmissiveRing',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'RingWithCollision': {
+                'base_container': (66666666, 'RingWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveRingWithCollision': {
+                'base_container': (66666666, 'EmissiveRingWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'RingHalf': {
+                'base_container': (66666666, 'RingHalf',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveRingHalf': {
+                'base_container': (66666666, 'EmissiveRingHalf',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'RingHalfWithCollision': {
+                'base_container': (66666666, 'RingHalfWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveRingHalfWithCollision': {
+                'base_container': (66666666, 'EmissiveRingHalfWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Sphere': {
+                'base_container': (66666666, 'Sphere',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveSphere': {
+                'base_container': (66666666, 'EmissiveSphere',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'SphereWithCollision': {
+                'base_container': (66666666, 'SphereWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveSphereWithCollision': {
+                'base_container': (66666666, 'EmissiveSphereWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Teardrop': {
+                'base_container': (66666666, 'Teardrop',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveTeardrop': {
+                'base_container': (66666666, 'EmissiveTeardrop',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'TeardropWithCollision': {
+                'base_container': (66666666, 'TeardropWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveTeardropWithCollision': {
+                'base_container': (66666666, 'EmissiveTeardropWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'TrueCone': {
+                'base_container': (66666666, 'TrueCone',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveTrueCone': {
+                'base_container': (66666666, 'EmissiveTrueCone',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'TrueConeWithCollision': {
+                'base_container': (66666666, 'TrueConeWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveTrueConeWithCollision': {
+                'base_container': (66666666, 'EmissiveTrueConeWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Tube': {
+                'base_container': (66666666, 'Tube',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveTube': {
+                'base_container': (66666666, 'EmissiveTube',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'TubeWithCollision': {
+                'base_container': (66666666, 'TubeWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveTubeWithCollision': {
+                'base_container': (66666666, 'EmissiveTubeWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'Wedge': {
+                'base_container': (66666666, 'Wedge',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveWedge': {
+                'base_container': (66666666, 'EmissiveWedge',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'WedgeWithCollision': {
+                'base_container': (66666666, 'WedgeWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+            'EmissiveWedgeWithCollision': {
+                'base_container': (66666666, 'EmissiveWedgeWithCollision',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'OldSimple',),
+            },
+        },
+        'key_tags': {
+            (66666666, 'Group',): 'Group',
+            (66666666, 'Teleporter',): 'Teleporter',
+            (66666666, 'TeleporterVirus',): 'TeleporterVirus',
+            (66666666, 'TeleporterAndAmbientChangeTrigger',): 'TeleporterAndAmbientChangeTrigger',
+            (66666666, 'TeleporterExit',): 'TeleporterExit',
+            (66666666, 'WorldText',): 'WorldText',
+            (66666666, 'InfoDisplayBox',): 'InfoDisplayBox',
+            (66666666, 'CarScreenTextDecodeTrigger',): 'CarScreenTextDecodeTrigger',
+            (66666666, 'GravityTrigger',): 'GravityTrigger',
+            (66666666, 'ForceZoneBox',): 'ForceZoneBox',
+            (66666666, 'EnableAbilitiesBox',): 'EnableAbilitiesBox',
+            (66666666, 'SetAbilitiesTrigger',): 'SetAbilitiesTrigger',
+            (66666666, 'WarpAnchor',): 'WarpAnchor',
+            (66666666, 'EventTriggerBox',): 'EventTriggerBox',
+            (66666666, 'EventTriggerSphere',): 'EventTriggerSphere',
+            (66666666, 'WingCorruptionZone',): 'WingCorruptionZone',
+            (66666666, 'WingCorruptionZoneLarge',): 'WingCorruptionZoneLarge',
+            (66666666, 'VirusSpiritSpawner',): 'VirusSpiritSpawner',
+            (66666666, 'KillGridBox',): 'KillGridBox',
+            (66666666, 'KillGridCylinder',): 'KillGridCylinder',
+            (66666666, 'CheckpointNoVisual',): 'CheckpointNoVisual',
+            (66666666, 'EmpireCheckpoint',): 'EmpireCheckpoint',
+            (66666666, 'EmpireCheckpointHalf',): 'EmpireCheckpointHalf',
+            (66666666, 'AbilityCheckpoint',): 'AbilityCheckpoint',
+            (66666666, 'AbilityCheckpointOLD',): 'AbilityCheckpointOLD',
+            (66666666, 'NitronicCheckpoint',): 'NitronicCheckpoint',
+            (66666666, 'EmpirePowerFlyingRing',): 'EmpirePowerFlyingRing',
+            (66666666, 'EmpirePowerRoadRing',): 'EmpirePowerRoadRing',
+            (66666666, 'CooldownTriggerNoVisual',): 'CooldownTriggerNoVisual',
+            (66666666, 'VirusMazeTowerFat',): 'VirusMazeTowerFat',
+            (66666666, 'VirusMazeCeiling001',): 'VirusMazeCeiling001',
+            (66666666, 'VirusMazeTowerFat002',): 'VirusMazeTowerFat002',
+            (66666666, 'VirusMazeTowerFat003',): 'VirusMazeTowerFat003',
+            (66666666, 'EmpireMovingPillar',): 'EmpireMovingPillar',
+            (66666666, 'PlanetWithSphericalGravity',): 'PlanetWithSphericalGravity',
+            (66666666, 'AppleGS',): 'AppleGS',
+            (66666666, 'ArchGS',): 'ArchGS',
+            (66666666, 'ArchQuarterGS',): 'ArchQuarterGS',
+            (66666666, 'CapsuleGS',): 'CapsuleGS',
+            (66666666, 'CheeseGS',): 'CheeseGS',
+            (66666666, 'CircleFrustumGS',): 'CircleFrustumGS',
+            (66666666, 'ConeGS',): 'ConeGS',
+            (66666666, 'CubeGS',): 'CubeGS',
+            (66666666, 'CylinderGS',): 'CylinderGS',
+            (66666666, 'CylinderHDGS',): 'CylinderHDGS',
+            (66666666, 'DodecahedronGS',): 'DodecahedronGS',
+            (66666666, 'FrustumGS',): 'FrustumGS',
+            (66666666, 'HemisphereGS',): 'HemisphereGS',
+            (66666666, 'HexagonGS',): 'HexagonGS',
+            (66666666, 'IcosahedronGS',): 'IcosahedronGS',
+            (66666666, 'IrregularCapsule1GS',): 'IrregularCapsule1GS',
+            (66666666, 'IrregularCapsule2GS',): 'IrregularCapsule2GS',
+            (66666666, 'IrregularConeGS',): 'IrregularConeGS',
+            (66666666, 'IrregularCubeGS',): 'IrregularCubeGS',
+            (66666666, 'IrregularCylinderGS',): 'IrregularCylinderGS',
+            (66666666, 'IrregularDodecahedronGS',): 'IrregularDodecahedronGS',
+            (66666666, 'IrregularFlatDropGS 1',): 'IrregularFlatDropGS 1',
+            (66666666, 'IrregularHexagonGS',): 'IrregularHexagonGS',
+            (66666666, 'IrregularIcosahedronGS',): 'IrregularIcosahedronGS',
+            (66666666, 'IrregularOctahedronGS',): 'IrregularOctahedronGS',
+            (66666666, 'IrregularPlaneGS',): 'IrregularPlaneGS',
+            (66666666, 'IrregularPyramid001GS',): 'IrregularPyramid001GS',
+            (66666666, 'IrregularPyramid002GS',): 'IrregularPyramid002GS',
+            (66666666, 'IrregularRectangle001GS',): 'IrregularRectangle001GS',
+            (66666666, 'IrregularRectangle002GS',): 'IrregularRectangle002GS',
+            (66666666, 'IrregularRectangle003GS',): 'IrregularRectangle003GS',
+            (66666666, 'IrregularRectangle004GS',): 'IrregularRectangle004GS',
+            (66666666, 'IrregularRingGS',): 'IrregularRingGS',
+            (66666666, 'IrregularSphere001GS',): 'IrregularSphere001GS',
+            (66666666, 'IrregularSphere002GS',): 'IrregularSphere002GS',
+            (66666666, 'IrregularTeardropGS',): 'IrregularTeardropGS',
+            (66666666, 'IrregularTube001GS',): 'IrregularTube001GS',
+            (66666666, 'IrregularTube002GS',): 'IrregularTube002GS',
+            (66666666, 'OctahedronGS',): 'OctahedronGS',
+            (66666666, 'PeanutGS',): 'PeanutGS',
+            (66666666, 'PentagonGS',): 'PentagonGS',
+            (66666666, 'PlaneGS',): 'PlaneGS',
+            (66666666, 'PlaneOneSidedGS',): 'PlaneOneSidedGS',
+            (66666666, 'PointyGS',): 'PointyGS',
+            (66666666, 'PyramidGS',): 'PyramidGS',
+            (66666666, 'QuadGS',): 'QuadGS',
+            (66666666, 'RingGS',): 'RingGS',
+            (66666666, 'RingHalfGS',): 'RingHalfGS',
+            (66666666, 'Rock1GS',): 'Rock1GS',
+            (66666666, 'Rock2GS',): 'Rock2GS',
+            (66666666, 'Rock3GS',): 'Rock3GS',
+            (66666666, 'SphereGS',): 'SphereGS',
+            (66666666, 'SphereHDGS',): 'SphereHDGS',
+            (66666666, 'TeardropGS',): 'TeardropGS',
+            (66666666, 'TetrahedronGS',): 'TetrahedronGS',
+            (66666666, 'TrapezoidGS',): 'TrapezoidGS',
+            (66666666, 'TubeGS',): 'TubeGS',
+            (66666666, 'WedgeGS',): 'WedgeGS',
+            (66666666, 'Capsule',): 'Capsule',
+            (66666666, 'EmissiveCapsule',): 'EmissiveCapsule',
+            (66666666, 'CapsuleWithCollision',): 'CapsuleWithCollision',
+            (66666666, 'EmissiveCapsuleWithCollision',): 'EmissiveCapsuleWithCollision',
+            (66666666, 'Cone',): 'Cone',
+            (66666666, 'EmissiveCone',): 'EmissiveCone',
+            (66666666, 'ConeWithCollision',): 'ConeWithCollision',
+            (66666666, 'EmissiveConeWithCollision',): 'EmissiveConeWithCollision',
+            (66666666, 'Cube',): 'Cube',
+            (66666666, 'EmissiveCube',): 'EmissiveCube',
+            (66666666, 'CubeWithCollision',): 'CubeWithCollision',
+            (66666666, 'EmissiveCubeWithCollision',): 'EmissiveCubeWithCollision',
+            (66666666, 'Cylinder',): 'Cylinder',
+            (66666666, 'EmissiveCylinder',): 'EmissiveCylinder',
+            (66666666, 'CylinderWithCollision',): 'CylinderWithCollision',
+            (66666666, 'EmissiveCylinderWithCollision',): 'EmissiveCylinderWithCollision',
+            (66666666, 'CylinderTapered',): 'CylinderTapered',
+            (66666666, 'EmissiveCylinderTapered',): 'EmissiveCylinderTapered',
+            (66666666, 'CylinderTaperedWithCollision',): 'CylinderTaperedWithCollision',
+            (66666666, 'EmissiveCylinderTaperedWithCollision',): 'EmissiveCylinderTaperedWithCollision',
+            (66666666, 'Dodecahedron',): 'Dodecahedron',
+            (66666666, 'EmissiveDodecahedron',): 'EmissiveDodecahedron',
+            (66666666, 'DodecahedronWithCollision',): 'DodecahedronWithCollision',
+            (66666666, 'EmissiveDodecahedronWithCollision',): 'EmissiveDodecahedronWithCollision',
+            (66666666, 'FlatDrop',): 'FlatDrop',
+            (66666666, 'EmissiveFlatDrop',): 'EmissiveFlatDrop',
+            (66666666, 'FlatDropWithCollision',): 'FlatDropWithCollision',
+            (66666666, 'EmissiveFlatDropWithCollision',): 'EmissiveFlatDropWithCollision',
+            (66666666, 'Hexagon',): 'Hexagon',
+            (66666666, 'EmissiveHexagon',): 'EmissiveHexagon',
+            (66666666, 'HexagonWithCollision',): 'HexagonWithCollision',
+            (66666666, 'EmissiveHexagonWithCollision',): 'EmissiveHexagonWithCollision',
+            (66666666, 'Icosahedron',): 'Icosahedron',
+            (66666666, 'EmissiveIcosahedron',): 'EmissiveIcosahedron',
+            (66666666, 'IcosahedronWithCollision',): 'IcosahedronWithCollision',
+            (66666666, 'EmissiveIcosahedronWithCollision',): 'EmissiveIcosahedronWithCollision',
+            (66666666, 'IrregularCapsule001',): 'IrregularCapsule001',
+            (66666666, 'EmissiveIrregularCapsule001',): 'EmissiveIrregularCapsule001',
+            (66666666, 'IrregularCapsule001WithCollision',): 'IrregularCapsule001WithCollision',
+            (66666666, 'EmissiveIrregularCapsule001WithCollision',): 'EmissiveIrregularCapsule001WithCollision',
+            (66666666, 'IrregularCapsule002',): 'IrregularCapsule002',
+            (66666666, 'EmissiveIrregularCapsule002',): 'EmissiveIrregularCapsule002',
+            (66666666, 'IrregularCapsule002WithCollision',): 'IrregularCapsule002WithCollision',
+            (66666666, 'EmissiveIrregularCapsule002WithCollision',): 'EmissiveIrregularCapsule002WithCollision',
+            (66666666, 'IrregularFlatDrop',): 'IrregularFlatDrop',
+            (66666666, 'EmissiveIrregularFlatDrop',): 'EmissiveIrregularFlatDrop',
+            (66666666, 'IrregularFlatDropWithCollision',): 'IrregularFlatDropWithCollision',
+            (66666666, 'EmissiveIrregularFlatDropWithCollision',): 'EmissiveIrregularFlatDropWithCollision',
+            (66666666, 'Octahedron',): 'Octahedron',
+            (66666666, 'EmissiveOctahedron',): 'EmissiveOctahedron',
+            (66666666, 'OctahedronWithCollision',): 'OctahedronWithCollision',
+            (66666666, 'EmissiveOctahedronWithCollision',): 'EmissiveOctahedronWithCollision',
+            (66666666, 'Plane',): 'Plane',
+            (66666666, 'EmissivePlane',): 'EmissivePlane',
+            (66666666, 'PlaneWithCollision',): 'PlaneWithCollision',
+            (66666666, 'EmissivePlaneWithCollision',): 'EmissivePlaneWithCollision',
+            (66666666, 'Pyramid',): 'Pyramid',
+            (66666666, 'EmissivePyramid',): 'EmissivePyramid',
+            (66666666, 'PyramidWithCollision',): 'PyramidWithCollision',
+            (66666666, 'EmissivePyramidWithCollision',): 'EmissivePyramidWithCollision',
+            (66666666, 'Ring',): 'Ring',
+            (66666666, 'EmissiveRing',): 'EmissiveRing',
+            (66666666, 'RingWithCollision',): 'RingWithCollision',
+            (66666666, 'EmissiveRingWithCollision',): 'EmissiveRingWithCollision',
+            (66666666, 'RingHalf',): 'RingHalf',
+            (66666666, 'EmissiveRingHalf',): 'EmissiveRingHalf',
+            (66666666, 'RingHalfWithCollision',): 'RingHalfWithCollision',
+            (66666666, 'EmissiveRingHalfWithCollision',): 'EmissiveRingHalfWithCollision',
+            (66666666, 'Sphere',): 'Sphere',
+            (66666666, 'EmissiveSphere',): 'EmissiveSphere',
+            (66666666, 'SphereWithCollision',): 'SphereWithCollision',
+            (66666666, 'EmissiveSphereWithCollision',): 'EmissiveSphereWithCollision',
+            (66666666, 'Teardrop',): 'Teardrop',
+            (66666666, 'EmissiveTeardrop',): 'EmissiveTeardrop',
+            (66666666, 'TeardropWithCollision',): 'TeardropWithCollision',
+            (66666666, 'EmissiveTeardropWithCollision',): 'EmissiveTeardropWithCollision',
+            (66666666, 'TrueCone',): 'TrueCone',
+            (66666666, 'EmissiveTrueCone',): 'EmissiveTrueCone',
+            (66666666, 'TrueConeWithCollision',): 'TrueConeWithCollision',
+            (66666666, 'EmissiveTrueConeWithCollision',): 'EmissiveTrueConeWithCollision',
+            (66666666, 'Tube',): 'Tube',
+            (66666666, 'EmissiveTube',): 'EmissiveTube',
+            (66666666, 'TubeWithCollision',): 'TubeWithCollision',
+            (66666666, 'EmissiveTubeWithCollision',): 'EmissiveTubeWithCollision',
+            (66666666, 'Wedge',): 'Wedge',
+            (66666666, 'EmissiveWedge',): 'EmissiveWedge',
+            (66666666, 'WedgeWithCollision',): 'WedgeWithCollision',
+            (66666666, 'EmissiveWedgeWithCollision',): 'EmissiveWedgeWithCollision',
+        },
+    },
+    'level_subobjects': {
+        'sections': {
+            (66666666, 'Teleporter',): 'distance._impl.level_objects.objects',
+            (66666666, 'WinLogic',): 'distance._impl.level_objects.objects',
+        },
+        'interesting': set(),
+        'classes': {
+            'Teleporter': {
+                'base_container': (66666666, 'Teleporter',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'SubTeleporter',),
+            },
+            'WinLogic': {
+                'base_container': (66666666, 'WinLogic',),
+                'noversion_cls': ('distance._impl.level_objects.objects', 'WinLogic',),
+            },
+        },
+        'key_tags': {
+            (66666666, 'Teleporter',): 'Teleporter',
+            (66666666, 'WinLogic',): 'WinLogic',
+        },
+    },
+    'fragments': {
+        'sections': {
+            (33333333, 1, 0,): 'distance.base',
+            (33333333, 3, 1,): 'distance.levelobjects',
+            (33333333, 3, 2,): 'distance.levelobjects',
+            (22222222, 29, 1,): 'distance._impl.fragments.group',
+            (22222222, 99, 0,): 'distance._impl.fragments.group',
+            (22222222, 87, 1,): 'distance._impl.fragments.levelfragments',
+            (22222222, 131, 3,): 'distance._impl.fragments.levelfragments',
+            (22222222, 62, 1,): 'distance._impl.fragments.levelfragments',
+            (22222222, 62, 2,): 'distance._impl.fragments.levelfragments',
+            (22222222, 62, 3,): 'distance._impl.fragments.levelfragments',
+            (22222222, 62, 4,): 'distance._impl.fragments.levelfragments',
+            (22222222, 63, 1,): 'distance._impl.fragments.levelfragments',
+            (22222222, 81, 0,): 'distance._impl.fragments.levelfragments',
+            (33333333, 14, 1,): 'distance._impl.fragments.levelfragments',
+            (33333333, 15, 2,): 'distance._impl.fragments.levelfragments',
+            (22222222, 69, 1,): 'distance._impl.fragments.levelfragments',
+            (22222222, 75, 1,): 'distance._impl.fragments.levelfragments',
+            (22222222, 160, 0,): 'distance._impl.fragments.levelfragments',
+            (33333333, 7, 1,): 'distance._impl.fragments.levelfragments',
+            (33333333, 7, 2,): 'distance._impl.fragments.levelfragments',
+            (22222222, 22, 2,): 'distance._impl.fragments.levelfragments',
+            (22222222, 74, 2,): 'distance._impl.fragments.levelfragments',
+            (22222222, 154, 7,): 'distance._impl.fragments.levelfragments',
+            (22222222, 154, 10,): 'distance._impl.fragments.levelfragments',
+            (22222222, 154, 11,): 'distance._impl.fragments.levelfragments',
+            (22222222, 138, 1,): 'distance._impl.fragments.levelfragments',
+            (22222222, 138, 2,): 'distance._impl.fragments.levelfragments',
+            (22222222, 137, 2,): 'distance._impl.fragments.levelfragments',
+            (22222222, 67, 1,): 'distance._impl.fragments.levelfragments',
+            (22222222, 67, 2,): 'distance._impl.fragments.levelfragments',
+            (22222222, 23, 1,): 'distance._impl.fragments.levelfragments',
+            (22222222, 93, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 94, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 87, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 74, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 62, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 63, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 67, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 37, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 66, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 57, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 38, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 40, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 69, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 36, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 80, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 89, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 75, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 78, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 58, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 88, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 44, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 27, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 68, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 116, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 61, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 102, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 79, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 130, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 110, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 95, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 103, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 83, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 85, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 111, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 23, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 31, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 101, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 26, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 118, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 126, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 96, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 98, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 77, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 39, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 56, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 41, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 147, 0,): 'distance._impl.fragments.npfragments',
+            (22222222, 127, None,): 'distance._impl.fragments.replay',
+            (22222222, 82, None,): 'distance._impl.fragments.levelsettings',
+            (22222222, 55, None,): 'distance._impl.fragments.leaderboard',
+            (22222222, 151, 0,): 'distance._impl.fragments.levelinfos',
+            (22222222, 106, None,): 'distance._impl.fragments.profileprogress',
+            (22222222, 142, None,): 'distance._impl.fragments.profileprogress',
+            (22222222, 109, 0,): 'distance._impl.fragments.workshoplevelinfos',
+            (22222222, 173, 7,): 'distance._impl.fragments.setabilitiestrigger',
+            (22222222, 110, 18,): 'distance._impl.fragments.warpanchor',
+        },
+        'interesting': {
+            (22222222, 106, None,),
+            (22222222, 109, None,),
+            (22222222, 110, None,),
+            (22222222, 127, None,),
+            (22222222, 137, None,),
+            (22222222, 142, None,),
+            (22222222, 151, None,),
+            (22222222, 160, None,),
+            (22222222, 173, None,),
+            (22222222, 55, None,),
+            (22222222, 62, None,),
+            (22222222, 63, None,),
+            (22222222, 69, None,),
+            (22222222, 74, None,),
+            (22222222, 75, None,),
+            (22222222, 82, None,),
+            (22222222, 87, None,),
+            (22222222, 93, None,),
+            (22222222, 94, None,),
+            (22222222, 99, None,),
+            (33333333, 7, None,),
+        },
+        'classes': {
+            'Object': {
+                'base_container': (33333333, 1, None,),
+                'versions': {
+                    0: ('distance.base', 'ObjectFragment',),
+                },
+            },
+            'Material': {
+                'base_container': (33333333, 3, None,),
+                'versions': {
+                    1: ('distance.levelobjects', 'MaterialFragment',),
+                    2: ('distance.levelobjects', 'MaterialFragment',),
+                },
+            },
+            'Group': {
+                'fields': {
+                    'inspect_children': None,
+                },
+                'base_container': (22222222, 29, None,),
+                'versions': {
+                    1: ('distance._impl.fragments.group', 'GroupFragment',),
+                },
+            },
+            'CustomName': {
+                'fields': {
+                    'custom_name': None,
+                },
+                'base_container': (22222222, 99, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.group', 'CustomNameFragment',),
+                },
+            },
+            'CarScreenTextDecodeTrigger': {
+                'base_container': (22222222, 87, None,),
+                'versions': {
+                    1: ('distance._impl.fragments.levelfragments', 'CarScreenTextDecodeTriggerFragment',),
+                    0: ('distance._impl.fragments.npfragments', 'OldCarScreenTextDecodeTriggerFragment',),
+                },
+                'fields': {
+                    'text': None,
+                    'per_char_speed': None,
+                    'clear_on_finish': None,
+                    'clear_on_trigger_exit': None,
+                    'destroy_on_trigger_exit': None,
+                    'time_text': None,
+                    'static_time_text': None,
+                    'delay': 0,
+                    'announcer_action': None,
+                },
+            },
+            'GoldenSimples': {
+                'fields': {
+                    'image_index': 17,
+                    'emit_index': 17,
+                    'preset': 0,
+                    'tex_scale': (1, 1, 1,),
+                    'tex_offset': (0, 0, 0,),
+                    'flip_tex_uv': 0,
+                    'world_mapped': 0,
+                    'disable_diffuse': 0,
+                    'disable_bump': 0,
+                    'bump_strength': 0,
+                    'disable_reflect': 0,
+                    'disable_collision': 0,
+                    'additive_transp': 0,
+                    'multip_transp': 0,
+                    'invert_emit': 0,
+                },
+                'base_container': (22222222, 131, None,),
+                'versions': {
+                    3: ('distance._impl.fragments.levelfragments', 'GoldenSimplesFragment',),
+                },
+            },
+            'TeleporterEntrance': {
+                'base_container': (22222222, 62, None,),
+                'versions': {
+                    1: ('distance._impl.fragments.levelfragments', 'TeleporterEntranceFragment',),
+                    2: ('distance._impl.fragments.levelfragments', 'TeleporterEntranceFragment',),
+                    3: ('distance._impl.fragments.levelfragments', 'TeleporterEntranceFragment',),
+                    4: ('distance._impl.fragments.levelfragments', 'TeleporterEntranceFragment',),
+                    0: ('distance._impl.fragments.npfragments', 'OldTeleporterEntranceFragment',),
+                },
+                'fields': {
+                    'destination': 0,
+                    'rem': None,
+                },
+            },
+            'TeleporterExit': {
+                'base_container': (22222222, 63, None,),
+                'versions': {
+                    1: ('distance._impl.fragments.levelfragments', 'TeleporterExitFragment',),
+                    0: ('distance._impl.fragments.npfragments', 'OldTeleporterExitFragment',),
+                },
+                'fields': {
+                    'link_id': 0,
+                },
+            },
+            'TeleporterExitCheckpoint': {
+                'fields': {
+                    'trigger_checkpoint': 1,
+                },
+                'base_container': (22222222, 81, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.levelfragments', 'TeleporterExitCheckpointFragment',),
+                },
+            },
+            'SphereCollider': {
+                'fields': {
+                    'trigger_center': None,
+                    'trigger_radius': None,
+                },
+                'base_container': (33333333, 14, None,),
+                'versions': {
+                    1: ('distance._impl.fragments.levelfragments', 'SphereColliderFragment',),
+                },
+            },
+            'BoxCollider': {
+                'fields': {
+                    'trigger_center': None,
+                    'trigger_size': None,
+                },
+                'base_container': (33333333, 15, None,),
+                'versions': {
+                    2: ('distance._impl.fragments.levelfragments', 'BoxColliderFragment',),
+                },
+            },
+            'GravityToggle': {
+                'fields': {
+                    'disable_gravity': 1,
+                    'drag_scale': 1.0,
+                    'drag_scale_angular': 1.0,
+                },
+                'base_container': (22222222, 69, None,),
+                'versions': {
+                    1: ('distance._impl.fragments.levelfragments', 'GravityToggleFragment',),
+                },
+            },
+            'MusicTrigger': {
+                'fields': {
+                    'music_id': 19,
+                    'one_time_trigger': 1,
+                    'reset_before_trigger': 0,
+                    'disable_music_trigger': 0,
+                },
+                'base_container': (22222222, 75, None,),
+                'versions': {
+                    1: ('distance._impl.fragments.levelfragments', 'MusicTriggerFragment',),
+                },
+            },
+            'ForceZone': {
+                'fields': {
+                    'force_direction': (0.0, 0.0, 1.0,),
+                    'global_force': 0,
+                    'force_type': 0,
+                    'gravity_magnitude': 25.0,
+                    'disable_global_gravity': 0,
+                    'wind_speed': 300.0,
+                    'drag_multiplier': 1.0,
+                },
+                'base_container': (22222222, 160, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.levelfragments', 'ForceZoneFragment',),
+                },
+            },
+            'TextMesh': {
+                'fields': {
+                    'text': None,
+                    'font_style': None,
+                    'font': None,
+                    'rem': b'',
+                },
+                'base_container': (33333333, 7, None,),
+                'versions': {
+                    1: ('distance._impl.fragments.levelfragments', 'TextMeshFragment',),
+                    2: ('distance._impl.fragments.levelfragments', 'TextMeshFragment',),
+                },
+            },
+            'TrackNode': {
+                'fields': {
+                    'parent_id': 0,
+                    'snap_id': 0,
+                    'conn_id': 0,
+                    'primary': 0,
+                },
+                'base_container': (22222222, 22, None,),
+                'versions': {
+                    2: ('distance._impl.fragments.levelfragments', 'TrackNodeFragment',),
+                },
+            },
+            'InfoDisplayLogic': {
+                'base_container': (22222222, 74, None,),
+                'versions': {
+                    2: ('distance._impl.fragments.levelfragments', 'InfoDisplayLogicFragment',),
+                    0: ('distance._impl.fragments.npfragments', 'OldInfoDisplayLogicFragment',),
+                },
+                'fields': {
+                    'fadeout_time': None,
+                    'entries': None,
+                    'random_char_count': 1,
+                    'per_char_speed': None,
+                    'destroy_on_trigger_exit': None,
+                    'display_in_arcade': 0,
+                    'texts': (),
+                    'clear_on_trigger_exit': None,
+                },
+            },
+            'Animator': {
+                'fields': {
+                    'motion_mode': 2,
+                    'do_scale': 0,
+                    'scale_exponents': (0, 1, 0,),
+                    'do_rotate': 1,
+                    'rotate_axis': (0, 1, 0,),
+                    'rotate_global': 0,
+                    'rotate_magnitude': 90,
+                    'centerpoint': (0, 0, 0,),
+                    'translate_type': 0,
+                    'translate_vector': (0, 10, 0,),
+                    'follow_track_distance': 25,
+                    'double_pivot_distance': 0.0,
+                    'follow_percent_of_track': 1,
+                    'wrap_around': 1,
+                    'projectile_gravity': (0, -25, 0,),
+                    'delay': 1,
+                    'duration': 1,
+                    'time_offset': 0,
+                    'do_loop': 1,
+                    'extrapolation_type': 1,
+                    'do_extend': 0,
+                    'curve_type': 3,
+                    'editor_anim_time': 0,
+                    'use_custom_pong_values': 0,
+                    'pong_delay': 1,
+                    'pong_duration': 1,
+                    'pong_curve_type': 2,
+                    'anim_physics': 1,
+                    'always_animate': 0,
+                    'default_action': 1,
+                    'trigger_on_action': 1,
+                    'trigger_wait_for_anim_finish': 0,
+                    'trigger_on_reset': 0,
+                    'trigger_off_action': 2,
+                    'trigger_off_wait_for_anim_finish': 0,
+                    'trigger_off_reset': 0,
+                },
+                'base_container': (22222222, 154, None,),
+                'versions': {
+                    7: ('distance._impl.fragments.levelfragments', 'AnimatorFragment',),
+                    10: ('distance._impl.fragments.levelfragments', 'AnimatorFragment',),
+                    11: ('distance._impl.fragments.levelfragments', 'AnimatorFragment',),
+                },
+            },
+            'EventListener': {
+                'fields': {
+                    'event_name': 'Event 0',
+                    'delay': None,
+                },
+                'base_container': (22222222, 138, None,),
+                'versions': {
+                    1: ('distance._impl.fragments.levelfragments', 'EventListenerFragment',),
+                    2: ('distance._impl.fragments.levelfragments', 'EventListenerFragment',),
+                },
+            },
+            'EventTrigger': {
+                'fields': {
+                    'event_name': 'Event 0',
+                    'one_shot': 0,
+                },
+                'base_container': (22222222, 137, None,),
+                'versions': {
+                    2: ('distance._impl.fragments.levelfragments', 'EventTriggerFragment',),
+                },
+            },
+            'InterpolateToPositionOnTrigger': {
+                'base_container': (22222222, 67, None,),
+                'versions': {
+                    1: ('distance._impl.fragments.levelfragments', 'InterpolateToPositionOnTriggerFragment',),
+                    2: ('distance._impl.fragments.levelfragments', 'InterpolateToPositionOnTriggerFragment',),
+                    0: ('distance._impl.fragments.npfragments', 'OldInterpolateToPositionOnTriggerFragment',),
+                },
+                'fields': {
+                    'actually_interpolate': None,
+                    'relative': 1,
+                    'interp_end_pos': None,
+                    'interp_time': None,
+                    'local_movement': 0,
+                },
+            },
+            'RigidbodyAxisRotationLogic': {
+                'fields': {
+                    'angular_speed': None,
+                    'rotation_axis': None,
+                    'limit_rotation': None,
+                    'rotation_bounds': None,
+                    'starting_angle_offset': None,
+                },
+                'base_container': (22222222, 23, None,),
+                'versions': {
+                    1: ('distance._impl.fragments.levelfragments', 'RigidbodyAxisRotationLogicFragment',),
+                },
+            },
+            'RaceEndLogic': {
+                'fields': {
+                    'delay_before_broadcast': 0.0,
+                },
+                'base_container': (22222222, 93, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.npfragments', 'RaceEndLogicFragment',),
+                },
+            },
+            'EnableAbilitiesTrigger': {
+                'fields': {
+                    'enable_boosting': 0,
+                    'enable_jumping': 0,
+                    'enable_jets': 0,
+                    'enable_flying': 0,
+                    'bloom_out': 1,
+                    'abilities': None,
+                },
+                'base_container': (22222222, 94, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.npfragments', 'EnableAbilitiesTriggerFragment',),
+                },
+            },
+            'PopupBlockerLogic': {
+                'fields': {
+                },
+                'base_container': (22222222, 37, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.npfragments', 'PopupBlockerLogicFragment',),
+                },
+            },
+            'ObjectSpawnCircle': {
+                'fields': {
+                },
+                'base_container': (22222222, 66, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.npfragments', 'ObjectSpawnCircleFragment',),
+                },
+            },
+            'ParticleEmitLogic': {
+                'fields': {
+                },
+                'base_container': (22222222, 57, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.npfragments', 'ParticleEmitLogicFragment',),
+                },
+            },
+            'Light': {
+                'fields': {
+                },
+                'base_container': (22222222, 38, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.npfragments', 'LightFragment',),
+                },
+            },
+            'SmoothRandomPosition': {
+                'fields': {
+                },
+                'base_container': (22222222, 40, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.npfragments', 'SmoothRandomPositionFragment',),
+                },
+            },
+            'OldFlyingRingLogic': {
+                'fields': {
+                },
+                'base_container': (22222222, 36, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.npfragments', 'OldFlyingRingLogicFragment',),
+                },
+            },
+            'Pulse': {
+                'fields': {
+                },
+                'base_container': (22222222, 80, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.npfragments', 'PulseFragment',),
+                },
+            },
+            'CarVoiceTrigger': {
+                'fields': {
+                },
+                'base_container': (22222222, 147, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.npfragments', 'CarVoiceTriggerFragment',),
+                },
+            },
+            'Replay': {
+                'fields': {
+                    'version': None,
+                    'player_name': None,
+                    'player_id': None,
+                    'player_name_2': None,
+                    'finish_time_v3': None,
+                    'replay_duration': None,
+                    'unk_0': None,
+                    'car_name': None,
+                    'car_color_primary': None,
+                    'car_color_secondary': None,
+                    'car_color_glow': None,
+                    'car_color_sparkle': None,
+                    'unk_1_size': None,
+                    'unk_1': None,
+                    'unk_2_size': None,
+                    'unk_2': None,
+                    'finish_time_v1': None,
+                    'rem': None,
+                    'finish_time': None,
+                },
+                'base_container': (22222222, 127, None,),
+                'noversion_cls': ('distance._impl.fragments.replay', 'ReplayFragment',),
+            },
+            'LevelSettings': {
+                'fields': {
+                    'version': None,
+                    'unk_0': None,
+                    'name': None,
+                    'description': None,
+                    'author_name': None,
+                    'unk_1': None,
+                    'modes_list': None,
+                    'music_id': None,
+                    'skybox_name': None,
+                    'unk_2': None,
+                    'background_layer': None,
+                    'unk_3': None,
+                    'medals': None,
+                    'abilities': None,
+                    'difficulty': None,
+                    'unk_4': None,
+                    'modes': (),
+                    'medal_times': None,
+                    'medal_scores': None,
+                },
+                'base_container': (22222222, 82, None,),
+                'noversion_cls': ('distance._impl.fragments.levelsettings', 'LevelSettingsFragment',),
+            },
+            'Leaderboard': {
+                'fields': {
+                    'version': None,
+                    'num_entries': None,
+                    'unk_1': None,
+                    'unk_2': None,
+                    'entries': (),
+                },
+                'base_container': (22222222, 55, None,),
+                'noversion_cls': ('distance._impl.fragments.leaderboard', 'LeaderboardFragment',),
+            },
+            'LevelInfos': {
+                'fields': {
+                    'version': None,
+                    'num_entries': None,
+                    'entry_version': None,
+                    'levels': (),
+                },
+                'base_container': (22222222, 151, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.levelinfos', 'LevelInfosFragment',),
+                },
+            },
+            'ProfileProgress': {
+                'fields': {
+                    'version': None,
+                    'num_levels': None,
+                    'unk_0': None,
+                    'levels': (),
+                    'officials': (),
+                    'unk_1': None,
+                    'unk_2': None,
+                    'tricks': (),
+                    'unlocked_adventures': (),
+                    'unk_3': None,
+                    'somelevels': (),
+                    'unk_4': None,
+                },
+                'base_container': (22222222, 106, None,),
+                'noversion_cls': ('distance._impl.fragments.profileprogress', 'ProfileProgressFragment',),
+            },
+            'ProfileStats': {
+                'fields': {
+                    'version': None,
+                    'unk_0': None,
+                    'deaths': None,
+                    'laser_deaths': None,
+                    'reset_deaths': None,
+                    'impact_deaths': None,
+                    'overheat_deaths': None,
+                    'killgrid_deaths': None,
+                    'gibs_seconds': None,
+                    'driven_meters': None,
+                    'forward_meters': None,
+                    'reverse_meters': None,
+                    'air_fly_meters': None,
+                    'air_nofly_meters': None,
+                    'wallride_meters': None,
+                    'ceilingride_meters': None,
+                    'grinding_meters': None,
+                    'boost_seconds': None,
+                    'grip_seconds': None,
+                    'splits': None,
+                    'impacts': None,
+                    'checkpoints': None,
+                    'jumps': None,
+                    'wings': None,
+                    'wings_closes': None,
+                    'horns': None,
+                    'tricks': None,
+                    'ev': None,
+                    'lamps': None,
+                    'pumpkins': None,
+                    'eggs': None,
+                    'top_speed_total': None,
+                    'top_speed_forward': None,
+                    'top_speed_back': None,
+                    'cooldowns': None,
+                    'total_seconds': None,
+                    'editor_working_seconds': None,
+                    'editor_playing_seconds': None,
+                    'offline_times': (),
+                    'modes_unknown': (),
+                    'online_times': (),
+                    'unk_6': None,
+                    'trackmogrify_mods': (),
+                },
+                'base_container': (22222222, 142, None,),
+                'noversion_cls': ('distance._impl.fragments.profileprogress', 'ProfileStatsFragment',),
+            },
+            'WorkshopLevelInfos': {
+                'fields': {
+                    'num_entries': None,
+                    'unk_0': None,
+                    'levels': (),
+                },
+                'base_container': (22222222, 109, None,),
+                'versions': {
+                    0: ('distance._impl.fragments.workshoplevelinfos', 'WorkshopLevelInfosFragment',),
+                },
+            },
+            'VirusSpiritSpawner': {
+                'base_container': (22222222, 58, None,),
+            },
+            'WingCorruptionZone': {
+                'base_container': (22222222, 83, None,),
+            },
+            'CheckpointLogic': {
+                'base_container': (22222222, 25, None,),
+            },
+            'SphericalGravity': {
+                'base_container': (22222222, 95, None,),
+            },
+            'TrackAttachment': {
+                'base_container': (22222222, 104, None,),
+            },
+            'TurnLightOnNearCar': {
+                'base_container': (22222222, 112, None,),
+            },
+            'SetAbilitiesTrigger': {
+                'fields': {
+                    'enable_flying': 1,
+                    'enable_jumping': 1,
+                    'enable_boosting': 1,
+                    'enable_jet_rotating': 1,
+                    'infinite_cooldown': 0,
+                    'delay': 0.0,
+                    'show_ability_alert': 1,
+                    'bloom_out': 0,
+                    'play_sound': 1,
+                    'show_car_screen_image': 1,
+                    'timer_text': 'downloading',
+                    'ignore_in_arcade': 0,
+                    'use_slow_mo': 0,
+                    'delay_before_slow_mo': 0.0,
+                    'slow_mo_time_scale': 0.25,
+                    'slow_mo_duration': 2.0,
+                    'glitch_duration_after': 0.66,
+                    'play_slow_mo_audio': 1,
+                    'visuals_only': 0,
+                },
+                'base_container': (22222222, 173, None,),
+                'versions': {
+                    7: ('distance._impl.fragments.setabilitiestrigger', 'SetAbilitiesTriggerFragment',),
+                },
+            },
+            'WarpAnchor': {
+                'fields': {
+                    'trigger_type': 0,
+                    'my_id': 0,
+                    'other_id': 0,
+                    'is_primary': 1,
+                    'snap_to_exit': 0,
+                    'one_time_use': 1,
+                    'ignore_in_arcade': 0,
+                    'ignore_in_adventure': 0,
+                    'type_of_warp': 0,
+                    'time_before_returning': 0.01,
+                    'time_scale': 1.0,
+                    'new_anchor_after_warp': -1,
+                    'enable_delay': 0,
+                    'delay_time': 0.0,
+                    'delay_time_scale': 1.0,
+                    'glitch_during_delay': 0,
+                    'shake_during_delay': 0,
+                    'shake_during_delay_strength': 0.75,
+                    'connect_to_archaic': 0,
+                    'archaic_id': -1,
+                    'action_index_before': -1,
+                    'action_index_during': -1,
+                    'action_index_after': -1,
+                    'archaic_tractor_beam': 0,
+                    'archaic_tractor_beam_time': 3.944,
+                    'transition_effect': 0,
+                    'enable_corruption_effect': 1,
+                    'corruption_effect_color': (0.0, 0.0, 0.0, 1.0,),
+                    'add_noise': 1,
+                    'bloom_out': 1,
+                    'vhs_during': 0,
+                    'shake_before_delay': 0,
+                    'shake_before': 0,
+                    'shake_after': 0,
+                    'shake_strength': 0.75,
+                    'glitch_during': 1,
+                    'glitch_intensity': 1.1,
+                    'glitch_filter_colors': 1,
+                    'glitch_up': 1,
+                    'glitch_down': 1,
+                    'glitch_displace': 1,
+                    'glitch_scale': 1,
+                    'enable_emp_after_warp': 0,
+                    'emp_radius': 1000.0,
+                    'delay_before_turning_on_after_emp': 3.0,
+                    'emp_section_randomness': -1,
+                    'audio_high_pass_during': 1,
+                    'audio_low_pass_after': 1,
+                    'audio_event_before': '',
+                    'audio_event_during': '',
+                    'audio_event_after': '',
+                    'archaic_audio': '',
+                    'car_timer_state_before': 0,
+                    'car_timer_state_during': 1,
+                    'car_timer_state_after': 0,
+                    'show_countdown_and_gps_after': 0,
+                    'snap_countdown_to_time': -1.0,
+                    'set_countdown_time_scale': 0,
+                    'countdown_time_scale': 1.0,
+                    'disable_countdown': 0,
+                    'unk_0': 0,
+                },
+                'base_container': (22222222, 110, None,),
+                'versions': {
+                    18: ('distance._impl.fragments.warpanchor', 'WarpAnchorFragment',),
+                },
+            },
+        },
+        'key_tags': {
+            (33333333, 1, None,): 'Object',
+            (33333333, 3, None,): 'Material',
+            (22222222, 29, None,): 'Group',
+            (22222222, 99, None,): 'CustomName',
+            (22222222, 87, None,): 'CarScreenTextDecodeTrigger',
+            (22222222, 131, None,): 'GoldenSimples',
+            (22222222, 62, None,): 'TeleporterEntrance',
+            (22222222, 63, None,): 'TeleporterExit',
+            (22222222, 81, None,): 'TeleporterExitCheckpoint',
+            (33333333, 14, None,): 'SphereCollider',
+            (33333333, 15, None,): 'BoxCollider',
+            (22222222, 69, None,): 'GravityToggle',
+            (22222222, 75, None,): 'MusicTrigger',
+            (22222222, 160, None,): 'ForceZone',
+            (33333333, 7, None,): 'TextMesh',
+            (22222222, 22, None,): 'TrackNode',
+            (22222222, 74, None,): 'InfoDisplayLogic',
+            (22222222, 154, None,): 'Animator',
+            (22222222, 138, None,): 'EventListener',
+            (22222222, 137, None,): 'EventTrigger',
+            (22222222, 67, None,): 'InterpolateToPositionOnTrigger',
+            (22222222, 23, None,): 'RigidbodyAxisRotationLogic',
+            (22222222, 93, None,): 'RaceEndLogic',
+            (22222222, 94, None,): 'EnableAbilitiesTrigger',
+            (22222222, 37, None,): 'PopupBlockerLogic',
+            (22222222, 66, None,): 'ObjectSpawnCircle',
+            (22222222, 57, None,): 'ParticleEmitLogic',
+            (22222222, 38, None,): 'Light',
+            (22222222, 40, None,): 'SmoothRandomPosition',
+            (22222222, 36, None,): 'OldFlyingRingLogic',
+            (22222222, 80, None,): 'Pulse',
+            (22222222, 147, None,): 'CarVoiceTrigger',
+            (22222222, 127, None,): 'Replay',
+            (22222222, 82, None,): 'LevelSettings',
+            (22222222, 55, None,): 'Leaderboard',
+            (22222222, 151, None,): 'LevelInfos',
+            (22222222, 106, None,): 'ProfileProgress',
+            (22222222, 142, None,): 'ProfileStats',
+            (22222222, 109, None,): 'WorkshopLevelInfos',
+            (22222222, 58, None,): 'VirusSpiritSpawner',
+            (22222222, 83, None,): 'WingCorruptionZone',
+            (22222222, 25, None,): 'CheckpointLogic',
+            (22222222, 95, None,): 'SphericalGravity',
+            (22222222, 104, None,): 'TrackAttachment',
+            (22222222, 112, None,): 'TurnLightOnNearCar',
+            (22222222, 173, None,): 'SetAbilitiesTrigger',
+            (22222222, 110, None,): 'WarpAnchor',
+        },
+    },
+    'base_objects': {
+        'sections': {
+        },
+        'interesting': set(),
+        'classes': {
+        },
+        'key_tags': {
+        },
+    },
+    'level': {
+        'sections': {
+            99999999: 'distance._level',
+        },
+        'interesting': set(),
+        'classes': {
+            'Level': {
+                'base_container': 99999999,
+                'noversion_cls': ('distance._level', 'Level',),
+            },
+        },
+        'key_tags': {
+            99999999: 'Level',
+        },
+    },
+    'level_content': {
+        'sections': {
+            77777777: 'distance._impl.level_content.layer',
+            (66666666, 'LevelSettings',): 'distance._impl.level_content.newlevelsettings',
+            88888888: 'distance._impl.level_content.oldlevelsettings',
+        },
+        'interesting': set(),
+        'classes': {
+            'Layer': {
+                'base_container': 77777777,
+                'noversion_cls': ('distance._impl.level_content.layer', 'Layer',),
+            },
+            'LevelSettings': {
+                'base_container': (66666666, 'LevelSettings',),
+                'noversion_cls': ('distance._impl.level_content.newlevelsettings', 'NewLevelSettings',),
+            },
+            'OldLevelSettings': {
+                'fields': {
+                    'unk_0': None,
+                    'skybox_name': None,
+                    'unk_1': None,
+                    'name': None,
+                    'unk_2': None,
+                },
+                'base_container': 88888888,
+                'noversion_cls': ('distance._impl.level_content.oldlevelsettings', 'OldLevelSettings',),
+            },
+        },
+        'key_tags': {
+            77777777: 'Layer',
+            (66666666, 'LevelSettings',): 'LevelSettings',
+            88888888: 'OldLevelSettings',
+        },
+    },
+    'non_level_objects': {
+        'sections': {
+            (66666666, 'LocalLeaderboard',): 'distance._nonlevel',
+            (66666666, 'LevelInfos',): 'distance._nonlevel',
+            (66666666, 'ProfileProgress',): 'distance._nonlevel',
+            (66666666, 'WorkshopLevelInfos',): 'distance._nonlevel',
+        },
+        'interesting': set(),
+        'classes': {
+            'LocalLeaderboard': {
+                'base_container': (66666666, 'LocalLeaderboard',),
+                'noversion_cls': ('distance._nonlevel', 'Leaderboard',),
+            },
+            'LevelInfos': {
+                'base_container': (66666666, 'LevelInfos',),
+                'noversion_cls': ('distance._nonlevel', 'LevelInfos',),
+            },
+            'ProfileProgress': {
+                'base_container': (66666666, 'ProfileProgress',),
+                'noversion_cls': ('distance._nonlevel', 'ProfileProgress',),
+            },
+            'WorkshopLevelInfos': {
+                'base_container': (66666666, 'WorkshopLevelInfos',),
+                'noversion_cls': ('distance._nonlevel', 'WorkshopLevelInfos',),
+            },
+        },
+        'key_tags': {
+            (66666666, 'LocalLeaderboard',): 'LocalLeaderboard',
+            (66666666, 'LevelInfos',): 'LevelInfos',
+            (66666666, 'ProfileProgress',): 'ProfileProgress',
+            (66666666, 'WorkshopLevelInfos',): 'WorkshopLevelInfos',
+        },
+    },
+    'blacklist_non_level_objects': {
+        'sections': {
+        },
+        'interesting': set(),
+        'classes': {
+        },
+        'key_tags': {
+        },
+    },
+    'fallback_levelobject': {
+        'sections': {
+        },
+        'interesting': set(),
+        'classes': {
+        },
+        'key_tags': {
+        },
+    },
+}
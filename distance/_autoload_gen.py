@@ -57,7 +57,8 @@ def _generate_source(content, indent):
             yield "set()"
         else:
             yield "{\n"
-            for v in content:
+            # sorted for reproducible output regardless of hash seed
+            for v in sorted(content, key=repr):
                 yield "    " * (indent + 1)
                 yield from _generate_source(v, indent + 1)
                 yield ",\n"
@@ -3,7 +3,7 @@
 
 from collections import OrderedDict
 
-from .bytes import Magic, S_FLOAT4
+from .bytes import Magic, S_FLOAT4, S_ULONG, NAME_TABLE, encode_str
 from .printing import format_bytes
 
 
@@ -20,7 +20,7 @@ class NamedPropertyList(OrderedDict):
             detect_old = False
 
     def _read_property(self, dbytes, detect_old, max_pos):
-        propname = dbytes.read_str()
+        propname = dbytes.read_str(NAME_TABLE)
         if detect_old:
             propend, self.old_format = self._detect_old(dbytes, max_pos)
         else:
@@ -58,14 +58,14 @@ class NamedPropertyList(OrderedDict):
             self._write_property(dbytes, propname, value)
 
     def _write_property(self, dbytes, propname, value):
-        dbytes.write_str(propname)
+        name = encode_str(propname)
         if not self.old_format:
-            dbytes.write_ulong(dbytes.tell() + len(value) + 8)
-            dbytes.write_bytes(value)
+            end = dbytes.tell() + len(name) + 8 + len(value)
+            dbytes.write_bytes(b''.join((name, S_ULONG.pack(end), value)))
         else:
             # Assume value is of correct length. Usually
             # only 4b values are found.
-            dbytes.write_bytes(value)
+            dbytes.write_bytes(name + value)
 
     def print(self, p):
         p(f"Properties: {len(self)}")
@@ -86,7 +86,7 @@ class ColorSet(OrderedDict):
             self[colname] = colors
 
     def read_color(self, dbytes):
-        colname = dbytes.read_str()
+        colname = dbytes.read_str(NAME_TABLE)
         colors = dbytes.read_struct(S_FLOAT4)
         return colname, colors
 
@@ -97,8 +97,7 @@ class ColorSet(OrderedDict):
             self.write_color(dbytes, colname, color)
 
     def write_color(self, dbytes, colname, color):
-        dbytes.write_str(colname)
-        dbytes.write_bytes(S_FLOAT4.pack(*color))
+        dbytes.write_bytes(encode_str(colname) + S_FLOAT4.pack(*color))
 
     def print(self, p):
         p(f"Colors: {len(self)}")
@@ -128,7 +127,7 @@ class MaterialSet(OrderedDict):
             self[matname] = colors
 
     def read_material(self, dbytes):
-        matname = dbytes.read_str()
+        matname = dbytes.read_str(NAME_TABLE)
         colors = ColorSet()
         colors.read(dbytes)
         return matname, colors
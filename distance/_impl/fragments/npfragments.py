@@ -4,6 +4,7 @@ from distance.bytes import (
     DstBytes, Section, Magic,
     SKIP_BYTES,
     S_BYTE, S_FLOAT, S_UINT, S_FLOAT3,
+    decode_str, encode_str,
 )
 from distance.base import Fragment
 from distance._data import NamedPropertyList
@@ -15,6 +16,19 @@ from . import bases
 Classes = CollectorGroup()
 
 
+def _decode_prop(prop, obj, data):
+    # Decode and cache the value of a named property. Values are cached per
+    # instance and property together with the bytes they were decoded from.
+    # Cached values are only used if the bytes of `obj.props` are the same
+    # object, so the cache stays valid if `obj.props` is modified directly.
+    if not data or data == SKIP_BYTES:
+        value = prop.default
+    else:
+        value = prop._decode_value(obj, data)
+    obj._prop_values[prop] = data, value
+    return value
+
+
 class named_property_getter(property):
 
     """Decorate properties to create a getter for a named property."""
@@ -23,11 +37,11 @@ class named_property_getter(property):
         self.propname = propname
         self.default = default
         def fget(obj):
-            data = self.props.get(self.propname, None)
-            if not data or data == SKIP_BYTES:
-                return self.default
-            db = DstBytes.from_data(data)
-            return self.func(obj, db)
+            data = obj.props.get(propname, None)
+            entry = obj._prop_values.get(self, None)
+            if entry is not None and entry[0] is data:
+                return entry[1]
+            return _decode_prop(self, obj, data)
         property.__init__(self, fget)
 
     def __call__(self, func):
@@ -35,6 +49,9 @@ class named_property_getter(property):
         self.__doc__ = func.__doc__
         return self
 
+    def _decode_value(self, obj, data):
+        return self.func(obj, DstBytes.from_data(data))
+
 
 class BaseNamedProperty(property):
 
@@ -51,15 +68,21 @@ class BaseNamedProperty(property):
         self.default = default
         def fget(obj, objtype=None):
             data = obj.props.get(propname, None)
-            if not data or data == SKIP_BYTES:
-                return default
-            return self._from_bytes(data)
+            entry = obj._prop_values.get(self, None)
+            if entry is not None and entry[0] is data:
+                return entry[1]
+            return _decode_prop(self, obj, data)
         def fset(obj, value):
             obj.props[propname] = self._to_bytes(value)
+            obj._prop_values.pop(self, None)
         def fdel(obj):
             del obj.props[propname]
+            obj._prop_values.pop(self, None)
         super().__init__(fget, fset, fdel, doc=doc)
 
+    def _decode_value(self, obj, data):
+        return self._from_bytes(data)
+
 
 class TupleStructNamedProperty(BaseNamedProperty):
 
@@ -101,12 +124,10 @@ class StringNamedProperty(BaseNamedProperty):
         self.__doc__ = f"Named property {propname!r} of type string"
 
     def _from_bytes(self, data):
-        return DstBytes.from_data(data).read_str()
+        return decode_str(data, 0)[0]
 
-    def _to_bytes(self, inst, value):
-        db = DstBytes.in_memory()
-        db.write_str(value)
-        return db.file.getvalue()
+    def _to_bytes(self, value):
+        return encode_str(value)
 
 
 @Classes.common.add_info(tag='NamedPropertiesFragment')
@@ -132,10 +153,59 @@ class NamedPropertiesFragment(Fragment):
             return None
         return tag
 
+    @classmethod
+    def _named_properties(cls):
+        # Map attribute names to the named properties of this class.
+        try:
+            return cls.__dict__['_named_properties_']
+        except KeyError:
+            pass
+        result = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in klass.__dict__.items():
+                if isinstance(value, (BaseNamedProperty, named_property_getter)):
+                    result[name] = value
+                else:
+                    result.pop(name, None)
+        cls._named_properties_ = result
+        return result
+
     def __init__(self, *args, **kw):
         self.props = NamedPropertyList()
+        self._prop_values = {}
         Fragment.__init__(self, *args, **kw)
 
+    def decode_props(self):
+
+        """Decode all named properties defined by this fragment's class.
+
+        Decoded values are cached like for attribute access.
+
+        Returns
+        -------
+        values : dict
+            Maps the attribute names of the named properties to their values.
+            Properties missing from `props` have their default value.
+
+        """
+
+        props = self.props
+        cache = self._prop_values
+        result = {}
+        for name, prop in self._named_properties().items():
+            data = props.get(prop.propname, None)
+            entry = cache.get(prop, None)
+            if entry is not None and entry[0] is data:
+                value = entry[1]
+            else:
+                if not data or data == SKIP_BYTES:
+                    value = prop.default
+                else:
+                    value = prop._decode_value(self, data)
+                cache[prop] = data, value
+            result[name] = value
+        return result
+
     def _clone_data(self, new):
         new.props.update(self.props)
 
@@ -262,7 +332,7 @@ class OldInfoDisplayLogicFragment(bases.BaseInfoDisplayLogic, NamedPropertiesFra
             propname = 'InfoText' + str(i)
             data = props.get(propname, None)
             if data and data != SKIP_BYTES:
-                texts[i] = DstBytes.from_data(data).read_str()
+                texts[i] = decode_str(data, 0)[0]
         return texts
 
     fadeout_time = StructNamedProperty('FadeOutTime', S_FLOAT)
@@ -2,6 +2,7 @@
 
 from distance.bytes import Magic, Section
 from distance.base import Fragment
+from distance.lazy import iter_inflated
 from distance.constants import LAYER_FLAG_NAMES
 from distance.printing import need_counters, print_objects
 from distance.classes import CollectorGroup
@@ -57,6 +58,17 @@ class Layer(Fragment):
         self.objects = self.classes.level_objects.lazy_n_maybe(
             dbytes, sec.count, start_pos=obj_start)
 
+    def _get_read_state(self):
+        con = self.container
+        return (con, con.to_key(), getattr(con, 'name', None),
+                self.layer_flags, self.has_layer_flags, self.flags_version,
+                self.unknown_flag, self.objects)
+
+    def _is_modified(self):
+        if super()._is_modified():
+            return True
+        return any(obj._is_modified() for obj in iter_inflated(self.objects))
+
     def _write_section_data(self, dbytes, sec):
         if sec.magic != Magic[7]:
             raise ValueError(f"Invalid layer section: {sec.magic}")
@@ -2,13 +2,18 @@
 
 from distance.levelobjects import LevelObject
 from distance.classes import CollectorGroup, DefaultClasses
-from distance.base import Transform
+from distance.base import Transform, _qmul, _qdiv, _qrotate
 from distance.printing import need_counters, print_objects
 
 
 Classes = CollectorGroup()
 
 
+# Groups with at least this many children are transformed using vectorized
+# operations of distance.transform.
+BATCH_MIN_CHILDREN = 32
+
+
 @Classes.level_objects.object
 @Classes.common.object
 @DefaultClasses.fragments.fragment_attrs('Group', 'CustomName')
@@ -32,50 +37,56 @@ class Group(LevelObject):
                 counters.print(p)
 
     def recenter(self, center):
-        import numpy as np, quaternion
-        from distance.transform import rotpointrev
-        quaternion # suppress warning
-
         pos, rot, scale = self.transform
         self.transform = self.transform.set(pos=center)
 
         diff = tuple(c - o for c, o in zip(pos, center))
-        qrot = np.quaternion(rot[3], *rot[:3])
-        diff = rotpointrev(qrot, diff)
-
-        for obj in self.children:
-            pos = obj.transform.pos + diff
+        diff = _qrotate((-rot[0], -rot[1], -rot[2], rot[3]), diff)
+
+        children = self.children
+        if len(children) >= BATCH_MIN_CHILDREN:
+            from distance.transform import get_transforms, set_transforms
+            cpos, crot, cscale = get_transforms(children)
+            set_transforms(children, cpos + diff, crot, cscale)
+            return
+        for obj in children:
+            pos = tuple(p + d for p, d in zip(obj.transform.pos, diff))
             obj.transform = obj.transform.set(pos=pos)
 
     def rerotate(self, rot):
-        import numpy as np, quaternion
-        from distance.transform import rotpoint
-        quaternion # suppress warning
-
         orot = self.transform.rot
         self.transform = self.transform.set(rot=rot)
 
-        qrot = np.quaternion(rot[3], *rot[:3])
-        qorot = np.quaternion(orot[3], *orot[:3])
-
-        diff = qorot / qrot
-        for obj in self.children:
+        diff = _qdiv(orot, rot)
+        children = self.children
+        if len(children) >= BATCH_MIN_CHILDREN:
+            from distance.transform import (
+                get_transforms, set_transforms, quat_mul, quat_rotate)
+            cpos, crot, cscale = get_transforms(children)
+            set_transforms(children, quat_rotate(diff, cpos),
+                           quat_mul(diff, crot), cscale)
+            return
+        for obj in children:
             pos, orot, scale = obj.transform
-            qorot = diff * np.quaternion(orot[3], *orot[:3])
-            nrot = (*qorot.imag, qorot.real)
+            nrot = _qmul(diff, orot)
             if pos:
-                pos = rotpoint(diff, pos)
+                pos = _qrotate(diff, pos)
             obj.transform = Transform(pos, nrot, scale)
 
     def rescale(self, scale):
-        import numpy as np
-
         old = self.transform
         self.transform = old.set(scale=scale)
 
-        inverse = np.array(old.scale) / scale
+        inverse = tuple(o / s for o, s in zip(old.scale, scale))
         invtr = Transform.fill(scale=inverse)
-        for obj in self.children:
+        children = self.children
+        if len(children) >= BATCH_MIN_CHILDREN:
+            from distance.transform import (
+                get_transforms, set_transforms, apply_transforms)
+            set_transforms(children,
+                           *apply_transforms(invtr, *get_transforms(children)))
+            return
+        for obj in children:
             obj.transform = invtr.apply(*obj.transform)
 
 
@@ -66,6 +66,39 @@ class Level(Fragment):
     def settings(self, s):
         self._settings = s
 
+    def transforms_array(self, default=None):
+
+        """Read the transforms of all objects of this level into arrays.
+
+        The transforms are read from the source of this level without
+        creating any objects, see `transform.read_transforms`. Modifications
+        of the objects of this level are not reflected.
+
+        Parameters
+        ----------
+        default : Transform or None
+            Default transform used for objects without known default
+            transform.
+
+        Returns
+        -------
+        table : TransformTable
+            The transforms.
+
+        Raises
+        ------
+        ValueError
+            If this level has not been read from a source.
+
+        """
+
+        from .transform import read_transforms
+        dbytes = getattr(self, 'dbytes', None)
+        if dbytes is None:
+            raise ValueError("level has not been read from a source")
+        return read_transforms(dbytes, classes=self.classes,
+                               default=default)
+
     def _repr_detail(self):
         supstr = super()._repr_detail()
         if self.name:
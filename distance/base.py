@@ -2,12 +2,14 @@
 
 
 from operator import itemgetter, attrgetter, methodcaller
+import math
 import numbers
 import collections
+from struct import Struct
 
 from .bytes import BytesModel, Section, Magic, SKIP_BYTES, S_FLOAT3, S_FLOAT4
 from .printing import format_transform
-from .lazy import UNSET, LazyMappedSequence
+from .lazy import UNSET, LazyMappedSequence, iter_inflated
 from .classes import CollectorGroup, DefaultClasses
 from ._common import classproperty
 
@@ -16,6 +18,11 @@ Classes = CollectorGroup()
 
 TRANSFORM_MIN_SIZE = 12
 
+S_TRANSFORM = Struct("<10f")
+
+# container of the list of children of ObjectFragment
+_CHILDREN_SECTION = Section(Magic[5])
+
 
 class TransformError(ValueError):
     """Conflict when applying a transform."""
@@ -66,6 +73,64 @@ def _seq_isclose(sa, sb):
     return True
 
 
+# Pure-Python quaternion math on xyzw-tuples. Used instead of numpy-quaternion
+# for single transforms, where creating numpy objects costs more than the
+# calculation itself.
+
+_IDENTITY_ROT = (0, 0, 0, 1)
+
+
+def _qmul(a, b):
+    "Hamilton product ``a * b``."
+    ax, ay, az, aw = a
+    bx, by, bz, bw = b
+    return (aw*bx + ax*bw + ay*bz - az*by,
+            aw*by - ax*bz + ay*bw + az*bx,
+            aw*bz + ax*by - ay*bx + az*bw,
+            aw*bw - ax*bx - ay*by - az*bz)
+
+
+def _qdiv(a, b):
+    "Quotient ``a / b``, i.e. ``a * b**-1``."
+    bx, by, bz, bw = b
+    n = bx*bx + by*by + bz*bz + bw*bw
+    return _qmul(a, (-bx / n, -by / n, -bz / n, bw / n))
+
+
+def _qrotate(q, p):
+    "Rotate point `p` by `q`, like ``(q * p / q).imag``."
+    x, y, z, w = q
+    px, py, pz = p
+    n = x*x + y*y + z*z + w*w
+    # ((w² - u·u) p + 2 (u·p) u + 2 w (u × p)) / |q|²
+    f = w*w - x*x - y*y - z*z
+    d = 2 * (x*px + y*py + z*pz)
+    w2 = 2 * w
+    return ((f*px + d*x + w2*(y*pz - z*py)) / n,
+            (f*py + d*y + w2*(z*px - x*pz)) / n,
+            (f*pz + d*z + w2*(x*py - y*px)) / n)
+
+
+def _qangle(q):
+    "Rotation angle of `q`, like ``numpy.quaternion.angle()``."
+    x, y, z, w = q
+    n = x*x + y*y + z*z + w*w
+    if not n:
+        return math.inf
+    # 2 * abs(log(q))
+    return 2 * math.hypot(math.log(n) / 2,
+                          math.atan2(math.sqrt(x*x + y*y + z*z), w))
+
+
+def _rotation_matrix(q):
+    "Rotation matrix of `q`, like ``quaternion.as_rotation_matrix``."
+    x, y, z, w = q
+    s = 2 / (x*x + y*y + z*z + w*w)
+    return ((1 - s*(y*y + z*z), s*(x*y - z*w), s*(x*z + y*w)),
+            (s*(x*y + z*w), 1 - s*(x*x + z*z), s*(y*z - x*w)),
+            (s*(x*z - y*w), s*(y*z + x*w), 1 - s*(x*x + y*y)))
+
+
 class Transform(tuple):
 
     """Position, rotation and scale (immutable).
@@ -166,52 +231,45 @@ class Transform(tuple):
         if not self.is_effective or not Transform(pos, rot, scale).is_effective:
             raise TypeError('need effective transform')
 
-        import numpy as np, quaternion
-        from .transform import rotpoint
-        quaternion
-
         mpos, mrot, mscale = self
 
-        qmrot = np.quaternion(mrot[3], *mrot[:3])
-        qrot = np.quaternion(rot[3], *rot[:3])
-
-        ascale = np.array(scale)
-        amscale = np.array(mscale)
-
-        rotmat = quaternion.as_rotation_matrix(qrot)
-        scaleaxes = [None, None, None]
-        for i, row in enumerate(rotmat):
-            for j, v in enumerate(row):
-                if _isclose(1, abs(v)):
-                    scaleaxes[i] = j
-                elif not _isclose(0, v):
-                    si, sj = mscale[i], mscale[j]
-                    if not _isclose(si, sj):
-                        raise TransformError('Incompatible rotation and scale')
-                    scaleaxes[i] = j
-
-        rpos = tuple(mpos + rotpoint(qmrot, pos * amscale))
-        qrrot = qmrot * qrot
-        rrot = (*qrrot.imag, qrrot.real)
+        if tuple(rot) == _IDENTITY_ROT:
+            # fast path: scale axes are unchanged
+            scaleaxes = 0, 1, 2
+        else:
+            scaleaxes = [None, None, None]
+            for i, row in enumerate(_rotation_matrix(rot)):
+                for j, v in enumerate(row):
+                    if _isclose(1, abs(v)):
+                        scaleaxes[i] = j
+                    elif not _isclose(0, v):
+                        si, sj = mscale[i], mscale[j]
+                        if not _isclose(si, sj):
+                            raise TransformError('Incompatible rotation and scale')
+                        scaleaxes[i] = j
+
+        spos = tuple(p * s for p, s in zip(pos, mscale))
+        if tuple(mrot) == _IDENTITY_ROT:
+            # fast path: no rotation of the reference frame
+            rrot = tuple(rot)
+        else:
+            spos = _qrotate(mrot, spos)
+            rrot = _qmul(mrot, rot)
+        rpos = tuple(m + p for m, p in zip(mpos, spos))
 
-        rot_amscale = tuple(amscale[i] for i in scaleaxes)
-        rscale = tuple(rot_amscale * ascale)
+        rscale = tuple(mscale[i] * s for i, s in zip(scaleaxes, scale))
 
         return type(self)(rpos, rrot, rscale)
 
     def strip(self, pos=None, rot=None, scale=None):
         """Create a copy with the given values stripped if close enough."""
-        import numpy as np, quaternion
-        quaternion
-
         mpos, mrot, mscale = self or ((), (), ())
 
         if mpos and pos and _seq_isclose(mpos, pos):
             mpos = ()
         if mrot and rot:
-            qmrot = np.quaternion(mrot[3], *mrot[:3])
-            qmrot /= np.quaternion(rot[3], *rot[:3])
-            if _isclose(qmrot.angle(), 0):
+            if (tuple(mrot) == tuple(rot)
+                    or _isclose(_qangle(_qdiv(mrot, rot)), 0)):
                 mrot = ()
         if mscale and scale and _seq_isclose(mscale, scale):
             mscale = ()
@@ -247,18 +305,14 @@ class Transform(tuple):
     def write_to(self, dbytes):
         """Write this transform to dbytes."""
         pos, rot, scale = self or ((), (), ())
-        if pos:
-            dbytes.write_bytes(S_FLOAT3.pack(*pos))
-        else:
-            dbytes.write_bytes(SKIP_BYTES)
-        if rot:
-            dbytes.write_bytes(S_FLOAT4.pack(*rot))
-        else:
-            dbytes.write_bytes(SKIP_BYTES)
-        if scale:
-            dbytes.write_bytes(S_FLOAT3.pack(*scale))
-        else:
-            dbytes.write_bytes(SKIP_BYTES)
+        if len(pos) == 3 and len(rot) == 4 and len(scale) == 3:
+            dbytes.write_bytes(S_TRANSFORM.pack(*pos, *rot, *scale))
+            return
+        dbytes.write_bytes(b''.join((
+            S_FLOAT3.pack(*pos) if pos else SKIP_BYTES,
+            S_FLOAT4.pack(*rot) if rot else SKIP_BYTES,
+            S_FLOAT3.pack(*scale) if scale else SKIP_BYTES,
+        )))
 
 
 class Fragment(BytesModel):
@@ -277,7 +331,7 @@ class Fragment(BytesModel):
 
     """
 
-    __slots__ = ('_raw_data', 'container', 'dbytes', 'classes')
+    __slots__ = ('_raw_data', 'container', 'dbytes', 'classes', '_read_state')
 
     default_container = None
 
@@ -401,8 +455,16 @@ class Fragment(BytesModel):
         self.container = container
         self.end_pos = container.end_pos
         self._read_section_data(dbytes, container)
+        self._read_state = self._get_read_state()
 
     def visit_write(self, dbytes):
+        if dbytes.copy_unmodified and not self._is_modified():
+            try:
+                dbytes.copy_section(self.dbytes, self.start_pos, self.end_pos)
+                return
+            except EOFError:
+                # Truncated source. Write what we have read instead.
+                pass
         con = getattr(self, 'container', None)
         sec = self._get_write_section(con)
         with dbytes.write_section(sec):
@@ -411,6 +473,42 @@ class Fragment(BytesModel):
     def _get_write_section(self, sec):
         return sec or self.get_default_container()
 
+    def _get_read_state(self):
+
+        """Get the values that determine the written data of this fragment.
+
+        Called after reading. `_is_modified` compares the result with the
+        current values. Subclasses supporting the copying of unmodified data
+        need to override this. The default returns None, which means that
+        any read fragment is considered modified.
+
+        """
+
+        return None
+
+    def _is_modified(self):
+
+        """Check whether this fragment may differ from its source data.
+
+        Fragments that are not modified are written by copying their source
+        bytes (see `DstBytes.copy_unmodified`).
+
+        Returns
+        -------
+        modified : bool
+            False if this fragment has been read without error and its
+            `_get_read_state` is unchanged since then.
+
+        """
+
+        try:
+            state = self._read_state
+        except AttributeError:
+            return True
+        if state is None or self.exception is not None:
+            return True
+        return state != self._get_read_state()
+
     @property
     def raw_data(self):
 
@@ -423,8 +521,11 @@ class Fragment(BytesModel):
 
         Returns
         -------
-        data : bytes
-            The bytes of this fragment.
+        data : bytes or memoryview
+            The bytes of this fragment. A `memoryview` of the source is
+            returned if the source is memory-mapped (see
+            `DstBytes.from_mmap`). Otherwise, the bytes are copied, so the
+            fragment doesn't keep the whole source buffer alive.
 
         Raises
         ------
@@ -447,7 +548,10 @@ class Fragment(BytesModel):
             raise AttributeError(f"Missing source and/or container information")
         with dbytes:
             dbytes.seek(start)
-            data = dbytes.read_bytes(size)
+            if dbytes.mapped:
+                data = dbytes.read_view(size)
+            else:
+                data = dbytes.read_bytes(size)
             self._raw_data = data
         return data
 
@@ -624,10 +728,20 @@ class ObjectFragment(Fragment):
         if transform or has_children:
             transform.write_to(dbytes)
         if has_children:
-            with dbytes.write_section(Magic[5]):
+            with dbytes.write_section(_CHILDREN_SECTION):
                 for obj in children:
                     yield obj.visit_write(dbytes)
 
+    def _get_read_state(self):
+        con = self.container
+        return (con, con.to_key(), getattr(con, 'id', None),
+                self.real_transform, self.has_children, self.children)
+
+    def _is_modified(self):
+        if super()._is_modified():
+            return True
+        return any(obj._is_modified() for obj in iter_inflated(self.children))
+
     def clone(self):
         """ObjectFragments cannot be cloned."""
         raise NotImplementedError("Cannot clone object")
@@ -640,12 +754,10 @@ def _object_property(name, default=None, doc=None):
     # Optimized access to the very frequently used ObjectFragment.
     obj_key = ObjectFragment.base_container.to_key(noversion=True)
     def get_object_fragment(self):
-        i = 0
-        for sec in self.sections:
-            if sec.to_key(noversion=True) == obj_key:
-                return self.fragments[i]
-            i += 1
-        return None
+        i = self._find_section(obj_key)
+        if i is None:
+            return None
+        return self.fragments[i]
 
     def fget(self):
         frag = get_object_fragment(self)
@@ -818,6 +930,9 @@ class BaseObject(Fragment):
 
     default_transform = None
 
+    # (sections, length, {base_key: index}) of the last _find_section call
+    _key_indices = None
+
     @classproperty
     def class_tag(cls):
 
@@ -887,11 +1002,57 @@ class BaseObject(Fragment):
     def fragments(self, value):
         self._sections = _FragmentsContainerView(value)
         self._fragments = value
+        self._key_indices = None
 
     sections = property(attrgetter('_sections'),
                         doc=("Containers of the fragments of this object."
                              " (read-only view of fragments*.container)"))
 
+    def _find_section(self, base_key):
+
+        """Find the index of the first section with given base key.
+
+        Uses a mapping of base keys to indices, which is created on first use
+        and recreated when `fragments` is replaced or changes its length.
+
+        Parameters
+        ----------
+        base_key : tuple or number
+            The key of the section as returned by
+            ``Section.to_key(noversion=True)``.
+
+        Returns
+        -------
+        index : int or None
+            The index of the section in `sections`, or None if there is no
+            section with the given key.
+
+        """
+
+        sections = self._sections
+        cache = self._key_indices
+        if (cache is None or cache[0] is not sections
+                or cache[1] != len(sections)):
+            indices = {}
+            try:
+                i = 0
+                for sec in sections:
+                    key = sec.to_key(noversion=True)
+                    if key not in indices:
+                        indices[key] = i
+                    i += 1
+            except AttributeError:
+                # Broken section. Don't cache, and only raise if the section
+                # comes before the one we're looking for, like a plain search
+                # would.
+                i = indices.get(base_key)
+                if i is None:
+                    raise
+                return i
+            cache = sections, len(sections), indices
+            self._key_indices = cache
+        return cache[2].get(base_key)
+
     def fragment_by_type(self, typ):
 
         """Get fragment by class.
@@ -965,13 +1126,10 @@ class BaseObject(Fragment):
         """
 
         base_key, versions = self.classes.fragments._get_tag_impl_info(tag)
-        i = 0
-        for sec in self.sections:
-            if sec.to_key(noversion=True) == base_key:
-                break
-            i += 1
-        else:
+        i = self._find_section(base_key)
+        if i is None:
             raise FragmentKeyError(tag)
+        sec = self.sections[i]
 
         fragments = self.fragments
 
@@ -1023,14 +1181,11 @@ class BaseObject(Fragment):
             raise KeyError(f"Invalid fragment tag: fragment tag is {ftag!r}"
                            f" but expected {tag!r}")
         frags = list(self.fragments)
-        i = 0
-        for sec in self.sections:
-            if sec.to_key(noversion=True) == base_key:
-                frags[i] = frag
-                break
-            i += 1
-        else:
+        i = self._find_section(base_key)
+        if i is None:
             frags.append(frag)
+        else:
+            frags[i] = frag
         self.fragments = frags
 
     def __delitem__(self, tag):
@@ -1054,16 +1209,12 @@ class BaseObject(Fragment):
         """
 
         base_key = self.classes.fragments.get_base_key(tag)
-        i = 0
-        for sec in self.sections:
-            if sec.to_key(noversion=True) == base_key:
-                frags = list(self.fragments)
-                del frags[i]
-                self.fragments = frags
-                break
-            i += 1
-        else:
+        i = self._find_section(base_key)
+        if i is None:
             raise KeyError(f"Fragment with tag {tag!r} is not present")
+        frags = list(self.fragments)
+        del frags[i]
+        self.fragments = frags
 
     def __contains__(self, tag):
 
@@ -1089,13 +1240,10 @@ class BaseObject(Fragment):
         """
 
         base_key, versions = self.classes.fragments._get_tag_impl_info(tag)
-        i = 0
-        for sec in self.sections:
-            if sec.to_key(noversion=True) == base_key:
-                break
-            i += 1
-        else:
+        i = self._find_section(base_key)
+        if i is None:
             return False
+        sec = self.sections[i]
 
         # Peek operation analogous to __getitem__.
         peeked = LazyMappedSequence.peek(self.fragments, i)
@@ -1132,12 +1280,10 @@ class BaseObject(Fragment):
         """
 
         base_key = self.classes.fragments.get_base_key(tag)
-        i = 0
-        for sec in self.sections:
-            if sec.to_key(noversion=True) == base_key:
-                return self.fragments[i]
-            i += 1
-        return None
+        i = self._find_section(base_key)
+        if i is None:
+            return None
+        return self.fragments[i]
 
     def has_any(self, tag):
 
@@ -1161,16 +1307,14 @@ class BaseObject(Fragment):
         """
 
         base_key = self.classes.fragments.get_base_key(tag)
-        for sec in self.sections:
-            if sec.to_key(noversion=True) == base_key:
-                return True
-        return False
+        return self._find_section(base_key) is not None
 
     def _read_section_data(self, dbytes, sec):
         self.type = sec.type
         self._sections = Section.lazy_n_maybe(dbytes, sec.count)
         self._fragments = LazyMappedSequence(
             self._sections, self._read_fragment)
+        self._key_indices = None
 
     def _read_fragment(self, sec):
         if sec.exception:
@@ -1191,9 +1335,37 @@ class BaseObject(Fragment):
             cid = None
         return Section(Magic[6], self.type, id=cid)
 
+    def _get_read_state(self):
+        con = self.container
+        return (con, con.to_key(), getattr(con, 'id', None), self.type,
+                self._fragments)
+
+    def _is_modified(self):
+        if super()._is_modified():
+            return True
+        return any(frag._is_modified()
+                   for frag in iter_inflated(self._fragments))
+
     def _visit_write_section_data(self, dbytes, sec):
-        for frag in self.fragments:
-            yield frag.visit_write(dbytes)
+        frags = self._fragments
+        if (not dbytes.copy_unmodified
+                or not isinstance(frags, LazyMappedSequence)
+                or isinstance(self._sections, _MappedSequenceView)):
+            for frag in frags:
+                yield frag.visit_write(dbytes)
+            return
+        # Fragments lazily read by _read_section_data. Copy the ones that
+        # have never been accessed, without reading them.
+        source = self.dbytes
+        peek = LazyMappedSequence.peek
+        for i, con in enumerate(self._sections):
+            if peek(frags, i) is UNSET and not con.exception:
+                try:
+                    dbytes.copy_section(source, con.start_pos, con.end_pos)
+                    continue
+                except EOFError:
+                    pass
+            yield frags[i].visit_write(dbytes)
 
     def _init_defaults(self):
         super()._init_defaults()
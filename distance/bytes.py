@@ -2,14 +2,17 @@
 
 
 import sys
-from io import BytesIO
+import mmap
+from io import BytesIO, UnsupportedOperation
 from struct import Struct
 from contextlib import contextmanager
 from collections import namedtuple
+from operator import attrgetter
 
+from . import instrument
 from .printing import PrintContext
 from ._argtaker import ArgTaker
-from .lazy import LazySequence
+from .lazy import LazySequence, LazyMappedSequence
 from trampoline import trampoline
 
 import codecs
@@ -36,6 +39,19 @@ S_UINT3 = Struct("<III")
 
 SKIP_BYTES = b'\xFD\xFF\xFF\x7F'
 
+"""Intern table for names that repeat within and across files.
+
+Used by `DstBytes.read_str` for object types, layer names and property
+names, so repeated names are decoded once and share one instance.
+"""
+NAME_TABLE = {}
+
+"""Maximum number of names added to an intern table."""
+NAME_TABLE_LIMIT = 65536
+
+_SIZE_PLACEHOLDER = b'\x00' * 8
+_COUNT_PLACEHOLDER = b'\x00' * 4
+
 """Used for some properties"""
 MAGIC_1 = 11111111
 
@@ -83,6 +99,97 @@ Magic = {
 CATCH_EXCEPTIONS = (ValueError, EOFError)
 
 
+def _str_bounds(buf, pos):
+    # Start and end of the data of the string with the prefix at pos.
+    try:
+        b = buf[pos]
+        pos += 1
+        if b & 0x80:
+            n = b & 0x7f
+            bits = 7
+            while True:
+                b = buf[pos]
+                pos += 1
+                if b & 0x80:
+                    n |= (b & 0x7f) << bits
+                    bits += 7
+                else:
+                    n |= b << bits
+                    break
+        else:
+            n = b
+    except IndexError:
+        raise EOFError
+    end = pos + n
+    if end > len(buf):
+        raise EOFError
+    return pos, end
+
+
+def _decode_utf16(data, table):
+    # data needs to be bytes if table is set
+    if table is None:
+        return UTF_16_DECODE(data, 'surrogateescape')[0]
+    s = table.get(data)
+    if s is None:
+        s = UTF_16_DECODE(data, 'surrogateescape')[0]
+        if len(table) < NAME_TABLE_LIMIT:
+            table[data] = s
+    return s
+
+
+def decode_str(buf, pos, table=None):
+
+    """Decode a varint-prefixed utf-16-le string from a buffer.
+
+    Parameters
+    ----------
+    buf : buffer
+        The buffer, usually `DstBytes.view`.
+    pos : int
+        Position of the string's length prefix.
+    table : dict or None
+        Optional intern table, mapping encoded bytes to decoded strings. If
+        given, repeated strings are only decoded once and share one instance.
+        At most `NAME_TABLE_LIMIT` strings are added to the table.
+
+    Returns
+    -------
+    s, end : str, int
+        The string and the position after it.
+
+    Raises
+    ------
+    EOFError
+        If the string exceeds the buffer.
+
+    """
+
+    start, end = _str_bounds(buf, pos)
+    data = buf[start:end]
+    if table is not None and not isinstance(data, bytes):
+        data = bytes(data)
+    return _decode_utf16(data, table), end
+
+
+def encode_var_int(value):
+    "Encode a variable-sized unsigned int, see `DstBytes.read_var_int`."
+    if value < 0x80:
+        return bytes((value,))
+    data = bytearray()
+    while value >= 0x80:
+        data.append((value & 0x7f) | 0x80)
+        value >>= 7
+    data.append(value)
+    return bytes(data)
+
+
+def encode_str(s):
+    "Encode a varint-prefixed utf-16-le string, see `DstBytes.write_str`."
+    data = UTF_16_ENCODE(s, 'surrogateescape')[0]
+    return encode_var_int(len(data)) + data
+
+
 class ErrorPosition(namedtuple('_ErrorPosition', ['start', 'error'])):
 
     def __repr__(self):
@@ -206,9 +313,13 @@ class BytesModel(object):
 
         if n <= 0:
             return ()
-        # stable_iter seeks for us
+        # stable_iter and lazy_at_positions seek for us
         kw['seek_end'] = False
         dbytes = DstBytes.from_arg(dbytes)
+        positions = dbytes.index_positions(start_pos, n)
+        if positions is not None:
+            return dbytes.lazy_at_positions(
+                positions, lambda: cls.maybe(dbytes, **kw))
         gen = cls.iter_n_maybe(dbytes, n, **kw)
         return LazySequence(dbytes.stable_iter(gen, start_pos=start_pos), n)
 
@@ -295,6 +406,9 @@ class BytesModel(object):
         """
 
         dbytes = DstBytes.from_arg(dbytes)
+        stats = instrument.current
+        if stats is not None:
+            stats._begin_read(self)
         container = kw.get('container', None)
         if container:
             start_pos = container.start_pos
@@ -329,6 +443,9 @@ class BytesModel(object):
                 except EOFError:
                     pass
             raise e
+        finally:
+            if stats is not None:
+                stats._end_read(self)
 
     def _read(self, dbytes):
         raise NotImplementedError(
@@ -346,6 +463,16 @@ class BytesModel(object):
 
         Subclasses need to implement `visit_write()` for this to work.
 
+        If `dbytes` is a file name or a file object, the object is visited
+        twice: the first pass calculates the section sizes, and the second
+        pass writes the data sequentially. The file doesn't need to support
+        seeking, and the data is not kept in memory.
+
+        Returns
+        -------
+        n : int
+            The number of bytes written, if `dbytes` is not a `DstBytes`.
+
         """
 
         return trampoline(DstBytes._write_arg(self, dbytes, **kw))
@@ -543,12 +670,26 @@ class Section(BytesModel):
 
     """
 
-    __slots__ = ('magic', 'type', 'version', 'id',
+    __slots__ = ('_magic', '_type', '_version', '_keys', 'id',
                  'content_start', 'content_size',
                  'count', 'name')
 
     MIN_SIZE = 12 # 4b (magic) + 8b (data_size)
 
+    def _key_field(attr, doc):
+        # Field that is part of the key. Assigning it clears the cached keys.
+        getter = attrgetter(attr)
+        def fset(self, value):
+            setattr(self, attr, value)
+            self._keys = None
+        return property(getter, fset, doc=doc)
+
+    magic = _key_field('_magic', "The magic number.")
+    type = _key_field('_type', "The type ID or object type name.")
+    version = _key_field('_version', "The version.")
+
+    del _key_field
+
     @classmethod
     def base(cls, *args, **kw):
 
@@ -647,16 +788,18 @@ class Section(BytesModel):
 
         """
 
-        magic = self.magic
-        if magic in (MAGIC_2, MAGIC_3):
-            if noversion:
-                return (magic, self.type, None)
+        keys = self._keys
+        if keys is None:
+            magic = self._magic
+            if magic in (MAGIC_2, MAGIC_3):
+                typ = self._type
+                keys = (magic, typ, self._version), (magic, typ, None)
+            elif magic == MAGIC_6:
+                keys = ((magic, self._type),) * 2
             else:
-                return (magic, self.type, self.version)
-        elif magic == MAGIC_6:
-            return (magic, self.type)
-        else:
-            return magic
+                keys = (magic, magic)
+            self._keys = keys
+        return keys[1] if noversion else keys[0]
 
     @classmethod
     def from_key(cls, key):
@@ -703,29 +846,30 @@ class Section(BytesModel):
 
     def _read(self, dbytes):
         magic, data_size = dbytes.read_struct(S_SEC_BASE)
-        self.magic = magic
+        self._magic = magic
+        self._keys = None
         data_start = self.start_pos + 12
         data_end = data_start + data_size
         self.end_pos = data_end
 
         if magic in (MAGIC_2, MAGIC_3):
-            self.type, self.version, self.id = dbytes.read_struct(S_UINT3)
+            self._type, self._version, self.id = dbytes.read_struct(S_UINT3)
             cstart = data_start + 12
         elif magic == MAGIC_5:
             self.count = dbytes.read_uint()
             cstart = data_start + 4
         elif magic == MAGIC_6:
-            self.type = dbytes.read_str()
+            self._type = dbytes.read_str(NAME_TABLE)
             dbytes.read_bytes(1) # unknown, always 0
             self.id, self.count = dbytes.read_struct(S_UINT2)
             cstart = dbytes.tell()
         elif magic == MAGIC_7:
-            self.name = dbytes.read_str()
+            self.name = dbytes.read_str(NAME_TABLE)
             self.count = dbytes.read_uint()
             cstart = dbytes.tell()
         elif magic == MAGIC_9:
             self.name = dbytes.read_str()
-            self.count, self.version = dbytes.read_struct(S_UINT2)
+            self.count, self._version = dbytes.read_struct(S_UINT2)
             cstart = dbytes.tell()
         elif magic in (MAGIC_8, MAGIC_32):
             cstart = data_start
@@ -735,44 +879,43 @@ class Section(BytesModel):
         self.content_start = cstart
         self.content_size = data_end - cstart
 
-    @contextmanager
-    def _write_header(self, dbytes):
+    def _begin_write(self, dbytes):
+
+        """Write the header of this section.
+
+        Returns
+        -------
+        size_token, count_token
+            Tokens of `dbytes` to finish the size and subsection count fields
+            of this section, or None if the section has no such field.
+
+        """
+
         magic = self.magic
-        dbytes.write_uint(magic)
         if magic in (MAGIC_2, MAGIC_3):
-            with dbytes.write_size():
-                dbytes.write_uint(self.type)
-                dbytes.write_uint(self.version)
-                dbytes.write_id(getattr(self, 'id', None))
-                yield
+            header = S_UINT3.pack(self.type, self.version,
+                                  dbytes._alloc_id(getattr(self, 'id', None)))
+            return dbytes._begin_size(S_UINT.pack(magic), header), None
         elif magic == MAGIC_5:
-            with dbytes.write_size():
-                with dbytes.write_num_subsections():
-                    yield
+            size = dbytes._begin_size(S_UINT.pack(magic))
+            return size, dbytes._begin_count()
         elif magic == MAGIC_6:
-            with dbytes.write_size():
-                dbytes.write_str(self.type)
-                dbytes.write_bytes(b'\x00') # unknown, always 0
-                dbytes.write_id(getattr(self, 'id', None))
-                with dbytes.write_num_subsections():
-                    yield
+            # unknown byte, always 0
+            header = b''.join((
+                encode_str(self.type), b'\x00',
+                S_UINT.pack(dbytes._alloc_id(getattr(self, 'id', None)))))
+            size = dbytes._begin_size(S_UINT.pack(magic), header)
+            return size, dbytes._begin_count()
         elif magic == MAGIC_7:
-            with dbytes.write_size():
-                dbytes.write_str(self.name)
-                with dbytes.write_num_subsections():
-                    yield
-        elif magic == MAGIC_8:
-            with dbytes.write_size():
-                yield
+            size = dbytes._begin_size(S_UINT.pack(magic),
+                                      encode_str(self.name))
+            return size, dbytes._begin_count()
+        elif magic in (MAGIC_8, MAGIC_32):
+            return dbytes._begin_size(S_UINT.pack(magic)), None
         elif magic == MAGIC_9:
-            with dbytes.write_size():
-                dbytes.write_str(self.name)
-                dbytes.write_uint(self.count)
-                dbytes.write_uint(self.version)
-                yield
-        elif magic == MAGIC_32:
-            with dbytes.write_size():
-                yield
+            header = encode_str(self.name) + S_UINT2.pack(self.count,
+                                                          self.version)
+            return dbytes._begin_size(S_UINT.pack(magic), header), None
         else:
             raise NotImplementedError(f"cannot write section {self.magic}")
 
@@ -807,6 +950,24 @@ class Section(BytesModel):
                 p(f"Content size: 0x{size:x} bytes")
 
 
+class _ReadOnlyMap(mmap.mmap):
+
+    """Read-only memory map behaving like a file when seeking past the end.
+
+    Plain `mmap.mmap` raises ValueError when seeking beyond the end of the
+    mapping. Clamping the position instead causes subsequent reads to come up
+    short, which results in the same EOFError as with other files.
+
+    """
+
+    def seek(self, pos, whence=0):
+        if whence == 1:
+            pos += self.tell()
+        elif whence == 2:
+            pos += len(self)
+        super().seek(min(max(pos, 0), len(self)))
+
+
 class DstBytes(object):
 
     """File wrapper for reading and writing data of .bytes files.
@@ -852,16 +1013,39 @@ class DstBytes(object):
     num_subsections = 0
     section_counter = 0x10000000
 
+    """memoryview of the whole source, or None if not backed by a buffer.
+
+    The memoryview needs to cover its whole underlying object.
+    """
+    view = None
+
+    """Whether the source is a memory-mapped file, see `from_mmap`."""
+    mapped = False
+
+    """SectionIndex used for random access to lazily read sections."""
+    section_index = None
+
+    """Whether unmodified objects are written by copying their source bytes.
+
+    See `copy_section`. Set to False to always encode objects from their
+    attributes.
+    """
+    copy_unmodified = True
+
     def __init__(self, file):
         self.file = file
         self.tell = file.tell
         self.seek = file.seek
+        # Skip the method call for the most frequent operation.
+        self.write_bytes = file.write
         self._pos_stack = []
 
     def __repr__(self):
         pos = self.tell()
         if isinstance(self.file, BytesIO):
             fstr = f"<memory size 0x{len(self.file.getbuffer()):x}> "
+        elif isinstance(self.file, mmap.mmap):
+            fstr = f"<mapped size 0x{len(self.file):x}> "
         else:
             try:
                 fstr = f"{self.file.name!r} "
@@ -877,7 +1061,43 @@ class DstBytes(object):
     @classmethod
     def from_data(cls, data):
         """Create a new instance for reading the given bytes."""
-        return DstBytes(BytesIO(data))
+        dbytes = DstBytes(BytesIO(data))
+        if isinstance(data, bytes):
+            dbytes.view = memoryview(data)
+        return dbytes
+
+    @classmethod
+    def from_mmap(cls, filename):
+
+        """Create a new instance reading the given file via a memory map.
+
+        Unlike `from_arg`, the file is not read into memory completely. It is
+        mapped read-only instead, and only the parts being accessed are
+        loaded by the operating system. All read methods work as usual. The
+        `read_view` method returns slices of the mapping without copying.
+
+        Parameters
+        ----------
+        filename : str or bytes
+            The name of the file to map.
+
+        Returns
+        -------
+        dbytes : cls
+            The new instance.
+
+        """
+
+        with open(filename, 'rb') as f:
+            try:
+                mapped = _ReadOnlyMap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be mapped
+                return cls.from_data(b'')
+        dbytes = cls(mapped)
+        dbytes.view = memoryview(mapped)
+        dbytes.mapped = True
+        return dbytes
 
     @classmethod
     def from_arg(cls, arg):
@@ -896,6 +1116,8 @@ class DstBytes(object):
             Otherwise, it is assumed to be a binary file, and is wrapped with a
             new instance of this class.
 
+            Use `from_mmap` to read a file without loading it into memory.
+
         Returns
         -------
         dbytes : cls
@@ -916,7 +1138,7 @@ class DstBytes(object):
             # operations which are faster on BytesIO.
             with open(arg, 'rb') as f:
                 data = f.read()
-            return cls(BytesIO(data))
+            return cls.from_data(data)
         arg.read # raises if arg has no read method
         try:
             file_mode = arg.mode
@@ -933,21 +1155,28 @@ class DstBytes(object):
     def _write_arg(cls, obj, arg, write_mode='wb'):
         if isinstance(arg, cls):
             return (yield obj.visit_write(arg))
+        if not isinstance(arg, (str, bytes)):
+            try:
+                file_mode = arg.mode
+            except AttributeError:
+                pass
+            else:
+                if not 'b' in file_mode:
+                    raise IOError(f"File needs to be opened with 'b' mode.")
+        # Sizes are calculated first, so the file can be written
+        # sequentially without keeping the data in memory.
+        recorder = _SizeRecorder()
+        yield obj.visit_write(recorder)
         if isinstance(arg, (str, bytes)):
-            tmpdb = DstBytes.in_memory()
-            yield obj.visit_write(tmpdb)
             with open(arg, write_mode) as f:
-                return f.write(tmpdb.file.getbuffer())
-        try:
-            file_mode = arg.mode
-        except AttributeError:
-            pass
+                streamer = _SizeStreamer(f, recorder.sizes)
+                yield obj.visit_write(streamer)
+                streamer.flush()
         else:
-            if not 'b' in file_mode:
-                raise IOError(f"File needs to be opened with 'b' mode.")
-        tmpdb = DstBytes.in_memory()
-        yield obj.visit_write(tmpdb)
-        return arg.write(tmpdb.file.getbuffer())
+            streamer = _SizeStreamer(arg, recorder.sizes)
+            yield obj.visit_write(streamer)
+            streamer.flush()
+        return streamer.tell()
 
     def __enter__(self):
         """Save file position on enter and restore it on exit."""
@@ -980,8 +1209,41 @@ class DstBytes(object):
         result = self.file.read(n)
         if len(result) != n:
             raise EOFError
+        if instrument.current is not None:
+            instrument.record_read(self, self.tell() - n, n)
         return result
 
+    def read_view(self, n):
+
+        """Read a given number of bytes without copying, if possible.
+
+        If this instance is backed by a buffer (see `view`), a `memoryview`
+        slice of the buffer is returned. Otherwise, this is the same as
+        `read_bytes`.
+
+        Raises
+        ------
+        EOFError
+            If less than the given number of bytes could be read.
+        ValueError
+            If `n` is negative.
+
+        """
+
+        view = self.view
+        if view is None:
+            return self.read_bytes(n)
+        if n < 0:
+            raise ValueError("n must be positive")
+        start = self.tell()
+        end = start + n
+        if end > len(view):
+            raise EOFError
+        self.seek(end)
+        if instrument.current is not None:
+            instrument.record_read(self, start, n)
+        return view[start:end]
+
     def read_byte(self):
         "Read a single byte."
         return self.read_bytes(1)[0]
@@ -996,10 +1258,14 @@ class DstBytes(object):
 
         """
 
-        n = 0
-        bits = 0
+        read = self.read_bytes
+        b = read(1)[0]
+        if not b & 0x80:
+            return b
+        n = b & 0x7f
+        bits = 7
         while True:
-            b = self.read_byte()
+            b = read(1)[0]
             if b & 0x80:
                 n |= (b & 0x7f) << bits
                 bits += 7
@@ -1038,11 +1304,46 @@ class DstBytes(object):
         data = self.read_bytes(st.size)
         return st.unpack(data)
 
-    def read_str(self):
-        "Read a varint-prefixed utf-16-le string."
-        length = self.read_var_int()
-        data = self.read_bytes(length)
-        return UTF_16_DECODE(data, 'surrogateescape')[0]
+    def read_str(self, table=None):
+
+        """Read a varint-prefixed utf-16-le string.
+
+        If this instance has a `view`, the string is decoded directly from
+        the buffer.
+
+        Parameters
+        ----------
+        table : dict or None
+            Optional intern table, see `decode_str`.
+
+        """
+
+        view = self.view
+        if view is not None:
+            pos = self.tell()
+            try:
+                n = view[pos]
+            except IndexError:
+                raise EOFError
+            if n < 0x80:
+                # single-byte length prefix
+                start = pos + 1
+                end = start + n
+                if end > len(view):
+                    raise EOFError
+            else:
+                start, end = _str_bounds(view, pos)
+            self.seek(end)
+            if instrument.current is not None:
+                instrument.record_read(self, pos, end - pos)
+            # Slicing the underlying object gives bytes, which are faster to
+            # decode and hash than a memoryview.
+            data = view.obj[start:end]
+        else:
+            data = self.read_bytes(self.read_var_int())
+        if table is None:
+            return UTF_16_DECODE(data, 'surrogateescape')[0]
+        return _decode_utf16(data, table)
 
     def read_id(self):
         "Read a ``uint`` ID."
@@ -1076,12 +1377,7 @@ class DstBytes(object):
 
         """
 
-        data = bytearray()
-        while value >= 0x80:
-            data.append((value & 0x7f) | 0x80)
-            value >>= 7
-        data.append(value)
-        self.write_bytes(data)
+        self.write_bytes(encode_var_int(value))
 
     def require_equal_uint4(self, expect):
         "Read ``uint``, raising if it doesn't match the given value."
@@ -1091,9 +1387,7 @@ class DstBytes(object):
 
     def write_str(self, s):
         "Write a varint-prefixed utf-16-le string."
-        data = UTF_16_ENCODE(s, 'surrogateescape')[0]
-        self.write_var_int(len(data))
-        self.write_bytes(data)
+        self.write_bytes(encode_str(s))
 
     def write_id(self, id_):
 
@@ -1104,10 +1398,14 @@ class DstBytes(object):
 
         """
 
+        self.write_uint(self._alloc_id(id_))
+
+    def _alloc_id(self, id_):
+        "Return `id_`, or a new ID if it is None."
         if id_ is None:
             id_ = self.section_counter + 1
             self.section_counter = id_
-        self.write_uint(id_)
+        return id_
 
     def stable_iter(self, source, *, start_pos=None):
 
@@ -1156,18 +1454,99 @@ class DstBytes(object):
                 pos = obj.end_pos
         return gen()
 
+    def index_positions(self, start_pos, n):
+
+        """Look up the positions of a list of sections in `section_index`.
+
+        Parameters
+        ----------
+        start_pos : int or None
+            The position of the first section. If None, the current position
+            is used.
+        n : int
+            The length of the list.
+
+        Returns
+        -------
+        positions : sequence of int or None
+            The start positions of the sections, or None if there is no
+            `section_index` or if it doesn't contain the list.
+
+        """
+
+        index = self.section_index
+        if index is None:
+            return None
+        if start_pos is None:
+            start_pos = self.tell()
+        return index.list_positions(start_pos, n)
+
+    def lazy_at_positions(self, positions, func):
+
+        """Create a lazy sequence of objects read at known positions.
+
+        Unlike with `stable_iter`, accessing an element only reads that
+        element.
+
+        Parameters
+        ----------
+        positions : sequence of int
+            The file positions of the objects.
+        func : function () -> BytesModel
+            Called without arguments to read each object, after seeking to its
+            position.
+
+        Returns
+        -------
+        seq : lazy sequence
+            The new sequence of objects.
+
+        """
+
+        def read_at(pos):
+            self.seek(pos)
+            return func()
+        return LazyMappedSequence(positions, read_at)
+
+    def _begin_size(self, prefix=b'', suffix=b''):
+
+        """Write a size field surrounded by the given bytes.
+
+        The size is the number of bytes written after the size field,
+        including `suffix`, until `_end_size` is called with the returned
+        token. Writers that can't seek override this and the other
+        `_begin_*` and `_end_*` methods.
+
+        """
+
+        pos = self.tell() + len(prefix)
+        self.write_bytes(prefix + _SIZE_PLACEHOLDER + suffix)
+        return pos
+
+    def _end_size(self, token):
+        end = self.tell()
+        self.seek(token)
+        self.write_bytes(S_ULONG.pack(end - token - 8))
+        self.seek(end)
+
+    def _begin_count(self):
+        "Write a field for the number of subsections, see `_begin_size`."
+        pos = self.tell()
+        self.write_bytes(_COUNT_PLACEHOLDER)
+        return pos
+
+    def _end_count(self, token):
+        end = self.tell()
+        self.seek(token)
+        self.write_bytes(S_UINT.pack(self.num_subsections))
+        self.seek(end)
+
     @contextmanager
     def write_size(self):
         "Write the number of bytes written inside this context."
-        start = self.tell()
-        self.write_bytes(b'\x00' * 8)
-        try:
-            yield
-        finally:
-            end = self.tell()
-            with self:
-                self.seek(start)
-                self.write_ulong(end - start - 8)
+        token = self._begin_size()
+        yield
+        self._end_size(token)
 
     @contextmanager
     def write_num_subsections(self):
@@ -1178,16 +1557,37 @@ class DstBytes(object):
 
         """
 
-        start = self.tell()
-        self.write_bytes(b'\x00' * 4)
-        try:
-            yield
-        finally:
-            with self:
-                self.seek(start)
-                self.write_uint(self.num_subsections)
+        token = self._begin_count()
+        yield
+        self._end_count(token)
+
+    def copy_section(self, source, start_pos, end_pos):
+
+        """Copy a complete section from another source.
+
+        The section is counted like sections written with `write_section`.
+
+        Parameters
+        ----------
+        source : DstBytes
+            The source to copy from. Its position is restored afterwards.
+        start_pos, end_pos : int
+            Start and end position of the section inside `source`.
+
+        Raises
+        ------
+        EOFError
+            If `source` ends before `end_pos`. Nothing is written in this
+            case.
+
+        """
+
+        with source:
+            source.seek(start_pos)
+            data = source.read_view(end_pos - start_pos)
+        self.write_bytes(data)
+        self.num_subsections += 1
 
-    @contextmanager
     def write_section(self, *args, **kw):
 
         """Write the given section.
@@ -1202,18 +1602,188 @@ class DstBytes(object):
 
         """
 
+        if args and not isinstance(args[0], int):
+            sec = args[0]
+        else:
+            sec = Section(*args, **kw)
+        return _SectionWriter(self, sec)
+
+
+class _SectionWriter(object):
+
+    """Context manager returned by `DstBytes.write_section`."""
+
+    __slots__ = ('dbytes', 'sec', 'old_count', 'tokens')
+
+    def __init__(self, dbytes, sec):
+        self.dbytes = dbytes
+        self.sec = sec
+
+    def __enter__(self):
+        dbytes = self.dbytes
         # add this section and save the counter
-        old_count = self.num_subsections + 1
-        self.num_subsections = 0
+        old_count = dbytes.num_subsections + 1
+        self.old_count = old_count
+        dbytes.num_subsections = 0
         try:
-            if args and not isinstance(args[0], int):
-                sec = args[0]
-            else:
-                sec = Section(*args, **kw)
-            with sec._write_header(self):
-                yield sec
+            self.tokens = self.sec._begin_write(dbytes)
+        except:
+            dbytes.num_subsections = old_count
+            raise
+        return self.sec
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        dbytes = self.dbytes
+        try:
+            if exc_type is None:
+                size, count = self.tokens
+                if count is not None:
+                    dbytes._end_count(count)
+                if size is not None:
+                    dbytes._end_size(size)
         finally:
-            self.num_subsections = old_count
+            dbytes.num_subsections = self.old_count
+        return False
+
+
+class _SequentialWriter(DstBytes):
+
+    """Base of writers that never seek.
+
+    Data is collected in a buffer and passed to `target` in chunks of about
+    `chunk_size` bytes, or discarded if `target` is None.
+
+    """
+
+    chunk_size = 0x10000
+
+    def __init__(self, target=None):
+        super().__init__(BytesIO())
+        self.target = target
+        self._chunk_start = 0
+        self.tell = self._tell
+        self.seek = self._seek
+
+    def _tell(self):
+        return self._chunk_start + self.file.tell()
+
+    def _seek(self, pos, whence=0):
+        raise UnsupportedOperation("seek")
+
+    def flush(self):
+        "Pass the buffered data to `target`."
+        buf = self.file
+        n = buf.tell()
+        if n:
+            target = self.target
+            if target is not None:
+                with buf.getbuffer() as view:
+                    target.write(view)
+            buf.seek(0)
+            buf.truncate()
+            self._chunk_start += n
+
+    def _maybe_flush(self):
+        if self.file.tell() >= self.chunk_size:
+            self.flush()
+
+
+class _SizeRecorder(_SequentialWriter):
+
+    """Writer discarding the data and recording sizes of sections.
+
+    The values of size and subsection count fields are recorded in `sizes`,
+    in the order the fields are written. Sections written with
+    `copy_section` are only checked for existence, not read.
+
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.sizes = []
+
+    def _begin_size(self, prefix=b'', suffix=b''):
+        sizes = self.sizes
+        index = len(sizes)
+        sizes.append(None)
+        self.write_bytes(prefix + _SIZE_PLACEHOLDER + suffix)
+        return index, self.tell() - len(suffix)
+
+    def _end_size(self, token):
+        index, start = token
+        self.sizes[index] = self.tell() - start
+        self._maybe_flush()
+
+    def _begin_count(self):
+        sizes = self.sizes
+        sizes.append(None)
+        self.write_bytes(_COUNT_PLACEHOLDER)
+        return len(sizes) - 1
+
+    def _end_count(self, token):
+        self.sizes[token] = self.num_subsections
+
+    def copy_section(self, source, start_pos, end_pos):
+        view = source.view
+        if view is not None:
+            source_size = len(view)
+        else:
+            with source:
+                source.seek(0, 2)
+                source_size = source.tell()
+        if end_pos > source_size:
+            raise EOFError
+        self.flush()
+        self._chunk_start += end_pos - start_pos
+        self.num_subsections += 1
+
+
+class _SizeStreamer(_SequentialWriter):
+
+    """Writer using sizes previously recorded by `_SizeRecorder`.
+
+    The output is written sequentially, without seeking. The object needs to
+    be written exactly the same way it has been written to the recorder.
+    `flush` needs to be called after writing.
+
+    """
+
+    def __init__(self, target, sizes):
+        super().__init__(target)
+        self._sizes = iter(sizes)
+
+    def _check_size(self, kind, expect, actual):
+        if actual != expect:
+            raise RuntimeError(f"{kind} changed while writing: "
+                               f"{actual} instead of {expect}")
+
+    def _begin_size(self, prefix=b'', suffix=b''):
+        size = next(self._sizes)
+        self.write_bytes(prefix + S_ULONG.pack(size) + suffix)
+        return self.tell() - len(suffix), size
+
+    def _end_size(self, token):
+        start, size = token
+        self._check_size("Section size", size, self.tell() - start)
+        self._maybe_flush()
+
+    def _begin_count(self):
+        count = next(self._sizes)
+        self.write_bytes(S_UINT.pack(count))
+        return count
+
+    def _end_count(self, token):
+        self._check_size("Number of subsections", token,
+                         self.num_subsections)
+
+    def copy_section(self, source, start_pos, end_pos):
+        with source:
+            source.seek(start_pos)
+            data = source.read_view(end_pos - start_pos)
+        self.flush()
+        self.target.write(data)
+        self._chunk_start += len(data)
+        self.num_subsections += 1
 
 
 # vim:set sw=4 ts=8 sts=4 et:
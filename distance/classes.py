@@ -15,6 +15,16 @@ from .lazy import LazySequence
 do_autoload = os.environ.get("DISTANCEUTILS_AUTOLOAD", "") != "0"
 
 
+# Incremented whenever classes are registered or loaded anywhere. Probers
+# discard their memoized results when this changes.
+_registry_generation = 0
+
+
+def _registry_changed():
+    global _registry_generation
+    _registry_generation += 1
+
+
 class ProbeError(Exception):
     pass
 
@@ -150,6 +160,7 @@ class ClassCollector(object):
 
         sec = Section(Magic[6], type)
         self._sections[sec.to_key()] = cls
+        _registry_changed()
         self._add_info(type, cls=cls, container=sec)
 
     def add_info(self, *args, tag=None):
@@ -215,6 +226,7 @@ class ClassCollector(object):
             e.registered = registered
             raise e
         self._sections[key] = cls
+        _registry_changed()
 
     def _add_info(self, tag, cls=None, container=None, versions=None):
         if type(tag) is not str:
@@ -292,6 +304,11 @@ class _BaseProber(object):
     Subclasses need to implement `_probe_section_key` and
     optionally `_probe_fallback`.
 
+    Results of `probe_section` are memoized by section key. For this to work,
+    fallback functions may only depend on the section's key. The memo is
+    cleared when it reaches `probe_cache_size` entries, and when classes are
+    registered or loaded in any collection.
+
     Parameters
     ----------
     baseclass : class
@@ -303,12 +320,17 @@ class _BaseProber(object):
 
     """
 
+    probe_cache_size = 4096
+
     def __init__(self, *, baseclass=None, probe_baseclass=None, **kw):
         super().__init__(**kw)
         if probe_baseclass is None:
             probe_baseclass = baseclass is not None
         self.baseclass = baseclass
         self.probe_baseclass = probe_baseclass
+        # {section key: class, or None for ProbeError}
+        self._probe_cache = {}
+        self._probe_generation = -1
 
     def _probe_section_key(self, key):
         "Return the class for the given section."
@@ -334,6 +356,32 @@ class _BaseProber(object):
         """
 
         key = sec.to_key()
+        if self._probe_generation == _registry_generation:
+            try:
+                cls = self._probe_cache[key]
+            except KeyError:
+                pass
+            else:
+                if cls is None:
+                    raise ProbeError
+                return cls
+        try:
+            cls = self._probe_section_uncached(sec, key)
+        except ProbeError:
+            self._memoize_probe(key, None)
+            raise
+        self._memoize_probe(key, cls)
+        return cls
+
+    def _memoize_probe(self, key, cls):
+        cache = self._probe_cache
+        if (self._probe_generation != _registry_generation
+                or len(cache) >= self.probe_cache_size):
+            cache.clear()
+            self._probe_generation = _registry_generation
+        cache[key] = cls
+
+    def _probe_section_uncached(self, sec, key):
         cls = self._probe_section_key(key)
         if cls is not None:
             return cls
@@ -511,9 +559,13 @@ class _BaseProber(object):
 
         if n <= 0:
             return ()
-        # stable_iter seeks for us
+        # stable_iter and lazy_at_positions seek for us
         kw['seek_end'] = False
         dbytes = DstBytes.from_arg(dbytes)
+        positions = dbytes.index_positions(start_pos, n)
+        if positions is not None:
+            return dbytes.lazy_at_positions(
+                positions, lambda: self.maybe(dbytes, **kw))
         gen = self.iter_n_maybe(dbytes, n, **kw)
         return LazySequence(dbytes.stable_iter(gen, start_pos=start_pos), n)
 
@@ -550,6 +602,7 @@ class ClassCollection(_BaseProber, ClassCollector):
         """
 
         self._funcs_by_tag[tag] = func
+        _registry_changed()
 
     def func(self, tag):
         "Decorator style method for `add_func`."
@@ -896,6 +949,7 @@ class ClassCollection(_BaseProber, ClassCollector):
         self._interesting_sections.update(content['interesting'])
         self._classes.update(content['classes'])
         self._tags_by_base_key.update(content['key_tags'])
+        _registry_changed()
 
     def _generate_autoload_content(self):
         return {
@@ -922,6 +976,7 @@ class ClassCollection(_BaseProber, ClassCollector):
     def _load_impl(self, coll, update_classes):
         self._sections.update(((k, v) for k, v in coll._sections.items()
                                if k not in self._sections))
+        _registry_changed()
         if update_classes:
             _update_class_info(self._classes, coll._classes)
             self._interesting_sections.update(coll._interesting_sections)
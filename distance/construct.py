@@ -1,13 +1,21 @@
 """Facilities for defining fragments with the construct module."""
 
 
+import os
+import sys
+import types
+import hashlib
+import marshal
+import struct
+
+import construct
 from construct import (
     PascalString, VarInt, Bytes, GreedyBytes,
     ConstructError,
     Const, Select, FocusedSeq, Tell,
     Mapping, IfThenElse,
-    Compiled, Construct,
-    Container,
+    Compiled, Construct, Renamed, FormatField, Array, Pass,
+    Container, ListContainer,
     this,
 
     Struct,
@@ -21,6 +29,7 @@ from construct import (
     Float64l as Double,
 )
 
+from distance import instrument
 from distance.base import Fragment
 from distance.bytes import Magic, SKIP_BYTES
 from distance.printing import format_bytes_multiline
@@ -33,12 +42,53 @@ __all__ = [
 ]
 
 
-DstString = PascalString(VarInt, encoding='utf-16le')
+class _VarInt(type(VarInt)):
+
+    """VarInt that can be compiled."""
+
+    def _emitparse(self, code):
+        code.append("""
+            def parse_varint(io):
+                value = 0
+                shift = 0
+                while True:
+                    b = read_bytes(io, 1)[0]
+                    value |= (b & 0x7f) << shift
+                    if b < 0x80:
+                        return value
+                    shift += 7
+        """)
+        return "parse_varint(io)"
+
+
+DstString = PascalString(_VarInt(), encoding='utf-16le')
+
+
+class _Optional(Select):
+
+    """Select between SKIP_BYTES and subcon that can be compiled."""
+
+    def __init__(self, subcon, otherwise):
+        super().__init__(
+            Mapping(Const(SKIP_BYTES), {otherwise: SKIP_BYTES}),
+            subcon)
+        self.otherwise = otherwise
+
+    def _emitparse(self, code):
+        fname = f"parse_optional_{code.allocateId()}"
+        code.append(f"""
+            def {fname}(io, this):
+                pos = io.tell()
+                if io.read(4) == {SKIP_BYTES!r}:
+                    return {self.otherwise!r}
+                io.seek(pos)
+                return {self.subcons[1]._compileparse(code)}
+        """)
+        return f"{fname}(io, this)"
+
 
 def DstOptional(subcon, otherwise=None):
-    return Select(
-        Mapping(Const(SKIP_BYTES), {otherwise: SKIP_BYTES}),
-        subcon)
+    return _Optional(subcon, otherwise)
 
 Remainder = FocusedSeq(
     'rem',
@@ -53,6 +103,284 @@ _magic_consts = {k: Const(Magic[k], UInt) for k, v in Magic.items()}
 MagicConst = _magic_consts.__getitem__
 
 
+"""Directory for compiled parsers, or None to disable the disk cache.
+
+Disabled by default. Set the ``DISTANCEUTILS_CONSTRUCT_CACHE`` environment
+variable to a directory to enable it. Cached parsers are executed as code,
+so the directory must be trusted: never point it at a directory that others
+can write to.
+"""
+cache_dir = os.environ.get('DISTANCEUTILS_CONSTRUCT_CACHE') or None
+
+_file_hashes = {}
+
+
+def _file_hash(filename):
+    try:
+        return _file_hashes[filename]
+    except KeyError:
+        pass
+    with open(filename, 'rb') as f:
+        result = _file_hashes[filename] = hashlib.sha1(f.read()).hexdigest()
+    return result
+
+
+def _cache_key(owner):
+    # Key by everything the struct can be defined by: the construct version,
+    # this module and the modules defining the class and its bases. The
+    # cached code also depends on the python version. Classes defined in
+    # functions are not cached, as their names need not be unique.
+    qualname = owner.__qualname__
+    if '<locals>' in qualname:
+        return None
+    filenames = {__file__}
+    for cls in owner.__mro__:
+        if cls.__module__ == 'builtins':
+            continue
+        filename = getattr(sys.modules.get(cls.__module__), '__file__', None)
+        if not filename:
+            return None
+        filenames.add(filename)
+    h = hashlib.sha1()
+    for part in (sys.implementation.cache_tag or sys.version,
+                 construct.version_string,
+                 *(_file_hash(f) for f in sorted(filenames)),
+                 owner.__module__, qualname):
+        h.update(part.encode())
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def _load_compiled(con, filename, key):
+    with open(filename, 'rb') as f:
+        code = marshal.load(f)
+    module = types.ModuleType(f"_distance_construct_{key}")
+    exec(code, module.__dict__)
+    compiled = module.compiled
+    compiled.defersubcon = con
+    compiled.module = module
+    return compiled
+
+
+def _store_compiled(compiled, filename):
+    if compiled.module.linkedinstances:
+        # The source refers to objects of this process.
+        return
+    code = compile(compiled.source, filename, 'exec')
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    tmpname = f"{filename}.{os.getpid()}.tmp"
+    with open(tmpname, 'wb') as f:
+        marshal.dump(code, f)
+    os.replace(tmpname, filename)
+
+
+def compile_construct(cls):
+
+    """Get the compiled parser of a construct fragment class.
+
+    The struct is compiled on first use. Compiled parsers of classes defined
+    at module level are cached in `cache_dir`, so they are only generated
+    once. Cached parsers are loaded by executing them, so `cache_dir` must
+    be trusted. If the struct cannot be compiled, the interpreted struct is
+    used.
+
+    Parameters
+    ----------
+    cls : subclass of BaseConstructFragment
+        The fragment class.
+
+    Returns
+    -------
+    parser : Construct
+        The compiled struct, or `cls._construct_` if it cannot be compiled.
+
+    """
+
+    owner = next(c for c in cls.__mro__ if '_construct_' in c.__dict__)
+    parser = owner._parser_
+    if parser is not None:
+        return parser
+    con = owner._construct_
+    parser = con
+    if owner._compile_ and not isinstance(con, Compiled):
+        key = _cache_key(owner) if cache_dir else None
+        filename = key and os.path.join(cache_dir, f"{key}.bin")
+        if filename and os.path.exists(filename):
+            try:
+                parser = _load_compiled(con, filename, key)
+            except Exception:
+                pass
+        if parser is con:
+            try:
+                parser = con.compile()
+            except Exception:
+                # Not compilable, e.g. because of functions in the struct.
+                pass
+            else:
+                if filename:
+                    try:
+                        _store_compiled(parser, filename)
+                    except OSError:
+                        pass
+    owner._parser_ = parser
+    return parser
+
+
+class _FixedLayout(object):
+
+    """Offsets of the fields of a struct with fixed size fields.
+
+    Attributes
+    ----------
+    fields : dict
+        Maps field names to ``(decode, offset)``. ``decode(raw, offset)``
+        returns the value of the field from the raw content of the section.
+    size : int
+        The size of all fields, excluding the tail.
+    has_tail : bool
+        Whether the last field is `Remainder`.
+
+    """
+
+    __slots__ = ('fields', 'size', 'has_tail')
+
+    def __init__(self, fields, size, has_tail):
+        self.fields = fields
+        self.size = size
+        self.has_tail = has_tail
+
+    def decode(self, raw, name):
+        decode, offset = self.fields[name]
+        return decode(raw, offset)
+
+    def decode_all(self, raw, data):
+
+        """Create a Container of all fields.
+
+        Values already contained in `data` are not decoded again.
+
+        """
+
+        result = Container()
+        for name, (decode, offset) in self.fields.items():
+            try:
+                result[name] = data[name]
+            except KeyError:
+                result[name] = decode(raw, offset)
+        for name, value in data.items():
+            if name not in result:
+                result[name] = value
+        return result
+
+
+def _decode_none(raw, offset):
+    return None
+
+
+def _decode_tail(raw, offset):
+    return raw[offset:]
+
+
+def _field_decoder(con):
+    # Get (decode, size) of a fixed size construct, or None if not supported.
+    if isinstance(con, FormatField):
+        unpack = con.packer.unpack_from
+        def decode(raw, offset):
+            return unpack(raw, offset)[0]
+        return decode, con.length
+    if (isinstance(con, Array) and isinstance(con.count, int)
+            and isinstance(con.subcon, FormatField)):
+        fmt = con.subcon.fmtstr
+        packer = struct.Struct(fmt[0] + fmt[1:] * con.count)
+        unpack = packer.unpack_from
+        def decode(raw, offset):
+            return ListContainer(unpack(raw, offset))
+        return decode, packer.size
+    if isinstance(con, Bytes) and isinstance(con.length, int):
+        length = con.length
+        def decode(raw, offset):
+            return raw[offset:offset + length]
+        return decode, length
+    if con is Pass:
+        return _decode_none, 0
+    return None
+
+
+def _fixed_layout(con, sec):
+    # Only the type information of the section is available to conditions,
+    # so the layout is valid for all sections with the same key.
+    params = Container(sec=Container(magic=sec.magic, type=sec.type,
+                                     version=sec.version))
+    params._params = params
+    context = Container(_=params, _params=params, _root=params)
+    while isinstance(con, (Renamed, Compiled)):
+        con = con.subcon if isinstance(con, Renamed) else con.defersubcon
+    if not isinstance(con, Struct):
+        return None
+    fields = {}
+    offset = 0
+    has_tail = False
+    subcons = con.subcons
+    for i, sc in enumerate(subcons):
+        name = sc.name
+        while True:
+            if isinstance(sc, (Renamed, Default)):
+                sc = sc.subcon
+            elif isinstance(sc, IfThenElse):
+                cond = sc.condfunc
+                try:
+                    cond = cond(context) if callable(cond) else cond
+                except Exception:
+                    # Depends on other fields or section attributes.
+                    return None
+                sc = sc.thensubcon if cond else sc.elsesubcon
+            else:
+                break
+        if sc is Remainder and i == len(subcons) - 1:
+            decode, size = _decode_tail, 0
+            has_tail = True
+        else:
+            field = _field_decoder(sc)
+            if field is None:
+                return None
+            decode, size = field
+        if name:
+            fields[name] = decode, offset
+        offset += size
+    return _FixedLayout(fields, offset, has_tail)
+
+
+def get_fixed_layout(cls, sec):
+
+    """Get the layout of a construct fragment class for lazy reading.
+
+    Parameters
+    ----------
+    cls : subclass of BaseConstructFragment
+        The fragment class.
+    sec : Section
+        The container section. Structs may depend on its type information.
+
+    Returns
+    -------
+    layout : _FixedLayout or None
+        The layout, or None if the struct has fields of variable size or
+        fields that depend on other fields. The result is cached by the
+        section's magic, type and version.
+
+    """
+
+    owner = next(c for c in cls.__mro__ if '_construct_' in c.__dict__)
+    layouts = owner._layouts_
+    key = sec.magic, sec.type, sec.version
+    try:
+        return layouts[key]
+    except KeyError:
+        pass
+    layout = layouts[key] = _fixed_layout(owner._construct_, sec)
+    return layout
+
+
 def _get_subcons(con):
     try:
         return con.subcons
@@ -74,6 +402,9 @@ class ConstructMeta(type):
 
     def __init__(cls, name, bases, dct):
         super().__init__(name, bases, dct)
+        if '_construct_' in dct:
+            cls._parser_ = None
+            cls._layouts_ = {}
         if cls._construct_ is not None:
             attrs = {}
             for con in _get_subcons(cls._construct_):
@@ -101,13 +432,57 @@ class BaseConstructFragment(Fragment, metaclass=ConstructMeta):
     Subclasses need to override the `_construct_` attribute with the Struct that
     defines the fragment.
 
+    Reading uses the compiled struct, see `compile_construct`. Subclasses can
+    set `_compile_` to False to always use the interpreted struct. Writing
+    always uses the interpreted struct.
+
+    If all fields of the struct have a fixed size for the read section (see
+    `get_fixed_layout`), reading only stores the raw data. Fields are then
+    decoded on first access, and `data` is created on first access of that.
+    Subclasses can set `_lazy_` to False to always parse the whole struct.
+
     """
 
-    __slots__ = ('data',)
+    __slots__ = ('_data', '_lazy')
 
     # to be overridden by subclasses
     _construct_ = None
 
+    _compile_ = True
+
+    _lazy_ = True
+
+    _parser_ = None
+
+    _layouts_ = {}
+
+    @property
+    def data(self):
+        "Container of the values of the construct fields."
+        if self._lazy is not None:
+            raw, layout = self._lazy
+            self._data = layout.decode_all(raw, self._data)
+            self._lazy = None
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._lazy = None
+
+    def _get_field(self, name):
+        data = self._data
+        lazy = self._lazy
+        if lazy is not None and name not in data:
+            raw, layout = lazy
+            try:
+                value = layout.decode(raw, name)
+            except KeyError:
+                pass
+            else:
+                data[name] = value
+        return data[name]
+
     def _init_defaults(self):
         super()._init_defaults()
         self.data = Container()
@@ -117,8 +492,10 @@ class BaseConstructFragment(Fragment, metaclass=ConstructMeta):
 
     def _read_section_data(self, dbytes, sec):
         if sec.content_size:
+            if self._lazy_ and self._read_lazy(dbytes, sec):
+                return
             try:
-                self.data = self._construct_.parse_stream(dbytes.file, sec=sec)
+                self.data = self._parse(dbytes, sec)
             except ConstructError as e:
                 self.data = Container()
                 raise ValueError from e
@@ -129,6 +506,43 @@ class BaseConstructFragment(Fragment, metaclass=ConstructMeta):
             # Data is empty - game falls back to defaults here.
             self.data = Container()
 
+    def _read_lazy(self, dbytes, sec):
+        layout = get_fixed_layout(type(self), sec)
+        if layout is None or sec.content_size < layout.size:
+            # Variable size or too short. Let the parser handle it.
+            return False
+        pos = dbytes.tell()
+        try:
+            raw = dbytes.read_bytes(
+                sec.content_size if layout.has_tail else layout.size)
+        except EOFError:
+            dbytes.seek(pos)
+            return False
+        self._data = Container()
+        self._lazy = raw, layout
+        return True
+
+    def _parse(self, dbytes, sec):
+        pos = dbytes.tell()
+        data = self._parse_stream(dbytes, sec, pos)
+        if instrument.current is not None:
+            instrument.record_read(dbytes, pos, dbytes.tell() - pos)
+        return data
+
+    def _parse_stream(self, dbytes, sec, pos):
+        parser = self._parser_
+        if parser is None:
+            parser = compile_construct(type(self))
+        con = self._construct_
+        if parser is not con:
+            try:
+                return parser.parse_stream(dbytes.file, sec=sec)
+            except Exception:
+                # Errors of compiled parsers may differ. Parse again with
+                # the interpreted struct to get its error.
+                dbytes.seek(pos)
+        return con.parse_stream(dbytes.file, sec=sec)
+
     def _write_section_data(self, dbytes, sec):
         # If data is empty, game falls back to defaults.
         if self.data:
@@ -162,7 +576,7 @@ def construct_property(cls, name, doc=None):
         doc = f"property forwarded to construct field {name!r}"
     def fget(self):
         try:
-            return self.data[name]
+            return self._get_field(name)
         except KeyError as e:
             try:
                 return cls._fields_[name]
@@ -170,7 +584,8 @@ def construct_property(cls, name, doc=None):
                 pass
             raise AttributeError from e
     def fset(self, value):
-        self.data[name] = value
+        # Other fields of lazily read data stay undecoded.
+        self._data[name] = value
     def fdel(self):
         try:
             del self.data[name]
@@ -99,6 +99,68 @@ class ObjectFilter(object):
     def print_summary(self, p):
         pass
 
+    def fused_passes(self):
+
+        """Get the passes for applying this filter with `apply_fused`.
+
+        Returns
+        -------
+        passes : list of (dict, callable or None) or None
+            Keyword arguments for `filter_any_object` for each pass over all
+            objects, and a function to call after the pass is complete.
+            None if the filter can only be used with `apply`.
+
+        """
+
+        if type(self).apply is not ObjectFilter.apply:
+            # custom apply - cannot be fused
+            return None
+        return [({}, None)]
+
+
+def _fused_filter_objects(objects, stages):
+    res = []
+    for obj in objects:
+        objs = obj,
+        for flt, kw in stages:
+            if len(objs) == 1:
+                objs = flt.filter_any_object(objs[0], flt.maxrecurse, **kw)
+            else:
+                objs = [r for o in objs
+                        for r in flt.filter_any_object(o, flt.maxrecurse, **kw)]
+        res.extend(objs)
+    return res
+
+
+def apply_fused(stages, content):
+
+    """Apply passes of several filters in a single traversal.
+
+    Each top-level object is passed through the `filter_any_object` method of
+    every stage in order, before the next object is processed. The result is
+    the same as applying the stages one after another, as long as the
+    decisions of a filter only depend on the objects it has seen before.
+    Filters that need to see all objects first (like the prepare pass of
+    `VisualizeFilter`) have to be split into separate traversals, see
+    `ObjectFilter.fused_passes`.
+
+    Parameters
+    ----------
+    stages : list of (ObjectFilter, dict)
+        The filters and keyword arguments for their `filter_any_object`.
+    content : Level or Group
+        The content to filter.
+
+    """
+
+    if isinstance(content, Level):
+        for layer in content.layers:
+            layer.objects = _fused_filter_objects(layer.objects, stages)
+    elif isinstance(content, Group):
+        content.children = _fused_filter_objects(content.children, stages)
+    else:
+        raise TypeError(f'Unknown object type: {type(content).__name__!r}')
+
 
 class DoNotApply(Exception):
 
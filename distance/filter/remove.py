@@ -28,6 +28,108 @@ def print_candidates(candidates):
     p(f"Use -n to specify candidate.")
 
 
+def _object_data(obj):
+    # Bytes of the object's section, if it is unchanged since it was read.
+    if obj._is_modified():
+        return None
+    try:
+        dbytes = obj.dbytes
+        con = obj.container
+    except AttributeError:
+        return None
+    if dbytes is None:
+        return None
+    try:
+        with dbytes:
+            dbytes.seek(con.start_pos)
+            return dbytes.read_view(con.end_pos - con.start_pos)
+    except EOFError:
+        return None
+
+
+class ObjectMatcher(object):
+
+    """Matches objects by type name and contained sections.
+
+    Type patterns without groups are combined into a single regex, and the
+    result is cached for each type name. For objects that are unmodified since they were read,
+    sections are matched by scanning the section headers of the object's
+    bytes (see `sectionindex.object_section_keys`), without reading its
+    fragments and children.
+
+    Parameters
+    ----------
+    type_patterns : list of str
+        Regexes searched in object type names.
+    sections : iterable of Section
+        Sections to match. Objects match if they or any of their children
+        contain a fragment with one of these sections.
+
+    """
+
+    def __init__(self, type_patterns=(), sections=()):
+        self.type_patterns = [re.compile(r) for r in type_patterns]
+        self.sections = {sec.to_key() for sec in sections}
+        self._type_regex = None
+        if len(self.type_patterns) == 1:
+            self._type_regex = self.type_patterns[0]
+        elif any(r.groups for r in self.type_patterns):
+            # combining would renumber groups used in backreferences
+            pass
+        elif self.type_patterns:
+            try:
+                self._type_regex = re.compile('|'.join(
+                    f'(?:{r.pattern})' for r in self.type_patterns))
+            except re.error:
+                # inline global flags cannot be combined
+                pass
+        self._type_cache = {}
+
+    @property
+    def matches_all(self):
+        "Whether every object matches (no patterns or sections given)."
+        return not self.type_patterns and not self.sections
+
+    def match_type(self, typename):
+        try:
+            return self._type_cache[typename]
+        except KeyError:
+            pass
+        regex = self._type_regex
+        if regex is not None:
+            result = regex.search(typename) is not None
+        else:
+            result = any(r.search(typename) for r in self.type_patterns)
+        self._type_cache[typename] = result
+        return result
+
+    def _match_read_sections(self, obj):
+        for sec in obj.sections:
+            if sec.to_key() in self.sections:
+                return True
+        for child in obj.children:
+            if self.match_sections(child):
+                return True
+        return False
+
+    def match_sections(self, obj):
+        data = _object_data(obj)
+        if data is None:
+            return self._match_read_sections(obj)
+        from distance.sectionindex import object_section_keys
+        return not self.sections.isdisjoint(object_section_keys(data))
+
+    def match(self, obj):
+        if self.matches_all:
+            return True
+        if self.type_patterns and self.match_type(obj.type):
+            return True
+        if self.sections:
+            if not obj.is_object_group and self.match_sections(obj):
+                return True
+        return False
+
+
 class RemoveFilter(ObjectFilter):
 
     @classmethod
@@ -51,33 +153,15 @@ class RemoveFilter(ObjectFilter):
         super().__init__(args)
         self.print_ = args.print_
         self.numbers = args.numbers
-        self.type_patterns = [re.compile(r) for r in args.type]
-        self.sections = {parse_section(arg).to_key() for arg in args.section}
+        self.matcher = ObjectMatcher(
+            args.type, [parse_section(arg) for arg in args.section])
         self.invert = args.invert
         self.num_matches = 0
         self.matches = []
         self.removed = []
 
-    def _match_sections(self, obj):
-        for sec in obj.sections:
-            if sec.to_key() in self.sections:
-                return True
-        for child in obj.children:
-            if self._match_sections(child):
-                return True
-        return False
-
     def match_props(self, obj):
-        if not self.type_patterns and not self.sections:
-            return True
-        if self.type_patterns:
-            typename = obj.type
-            if any(r.search(typename) for r in self.type_patterns):
-                return True
-        if self.sections:
-            if not obj.is_object_group and self._match_sections(obj):
-                return True
-        return False
+        return self.matcher.match(obj)
 
     def match(self, obj):
         if self.match_props(obj):
@@ -814,20 +814,24 @@ class VisualizeFilter(ObjectFilter):
             return obj,
         assert False
 
-    def apply(self, content, p=None):
-        if not super().apply(content, passnum=0):
-            return False
+    def _post_prepare(self):
         for m in self._mappers:
             m.post_prepare()
-        if not super().apply(content, passnum=1):
+
+    def apply(self, content, p=None):
+        if not super().apply(content, passnum=0):
             return False
+        self._post_prepare()
+        return super().apply(content, p=p, passnum=1)
 
-        if p:
-            p(f"Visualized objects: {self.num_visualized}")
-            if self._num_skipped:
-                self._print_skipped(p)
+    def fused_passes(self):
+        return [(dict(passnum=0), self._post_prepare),
+                (dict(passnum=1), None)]
 
-        return True
+    def print_summary(self, p):
+        p(f"Visualized objects: {self.num_visualized}")
+        if self._num_skipped:
+            self._print_skipped(p)
 
     def _print_objects(self, p, objs):
         with p.tree_children(len(objs)):
@@ -0,0 +1,147 @@
+"""Opt-in counters for reading data.
+
+Lazy sequences and fragments hide how much of a file is actually read. The
+`count_reads` context manager counts what is read while it is active:
+
+>>> from distance import Level
+>>> from distance.instrument import count_reads
+>>> with count_reads() as stats:
+...     level = Level("tests/in/level/test-straightroad.bytes")
+...     types = [o.type for o in level.layers[0].objects]
+>>> stats.inflated['LevelObject']
+6
+>>> stats.object_types['EmpireEndZone']
+1
+
+Counting is only done while a context is active. Otherwise, the cost is a
+single check per read model and per read of a `DstBytes`.
+
+"""
+
+
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter
+
+
+# innermost active ReadStats, see count_reads
+current = None
+
+
+class ReadStats(object):
+
+    """Counters of read data.
+
+    Attributes
+    ----------
+    inflated : collections.Counter
+        Number of models read (`BytesModel.read` calls) by class name. This
+        includes `Section`, every fragment class and object classes.
+    object_types : collections.Counter
+        Number of objects read by object type name.
+    bytes_read : int
+        Number of bytes read from sources.
+    seeks : int
+        Number of times reading continued at another position of a source
+        than where the previous read of that source ended.
+    read_time : float
+        Seconds spent in (outermost) `BytesModel.read` calls.
+
+    Notes
+    -----
+    `bytes_read` and `seeks` are counted for reads through the methods of
+    `DstBytes` and for construct fragments. Reads directly from the `view`
+    buffer or `file` of a `DstBytes` (like `sectionindex.iter_sections`)
+    are not counted.
+
+    """
+
+    def __init__(self):
+        from distance.base import BaseObject
+        self._object_class = BaseObject
+        self.inflated = Counter()
+        self.object_types = Counter()
+        self.bytes_read = 0
+        self.seeks = 0
+        self.read_time = 0.0
+        self._depth = 0
+        self._start = None
+        # end of the last read by DstBytes
+        self._positions = {}
+
+    def __repr__(self):
+        return (f"<{type(self).__name__} inflated={sum(self.inflated.values())}"
+                f" bytes_read={self.bytes_read} seeks={self.seeks}"
+                f" read_time={self.read_time:.6f}>")
+
+    def add(self, other):
+
+        """Add the counts of another instance to this one."""
+
+        self.inflated.update(other.inflated)
+        self.object_types.update(other.object_types)
+        self.bytes_read += other.bytes_read
+        self.seeks += other.seeks
+        self.read_time += other.read_time
+
+    def _begin_read(self, model):
+        self.inflated[type(model).__name__] += 1
+        if not self._depth:
+            self._start = perf_counter()
+        self._depth += 1
+
+    def _end_read(self, model):
+        self._depth -= 1
+        if not self._depth:
+            self.read_time += perf_counter() - self._start
+        if isinstance(model, self._object_class):
+            self.object_types[getattr(model, 'type', None)] += 1
+
+
+def record_read(dbytes, start, n):
+
+    """Record reading `n` bytes at position `start` of `dbytes`.
+
+    Called by the read methods of `DstBytes` while counting is active.
+
+    """
+
+    stats = current
+    if stats is None:
+        return
+    positions = stats._positions
+    last = positions.get(dbytes)
+    if last is not None and last != start:
+        stats.seeks += 1
+    positions[dbytes] = start + n
+    stats.bytes_read += n
+
+
+@contextmanager
+def count_reads():
+
+    """Count data read while the context is active.
+
+    Contexts can be nested. Counts of an inner context are added to the
+    enclosing context on exit.
+
+    Yields
+    ------
+    stats : ReadStats
+        The counters, which are updated until the context is exited.
+
+    """
+
+    global current
+    stats = ReadStats()
+    parent = current
+    current = stats
+    try:
+        yield stats
+    finally:
+        current = parent
+        if parent is not None:
+            parent.add(stats)
+
+
+# vim:set sw=4 ts=8 sts=4 et:
@@ -160,6 +160,23 @@ class _Unset(object):
 UNSET = _Unset()
 
 
+def iter_inflated(seq):
+
+    """Iterate the values of a sequence that have been inflated already.
+
+    For lazy sequences, only the values that have been accessed before are
+    yielded, without inflating any new values. For any other sequence, all
+    values are yielded.
+
+    """
+
+    if isinstance(seq, LazyMappedSequence):
+        return (v for v in seq._list if v is not UNSET)
+    if isinstance(seq, LazySequence):
+        return iter(seq._list)
+    return iter(seq)
+
+
 class LazyMappedSequence(BaseLazySequence):
 
     """Lazy sequence yielding content of a sequence mapped by a function.
@@ -183,8 +183,10 @@ def need_counters(p):
         return
     c = Counters()
     p.counters = c
-    yield c
-    del p.counters
+    try:
+        yield c
+    finally:
+        del p.counters
 
 
 def print_objects(p, children):
@@ -0,0 +1,526 @@
+"""Fast scanning of section headers and random access into files."""
+
+
+import os
+import struct
+from array import array
+from collections import OrderedDict, namedtuple
+
+from .bytes import (
+    DstBytes, Section,
+    Magic, S_SEC_BASE, S_UINT, S_UINT2, S_UINT3,
+    SKIP_BYTES, NAME_TABLE, decode_str,
+)
+
+
+_MAGIC_2 = Magic[2]
+_MAGIC_3 = Magic[3]
+_MAGIC_5 = Magic[5]
+_MAGIC_6 = Magic[6]
+_MAGIC_7 = Magic[7]
+_MAGIC_8 = Magic[8]
+_MAGIC_9 = Magic[9]
+_MAGIC_32 = Magic[32]
+
+# type of the ObjectFragment container, which contains the list of children
+_OBJECT_FRAG_TYPE = 1
+
+# sections skipped by _scan_objects
+_OTHER_MAGICS = (_MAGIC_2, _MAGIC_3, _MAGIC_5, _MAGIC_8, _MAGIC_32)
+
+_SCAN_ERRORS = (struct.error, ValueError, IndexError, EOFError)
+
+
+def _transform_end(buf, pos):
+    # Transform is pos (3f), rot (4f) and scale (3f), each of which may be
+    # replaced by SKIP_BYTES.
+    for size in (12, 16, 12):
+        if buf[pos:pos + 4] == SKIP_BYTES:
+            pos += 4
+        else:
+            pos += size
+    return pos
+
+
+def _layer_objects_start(buf, pos):
+    # layer flags, see Layer._read_section_data
+    flags_version, = S_UINT.unpack_from(buf, pos)
+    if flags_version == 0:
+        return pos + 7
+    elif flags_version == 1:
+        return pos + 8
+    return pos
+
+
+class SectionHeader(namedtuple('SectionHeader', (
+        'start_pos', 'end_pos', 'magic', 'type', 'version', 'id', 'count',
+        'name', 'content_start', 'depth', 'list_start'))):
+
+    """Header information of a section found by `iter_sections`.
+
+    Fields that don't exist for a section's magic are None.
+
+    Attributes
+    ----------
+    start_pos, end_pos : int
+        Start and end position of the section.
+    magic : int
+        The magic number.
+    type : int or str or None
+        Type ID for ``Magic[2]`` and ``Magic[3]``, object type name for
+        ``Magic[6]``.
+    version : int or None
+        Version for ``Magic[2]``, ``Magic[3]`` and ``Magic[9]``.
+    id : int or None
+        Section ID for ``Magic[2]``, ``Magic[3]`` and ``Magic[6]``.
+    count : int or None
+        Number of subsections for ``Magic[5]``, ``Magic[6]``, ``Magic[7]``
+        (objects of the layer) and ``Magic[9]`` (layers of the level).
+    name : str or None
+        Name for ``Magic[7]`` and ``Magic[9]``.
+    content_start : int
+        Start position of the content after the header.
+    depth : int
+        Nesting depth. Top-level sections have depth 0.
+    list_start : int
+        Start position of the first section of the list this section is part
+        of.
+
+    """
+
+    __slots__ = ()
+
+    def to_key(self, noversion=False):
+        "Create a key like `Section.to_key`."
+        magic = self.magic
+        if magic in (_MAGIC_2, _MAGIC_3):
+            return (magic, self.type, None if noversion else self.version)
+        elif magic == _MAGIC_6:
+            return (magic, self.type)
+        else:
+            return magic
+
+    def to_section(self):
+
+        """Create a `Section` with the information of this header.
+
+        Returns
+        -------
+        sec : Section
+            The section, with its position attributes set like for a read
+            section.
+
+        """
+
+        sec = Section(plain=True)
+        magic = self.magic
+        sec.magic = magic
+        if magic in (_MAGIC_2, _MAGIC_3):
+            sec.type = self.type
+            sec.version = self.version
+            sec.id = self.id
+        elif magic == _MAGIC_5:
+            sec.count = self.count
+        elif magic == _MAGIC_6:
+            sec.type = self.type
+            sec.id = self.id
+            sec.count = self.count
+        elif magic == _MAGIC_7:
+            sec.name = self.name
+            sec.count = self.count
+        elif magic == _MAGIC_9:
+            sec.name = self.name
+            sec.count = self.count
+            sec.version = self.version
+        sec.start_pos = self.start_pos
+        sec.end_pos = self.end_pos
+        sec.content_start = self.content_start
+        sec.content_size = self.end_pos - self.content_start
+        return sec
+
+
+def _scan(buf, start=0, count=-1):
+    unpack_base = S_SEC_BASE.unpack_from
+    unpack_uint = S_UINT.unpack_from
+    unpack_uint2 = S_UINT2.unpack_from
+    unpack_uint3 = S_UINT3.unpack_from
+    bufsize = len(buf)
+
+    # lists of sections pending to be scanned: [list_start, pos, remaining]
+    # The file itself is a list of unknown length.
+    stack = [[start, start, count]]
+    while stack:
+        current = stack[-1]
+        list_start, pos, remaining = current
+        if remaining == 0 or pos + 12 > bufsize:
+            stack.pop()
+            continue
+        try:
+            magic, data_size = unpack_base(buf, pos)
+            data_start = pos + 12
+            # end may exceed the buffer for truncated files; the
+            # subsections are still scanned as far as they exist.
+            end = data_start + data_size
+            typ = version = id_ = count = name = None
+            cstart = data_start
+            sublist = None
+            if magic in (_MAGIC_2, _MAGIC_3):
+                typ, version, id_ = unpack_uint3(buf, data_start)
+                cstart = data_start + 12
+                if (magic == _MAGIC_3 and typ == _OBJECT_FRAG_TYPE
+                        and end - cstart >= 12):
+                    s5pos = _transform_end(buf, cstart)
+                    if s5pos + 12 < end:
+                        sublist = s5pos, 1
+            elif magic == _MAGIC_5:
+                count, = unpack_uint(buf, data_start)
+                cstart = data_start + 4
+                sublist = cstart, count
+            elif magic == _MAGIC_6:
+                typ, cstart = decode_str(buf, data_start, NAME_TABLE)
+                id_, count = unpack_uint2(buf, cstart + 1)
+                cstart += 9
+                sublist = cstart, count
+            elif magic == _MAGIC_7:
+                name, cstart = decode_str(buf, data_start, NAME_TABLE)
+                count, = unpack_uint(buf, cstart)
+                cstart += 4
+                if end - cstart >= 4:
+                    sublist = _layer_objects_start(buf, cstart), count
+            elif magic == _MAGIC_9:
+                name, cstart = decode_str(buf, data_start)
+                count, version = unpack_uint2(buf, cstart)
+                cstart += 8
+                sublist = cstart, count + 1
+            elif magic not in (_MAGIC_8, _MAGIC_32):
+                raise ValueError(f"unknown section: {magic}")
+        except _SCAN_ERRORS:
+            # Broken or truncated data - skip the rest of this list.
+            stack.pop()
+            continue
+        current[1] = end
+        current[2] = remaining - 1
+        yield SectionHeader(pos, end, magic, typ, version, id_, count, name,
+                            cstart, len(stack) - 1, list_start)
+        if sublist is not None and sublist[1]:
+            stack.append([sublist[0], sublist[0], sublist[1]])
+
+
+def _scan_objects(buf, layers):
+    # Like _scan, but only yields level objects and their children as
+    # (start_pos, end_pos, type, depth, parent, layer, transform_start,
+    #  transform_end), where `parent` is the index of the yielded parent
+    # object or -1, and `layer` the index of the layer in `layers` or -1.
+    # Names of found layers are appended to `layers`. The transform range is
+    # empty for objects without transform.
+    unpack_base = S_SEC_BASE.unpack_from
+    unpack_uint = S_UINT.unpack_from
+    bufsize = len(buf)
+
+    # lists pending to be scanned:
+    # [pos, remaining, object depth, parent, layer, contains objects]
+    stack = [[0, -1, 0, -1, -1, True]]
+    nobjs = 0
+    while stack:
+        current = stack[-1]
+        pos, remaining, depth, parent, layer, has_objs = current
+        if remaining == 0 or pos + 12 > bufsize:
+            stack.pop()
+            continue
+        try:
+            magic, data_size = unpack_base(buf, pos)
+            data_start = pos + 12
+            end = data_start + data_size
+            sublist = None
+            if magic == _MAGIC_6:
+                typ, cstart = decode_str(buf, data_start, NAME_TABLE)
+                count, = unpack_uint(buf, cstart + 5)
+                cstart += 9
+            elif magic == _MAGIC_7:
+                name, cstart = decode_str(buf, data_start, NAME_TABLE)
+                count, = unpack_uint(buf, cstart)
+                cstart += 4
+                if end - cstart >= 4:
+                    sublist = [_layer_objects_start(buf, cstart), count,
+                               0, -1, len(layers), True]
+                layers.append(name)
+            elif magic == _MAGIC_9:
+                name, cstart = decode_str(buf, data_start)
+                count, = unpack_uint(buf, cstart)
+                sublist = [cstart + 8, count + 1, 0, -1, -1, False]
+            elif magic not in _OTHER_MAGICS:
+                raise ValueError(f"unknown section: {magic}")
+        except _SCAN_ERRORS:
+            stack.pop()
+            continue
+        current[0] = end
+        current[1] = remaining - 1
+        if magic == _MAGIC_6 and has_objs:
+            tstart = tend = end
+            fpos = cstart
+            try:
+                for _ in range(count):
+                    fmagic, fsize = unpack_base(buf, fpos)
+                    fend = fpos + 12 + fsize
+                    if (fmagic == _MAGIC_3
+                            and unpack_uint(buf, fpos + 12)[0]
+                                == _OBJECT_FRAG_TYPE):
+                        tstart = fpos + 24
+                        tend = fend
+                        if tend - tstart >= 12:
+                            s5pos = _transform_end(buf, tstart)
+                            if s5pos + 12 < tend:
+                                ccount, = unpack_uint(buf, s5pos + 12)
+                                sublist = [s5pos + 16, ccount, depth + 1,
+                                           nobjs, layer, True]
+                        break
+                    fpos = fend
+            except _SCAN_ERRORS:
+                pass
+            yield (pos, end, typ, depth, parent, layer, tstart, tend)
+            nobjs += 1
+        if sublist is not None and sublist[1]:
+            stack.append(sublist)
+
+
+def _get_buffer(source):
+    dbytes = DstBytes.from_arg(source)
+    buf = dbytes.view
+    if buf is None:
+        with dbytes:
+            dbytes.seek(0)
+            buf = dbytes.file.read()
+    return buf
+
+
+def iter_sections(source):
+
+    """Iterate the headers of all sections in the given source.
+
+    Only the section headers are read. The content of sections is skipped,
+    except for the few bytes needed to find nested sections (the transform
+    of objects and the flags of layers). No objects or fragments are created,
+    which makes this a lot faster than reading the file.
+
+    Sections are yielded in file order (depth-first). If a section header is
+    broken or truncated, the remaining sections of its list are skipped. For
+    truncated files, `end_pos` of the enclosing sections is beyond the end
+    of the file.
+
+    Parameters
+    ----------
+    source : see DstBytes.from_arg
+        The source to scan. The whole file is scanned, regardless of the
+        current position.
+
+    Yields
+    ------
+    header : SectionHeader
+        The header of each section.
+
+    """
+
+    return _scan(_get_buffer(source))
+
+
+def object_section_keys(data):
+
+    """Collect the section keys of an object and its children.
+
+    Only the section headers are scanned, like with `iter_sections`. The
+    result contains the key (see `Section.to_key`) of the container of every
+    fragment of the object and of all of its (nested) children, which is the
+    same as collecting ``sec.to_key()`` for ``obj.sections`` of every object
+    in the tree, without reading any fragments.
+
+    Parameters
+    ----------
+    data : bytes-like
+        The bytes of the object's ``Magic[6]`` section.
+
+    Returns
+    -------
+    keys : set
+        The section keys.
+
+    """
+
+    keys = set()
+    # magics of the enclosing sections of the current header
+    magics = []
+    for header in _scan(data, 0, 1):
+        depth = header.depth
+        del magics[depth:]
+        if depth and magics[-1] == _MAGIC_6:
+            keys.add(header.to_key())
+        magics.append(header.magic)
+    return keys
+
+
+_cache = OrderedDict()
+
+
+class SectionIndex(object):
+
+    """Positions of all sections within a file.
+
+    The index is created by scanning only the headers of sections, skipping
+    their content. It can then be attached to a `DstBytes` via its
+    `section_index` attribute. Lazy sequences of objects and fragments read
+    from such a `DstBytes` seek directly to the requested element, instead of
+    reading all preceding elements first.
+
+    Attributes
+    ----------
+    starts : array of int
+        Start positions of sections.
+    ends : array of int
+        End positions of sections.
+    magics : array of int
+        Magic numbers of sections.
+    types : list of int or str or None
+        Type of sections. Type IDs for ``Magic[2]`` and ``Magic[3]``, object
+        type names for ``Magic[6]``, None otherwise.
+    ids : array of int
+        Section IDs, or -1 for sections without ID.
+
+    """
+
+    cache_size = 16
+
+    def __init__(self):
+        self.starts = array('Q')
+        self.ends = array('Q')
+        self.magics = array('I')
+        self.types = []
+        self.ids = array('q')
+        self._lists = {}
+
+    @classmethod
+    def scan(cls, source):
+
+        """Create a new index by scanning the given source.
+
+        Parameters
+        ----------
+        source : see DstBytes.from_arg
+            The source to scan. The whole file is scanned, regardless of the
+            current position.
+
+        """
+
+        index = cls()
+        starts = index.starts
+        ends = index.ends
+        magics = index.magics
+        types = index.types
+        ids = index.ids
+        lists = index._lists
+        for header in iter_sections(source):
+            start = header.start_pos
+            try:
+                lists[header.list_start].append(start)
+            except KeyError:
+                lists[header.list_start] = array('Q', (start,))
+            starts.append(start)
+            ends.append(header.end_pos)
+            magics.append(header.magic)
+            types.append(header.type)
+            id_ = header.id
+            ids.append(-1 if id_ is None else id_)
+        return index
+
+    @classmethod
+    def for_file(cls, filename):
+
+        """Get the index of the given file.
+
+        Indices are cached by file name, modification time and size, so
+        repeated calls for an unmodified file don't rescan it. The number of
+        cached indices is limited by `cache_size`.
+
+        Parameters
+        ----------
+        filename : str or bytes
+            The file name.
+
+        """
+
+        st = os.stat(filename)
+        key = (os.path.abspath(filename), st.st_mtime_ns, st.st_size)
+        try:
+            index = _cache[key]
+        except KeyError:
+            pass
+        else:
+            _cache.move_to_end(key)
+            return index
+        index = cls.scan(DstBytes.from_mmap(filename))
+        _cache[key] = index
+        while len(_cache) > cls.cache_size:
+            _cache.popitem(last=False)
+        return index
+
+    @classmethod
+    def open(cls, filename, *, mmap=False):
+
+        """Open a file for reading with its index attached.
+
+        Parameters
+        ----------
+        filename : str or bytes
+            The file name.
+        mmap : bool
+            If True, the file is opened with `DstBytes.from_mmap`. Otherwise,
+            `DstBytes.from_arg` is used.
+
+        Returns
+        -------
+        dbytes : DstBytes
+            The opened file with the `section_index` attribute set.
+
+        """
+
+        index = cls.for_file(filename)
+        if mmap:
+            dbytes = DstBytes.from_mmap(filename)
+        else:
+            dbytes = DstBytes.from_arg(filename)
+        dbytes.section_index = index
+        return dbytes
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} of {len(self)} sections>"
+
+    def list_positions(self, start_pos, n):
+
+        """Get the positions of a list of sections.
+
+        Parameters
+        ----------
+        start_pos : int
+            The start position of the first section of the list.
+        n : int
+            The expected length of the list.
+
+        Returns
+        -------
+        positions : sequence of int or None
+            The start positions of the sections of the list, or None if the
+            index doesn't contain a list of at least `n` sections starting at
+            `start_pos`.
+
+        """
+
+        positions = self._lists.get(start_pos)
+        if positions is None or len(positions) < n:
+            return None
+        if len(positions) > n:
+            return positions[:n]
+        return positions
+
+
+# vim:set sw=4 ts=8 sts=4 et:
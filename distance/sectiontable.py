@@ -0,0 +1,273 @@
+"""Columnar table of the sections of a file."""
+
+
+from array import array
+
+import numpy as np
+
+from .bytes import Magic
+from .sectionindex import SectionHeader, iter_sections
+
+
+_MAGIC_6 = Magic[6]
+_MAGIC_7 = Magic[7]
+_MAGIC_9 = Magic[9]
+
+_NAMED_MAGICS = (_MAGIC_7, _MAGIC_9)
+
+
+DTYPE = np.dtype([
+    ('offset', '<u8'),
+    ('size', '<u8'),
+    ('content_start', '<u8'),
+    ('magic', '<u4'),
+    ('type', '<i8'),
+    ('version', '<i8'),
+    ('id', '<i8'),
+    ('count', '<i8'),
+    ('name', '<i4'),
+    ('parent', '<i8'),
+    ('depth', '<u2'),
+])
+
+# array typecodes of the DTYPE fields, used for collecting rows
+_COLUMN_CODES = (
+    ('offset', 'Q'),
+    ('size', 'Q'),
+    ('content_start', 'Q'),
+    ('magic', 'I'),
+    ('type', 'q'),
+    ('version', 'q'),
+    ('id', 'q'),
+    ('count', 'q'),
+    ('name', 'i'),
+    ('parent', 'q'),
+    ('depth', 'H'),
+)
+
+
+class SectionTable(object):
+
+    """Columnar (struct of arrays) table of all sections in a file.
+
+    Each row of the table describes one section. Rows are stored in file
+    order (depth-first) in a numpy structured array, so many sections can be
+    held without creating a Python object for each of them.
+
+    Integer fields that don't exist for a section's magic are set to -1.
+    Strings (object type names of ``Magic[6]`` sections and names of
+    ``Magic[7]`` and ``Magic[9]`` sections) are stored once in `names` and
+    referenced by index in the ``name`` column. For ``Magic[6]`` sections,
+    ``type`` is -1 and ``name`` refers to the object type name.
+
+    Attributes
+    ----------
+    rows : numpy.ndarray
+        The table, with the fields of `DTYPE`: ``offset`` (start position of
+        the section), ``size`` (total size including the header),
+        ``content_start``, ``magic``, ``type``, ``version``, ``id``,
+        ``count``, ``name``, ``parent`` (row index of the enclosing section,
+        or -1) and ``depth``.
+    names : list of str
+        Strings referenced by the ``name`` column.
+
+    """
+
+    def __init__(self, rows, names):
+        self.rows = rows
+        self.names = names
+        self._name_indices = {n: i for i, n in enumerate(names)}
+
+    @classmethod
+    def from_file(cls, source):
+
+        """Create a table by scanning the given source.
+
+        Only section headers are read, see `sectionindex.iter_sections`.
+
+        Parameters
+        ----------
+        source : see DstBytes.from_arg
+            The source to scan.
+
+        """
+
+        names = []
+        name_indices = {}
+        # columns of the table, in order of DTYPE
+        columns = {name: array(code) for name, code in _COLUMN_CODES}
+        offsets = columns['offset']
+        sizes = columns['size']
+        content_starts = columns['content_start']
+        magics = columns['magic']
+        types = columns['type']
+        versions = columns['version']
+        ids = columns['id']
+        counts = columns['count']
+        name_col = columns['name']
+        parents = columns['parent']
+        depths = columns['depth']
+        # index of the last row of each depth
+        last_at_depth = []
+        for header in iter_sections(source):
+            depth = header.depth
+            del last_at_depth[depth:]
+            parent = last_at_depth[-1] if depth else -1
+            last_at_depth.append(len(offsets))
+            magic = header.magic
+            if magic == _MAGIC_6:
+                name = header.type
+                typ = -1
+            else:
+                name = header.name if magic in _NAMED_MAGICS else None
+                typ = header.type
+            if name is None:
+                name_index = -1
+            else:
+                try:
+                    name_index = name_indices[name]
+                except KeyError:
+                    name_index = name_indices[name] = len(names)
+                    names.append(name)
+            offsets.append(header.start_pos)
+            sizes.append(header.end_pos - header.start_pos)
+            content_starts.append(header.content_start)
+            magics.append(magic)
+            types.append(-1 if typ is None else typ)
+            versions.append(-1 if header.version is None else header.version)
+            ids.append(-1 if header.id is None else header.id)
+            counts.append(-1 if header.count is None else header.count)
+            name_col.append(name_index)
+            parents.append(parent)
+            depths.append(depth)
+        rows = np.empty(len(offsets), dtype=DTYPE)
+        for name, col in columns.items():
+            rows[name] = np.frombuffer(col, dtype=col.typecode)
+        return cls(rows, names)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} of {len(self)} sections>"
+
+    def mask(self, magic=None, type=None, version=None, id=None,
+             depth=None, parent=None):
+
+        """Create a boolean mask of rows matching the given values.
+
+        Parameters
+        ----------
+        magic, version, id, depth, parent : int or None
+            If not None, only rows with the given value match.
+        type : int or str or None
+            If not None, only rows with the given type match. A str matches
+            the object type name of ``Magic[6]`` sections.
+
+        Returns
+        -------
+        mask : numpy.ndarray of bool
+            True for every matching row.
+
+        """
+
+        rows = self.rows
+        mask = np.ones(len(rows), dtype=bool)
+        if magic is not None:
+            mask &= rows['magic'] == magic
+        if type is not None:
+            if isinstance(type, str):
+                mask &= rows['magic'] == _MAGIC_6
+                mask &= rows['name'] == self._name_indices.get(type, -2)
+            else:
+                mask &= rows['type'] == type
+        if version is not None:
+            mask &= rows['version'] == version
+        if id is not None:
+            mask &= rows['id'] == id
+        if depth is not None:
+            mask &= rows['depth'] == depth
+        if parent is not None:
+            mask &= rows['parent'] == parent
+        return mask
+
+    def select(self, *args, **kw):
+
+        """Find the indices of rows matching the given values.
+
+        Accepts the same arguments as `mask`.
+
+        Returns
+        -------
+        indices : numpy.ndarray of int
+            Indices of matching rows.
+
+        """
+
+        return np.flatnonzero(self.mask(*args, **kw))
+
+    def children(self, index):
+
+        """Find the indices of the direct subsections of a row.
+
+        Parameters
+        ----------
+        index : int
+            The row index of the parent section.
+
+        """
+
+        return np.flatnonzero(self.rows['parent'] == index)
+
+    def section(self, index):
+
+        """Materialize the `Section` of the given row.
+
+        Parameters
+        ----------
+        index : int
+            The row index.
+
+        Returns
+        -------
+        sec : Section
+            The section, with its position attributes set like for a read
+            section.
+
+        """
+
+        (offset, size, content_start, magic, typ, version, id_, count,
+         name, parent, depth) = self.rows[index].item()
+        name = None if name < 0 else self.names[name]
+        typ = None if typ < 0 else typ
+        if magic == _MAGIC_6:
+            typ = name
+            name = None
+        header = SectionHeader(
+            offset, offset + size, magic, typ,
+            None if version < 0 else version,
+            None if id_ < 0 else id_,
+            None if count < 0 else count,
+            name, content_start, depth, None)
+        return header.to_section()
+
+    def sections(self, indices):
+
+        """Materialize the `Section` of each given row.
+
+        Parameters
+        ----------
+        indices : iterable of int
+            The row indices, for example as returned by `select`.
+
+        Returns
+        -------
+        sections : list of Section
+            The sections.
+
+        """
+
+        return [self.section(i) for i in indices]
+
+
+# vim:set sw=4 ts=8 sts=4 et:
@@ -41,6 +41,484 @@ def rotpointrev(rot, point):
     return res.imag
 
 
+def quat_mul(a, b):
+
+    """Hamilton product of arrays of xyzw-quaternions.
+
+    Parameters
+    ----------
+    a, b : array_like of shape (..., 4)
+        The quaternions. Broadcast against each other.
+
+    Returns
+    -------
+    product : ndarray of shape (..., 4)
+        The products ``a * b``.
+
+    """
+
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    ax, ay, az, aw = np.moveaxis(a, -1, 0)
+    bx, by, bz, bw = np.moveaxis(b, -1, 0)
+    return np.stack([aw*bx + ax*bw + ay*bz - az*by,
+                     aw*by - ax*bz + ay*bw + az*bx,
+                     aw*bz + ax*by - ay*bx + az*bw,
+                     aw*bw - ax*bx - ay*by - az*bz], axis=-1)
+
+
+def quat_rotate(q, points):
+
+    """Rotate arrays of points by arrays of xyzw-quaternions.
+
+    Equivalent to ``(q * p / q).imag`` for each quaternion and point.
+
+    Parameters
+    ----------
+    q : array_like of shape (..., 4)
+        The rotations.
+    points : array_like of shape (..., 3)
+        The points. Broadcast against `q`.
+
+    Returns
+    -------
+    rotated : ndarray of shape (..., 3)
+        The rotated points.
+
+    """
+
+    q = np.asarray(q, dtype=float)
+    points = np.asarray(points, dtype=float)
+    u = q[..., :3]
+    w = q[..., 3:]
+    n = np.sum(q * q, axis=-1, keepdims=True)
+    f = w * w - np.sum(u * u, axis=-1, keepdims=True)
+    d = 2 * np.sum(u * points, axis=-1, keepdims=True)
+    return (f * points + d * u + 2 * w * np.cross(u, points)) / n
+
+
+def quat_rotation_matrices(q):
+
+    """Rotation matrices of arrays of xyzw-quaternions.
+
+    Parameters
+    ----------
+    q : array_like of shape (..., 4)
+        The rotations.
+
+    Returns
+    -------
+    matrices : ndarray of shape (..., 3, 3)
+        The rotation matrices.
+
+    """
+
+    q = np.asarray(q, dtype=float)
+    x, y, z, w = np.moveaxis(q, -1, 0)
+    s = 2 / np.sum(q * q, axis=-1)
+    return np.stack([
+        np.stack([1 - s*(y*y + z*z), s*(x*y - z*w), s*(x*z + y*w)], axis=-1),
+        np.stack([s*(x*y + z*w), 1 - s*(x*x + z*z), s*(y*z - x*w)], axis=-1),
+        np.stack([s*(x*z - y*w), s*(y*z + x*w), 1 - s*(x*x + y*y)], axis=-1),
+    ], axis=-2)
+
+
+def get_transforms(objs):
+
+    """Gather the effective transforms of objects into arrays.
+
+    Parameters
+    ----------
+    objs : sequence of BaseObject
+        The objects. Their `transform` property is used, so their default
+        transform needs to be known.
+
+    Returns
+    -------
+    pos, rot, scale : ndarray of shapes (N, 3), (N, 4) and (N, 3)
+        Positions, xyzw-rotations and scales of the objects.
+
+    """
+
+    transforms = [obj.transform for obj in objs]
+    n = len(transforms)
+    if not n:
+        return np.empty((0, 3)), np.empty((0, 4)), np.empty((0, 3))
+    pos, rot, scale = zip(*transforms)
+    return (np.array(pos, dtype=float).reshape(n, 3),
+            np.array(rot, dtype=float).reshape(n, 4),
+            np.array(scale, dtype=float).reshape(n, 3))
+
+
+def _default_array(defaults, index, size):
+    # NaN never compares close, so missing defaults are never stripped.
+    arr = np.full((len(defaults), size), np.nan)
+    for i, default in enumerate(defaults):
+        if default:
+            value = default[index]
+            if value:
+                arr[i] = value
+    return arr
+
+
+def set_transforms(objs, pos, rot, scale):
+
+    """Set the transforms of objects from arrays.
+
+    Like assigning the `transform` property of each object, including the
+    removal of values that are close to the object's default transform, but
+    the comparison with the defaults is vectorized.
+
+    Parameters
+    ----------
+    objs : sequence of BaseObject
+        The objects.
+    pos, rot, scale : array_like of shapes (N, 3), (N, 4) and (N, 3)
+        Positions, xyzw-rotations and scales for the objects.
+
+    """
+
+    from distance.base import Transform
+    pos = np.asarray(pos, dtype=float)
+    rot = np.asarray(rot, dtype=float)
+    scale = np.asarray(scale, dtype=float)
+    defaults = [obj.default_transform for obj in objs]
+
+    # See Transform.strip.
+    dpos = _default_array(defaults, 0, 3)
+    strip_pos = np.all(np.abs(pos - dpos) < 0.00001, axis=-1)
+    drot = _default_array(defaults, 1, 4)
+    dn = np.sum(drot * drot, axis=-1, keepdims=True)
+    quot = quat_mul(rot, drot * [-1, -1, -1, 1] / dn)
+    qn = np.sum(quot * quot, axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        angle = 2 * np.hypot(np.log(qn) / 2, np.arctan2(
+            np.linalg.norm(quot[:, :3], axis=-1), quot[:, 3]))
+    strip_rot = np.abs(angle) < 0.00001
+    dscale = _default_array(defaults, 2, 3)
+    strip_scale = np.all(np.abs(scale - dscale) < 0.00001, axis=-1)
+
+    for obj, p, r, s, sp, sr, ss in zip(
+            objs, pos.tolist(), rot.tolist(), scale.tolist(),
+            strip_pos.tolist(), strip_rot.tolist(), strip_scale.tolist()):
+        obj.real_transform = Transform(() if sp else p,
+                                       () if sr else r,
+                                       () if ss else s)
+
+
+def apply_transforms(transform, pos, rot, scale):
+
+    """Apply arrays of transforms in the reference frame of `transform`.
+
+    Vectorized equivalent of calling ``transform.apply(p, r, s)`` for each
+    row of the given arrays.
+
+    Parameters
+    ----------
+    transform : Transform
+        The *effective* reference transform.
+    pos, rot, scale : array_like of shapes (N, 3), (N, 4) and (N, 3)
+        Positions, xyzw-rotations and scales to apply.
+
+    Returns
+    -------
+    pos, rot, scale : ndarray
+        The resulting arrays.
+
+    Raises
+    ------
+    TransformError
+        If any rotation is incompatible with the reference scale.
+
+    """
+
+    from distance.base import TransformError
+    if not transform.is_effective:
+        raise TypeError('need effective transform')
+    mpos, mrot, mscale = (np.asarray(v, dtype=float) for v in transform)
+    rpos, rrot, rscale, bad = _compose(mpos, mrot, mscale, pos, rot, scale)
+    if np.any(bad):
+        raise TransformError('Incompatible rotation and scale')
+    return rpos, rrot, rscale
+
+
+def _compose(mpos, mrot, mscale, pos, rot, scale):
+    # Vectorized Transform.apply. The reference transform can be given per
+    # row. Rows with incompatible rotation and scale are flagged in `bad`.
+    pos = np.asarray(pos, dtype=float)
+    rot = np.asarray(rot, dtype=float)
+    scale = np.asarray(scale, dtype=float)
+
+    # See Transform.apply: find the reference scale axis of each axis.
+    absmat = np.abs(quat_rotation_matrices(rot))
+    is_one = np.abs(1 - absmat) < 0.00001
+    nonzero = absmat >= 0.00001
+    scale_eq = np.abs(mscale[..., :, None] - mscale[..., None, :]) < 0.00001
+    bad = np.any(nonzero & ~is_one & ~scale_eq, axis=(-2, -1))
+    # last non-zero column of each row
+    scaleaxes = 2 - np.argmax(nonzero[..., ::-1], axis=-1)
+
+    rpos = mpos + quat_rotate(mrot, pos * mscale)
+    rrot = quat_mul(mrot, rot)
+    rscale = np.take_along_axis(
+        np.broadcast_to(mscale, scaleaxes.shape), scaleaxes, axis=-1) * scale
+    return rpos, rrot, rscale, bad
+
+
+OBJECT_DTYPE = np.dtype([
+    ('offset', '<u8'),
+    ('type', '<i4'),
+    ('parent', '<i8'),
+    ('layer', '<i4'),
+    ('depth', '<u2'),
+])
+
+
+class TransformTable(object):
+
+    """Transforms of all objects of a file in arrays.
+
+    Rows are stored in file order (depth-first), so the parent of an object
+    always precedes it.
+
+    Attributes
+    ----------
+    objects : numpy.ndarray
+        The object index, with the fields of `OBJECT_DTYPE`: ``offset``
+        (start position of the object section), ``type`` (index into
+        `types`), ``parent`` (row of the object containing this object as
+        child, or -1), ``layer`` (index into `layers`, or -1) and ``depth``
+        (number of enclosing objects).
+    types : list of str
+        Object type names referenced by the ``type`` column.
+    layers : list of str
+        Layer names referenced by the ``layer`` column.
+    pos, rot, scale : ndarray of shapes (N, 3), (N, 4) and (N, 3)
+        The *effective* transforms of the objects, relative to their parent.
+        Values missing in the file are filled with the object's default
+        transform. Values missing in the file without known default are NaN.
+    defaulted : ndarray of shape (N, 3)
+        Whether position, rotation and scale are missing in the file.
+
+    """
+
+    def __init__(self, objects, types, layers, pos, rot, scale, defaulted):
+        self.objects = objects
+        self.types = types
+        self.layers = layers
+        self.pos = pos
+        self.rot = rot
+        self.scale = scale
+        self.defaulted = defaulted
+        self._global = None
+
+    def __len__(self):
+        return len(self.objects)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} of {len(self)} objects>"
+
+    def type_mask(self, type):
+
+        """Create a boolean mask of objects of the given type.
+
+        Parameters
+        ----------
+        type : str
+            The object type name.
+
+        """
+
+        try:
+            index = self.types.index(type)
+        except ValueError:
+            return np.zeros(len(self.objects), dtype=bool)
+        return self.objects['type'] == index
+
+    def global_transforms(self):
+
+        """Calculate the transforms of objects in the level's frame.
+
+        The transform of each object is applied in the frame of its parent,
+        like `Transform.apply` does for the children of groups.
+
+        Returns
+        -------
+        pos, rot, scale : ndarray of shapes (N, 3), (N, 4) and (N, 3)
+            The global transforms. Rows of objects inside parents with
+            incompatible rotation and scale are NaN, as are values depending
+            on missing values without default.
+
+        """
+
+        result = self._global
+        if result is None:
+            gpos = np.array(self.pos, dtype=float)
+            grot = np.array(self.rot, dtype=float)
+            gscale = np.array(self.scale, dtype=float)
+            depth = self.objects['depth']
+            parent = self.objects['parent']
+            for d in range(1, int(depth.max(initial=0)) + 1):
+                rows = np.flatnonzero(depth == d)
+                p = parent[rows]
+                rpos, rrot, rscale, bad = _compose(
+                    gpos[p], grot[p], gscale[p],
+                    self.pos[rows], self.rot[rows], self.scale[rows])
+                # scale axes are unknown without rotation
+                rscale[np.any(np.isnan(self.rot[rows]), axis=-1)] = np.nan
+                rpos[bad] = rrot[bad] = rscale[bad] = np.nan
+                gpos[rows] = rpos
+                grot[rows] = rrot
+                gscale[rows] = rscale
+            result = self._global = gpos, grot, gscale
+        return result
+
+
+def _decode_transforms(buf, starts, ends):
+    # Decode the transforms of ObjectFragments with content in the given
+    # ranges, see Transform.read_from.
+    from distance.base import TRANSFORM_MIN_SIZE
+    from distance.bytes import SKIP_BYTES
+    data = np.frombuffer(buf, dtype=np.uint8)
+    last = len(data) - 1
+    skip = np.frombuffer(SKIP_BYTES, dtype='<u4')[0]
+    n = len(starts)
+    values = np.full((n, 10), np.nan)
+    missing = np.ones((n, 3), dtype=bool)
+    present = ends - starts >= TRANSFORM_MIN_SIZE
+    ends = np.minimum(ends, len(data))
+    pos = starts.astype(np.int64)
+    col = 0
+    for i, size in enumerate((3, 4, 3)):
+        idx = pos[:, None] + np.arange(size * 4)
+        raw = data[np.minimum(idx, last)]
+        isskip = raw[:, :4].copy().view('<u4')[:, 0] == skip
+        valid = present & ~isskip & (pos + size * 4 <= ends)
+        missing[:, i] = ~valid
+        values[valid, col:col + size] = raw[valid].view('<f4')
+        pos += np.where(isskip, 4, size * 4)
+        col += size
+    return (values[:, :3].copy(), values[:, 3:7].copy(), values[:, 7:].copy(),
+            missing)
+
+
+def read_transforms(source, classes=None, default=None):
+
+    """Read the transforms of all objects of a file.
+
+    Only section headers and the transforms of objects are read, see
+    `sectionindex.iter_sections`. No objects or fragments are created
+    (except for objects whose default transform depends on their content).
+
+    Parameters
+    ----------
+    source : see DstBytes.from_arg
+        The source to read. The whole file is scanned, regardless of the
+        current position.
+    classes : ClassesRegistry
+        The registry used to find the default transforms of objects. Default
+        is the ``DefaultClasses``.
+    default : Transform or None
+        Default transform used for objects without known default transform.
+        If None, values missing in the file are NaN for these objects.
+
+    Returns
+    -------
+    table : TransformTable
+        The transforms.
+
+    """
+
+    from distance.base import Transform
+    from distance.bytes import DstBytes, Section, Magic
+    from distance.classes import ProbeError
+    from distance.sectionindex import _get_buffer, _scan_objects
+
+    if classes is None:
+        classes = DefaultClasses
+    dbytes = DstBytes.from_arg(source)
+    buf = _get_buffer(dbytes)
+
+    layers = []
+    found = list(_scan_objects(buf, layers))
+    n = len(found)
+    columns = zip(*found) if n else ((),) * 8
+    starts, _, typs, depths, parents, obj_layers, tstarts, tends = columns
+
+    types = []
+    defaults = []
+    # per object: prober name for its children, indices into types and
+    # defaults
+    child_probers = []
+    type_rows = []
+    default_rows = []
+    # (prober name, type) -> (child prober name, type index, default index)
+    probed = {}
+    for start, typ, parent in zip(starts, typs, parents):
+        if parent >= 0:
+            prober_name = child_probers[parent]
+        else:
+            prober_name = 'level_objects'
+        key = prober_name, typ
+        try:
+            child_prober_name, type_index, default_index = probed[key]
+        except KeyError:
+            prober = getattr(classes, prober_name)
+            try:
+                cls = prober.probe_section(Section(Magic[6], typ))
+            except ProbeError:
+                cls = None
+            child_prober_name = getattr(
+                cls, 'child_classes_name', 'base_objects')
+            try:
+                type_index = types.index(typ)
+            except ValueError:
+                type_index = len(types)
+                types.append(typ)
+            cls_default = getattr(cls, 'default_transform', None)
+            if cls_default is None or isinstance(cls_default, Transform):
+                default_index = len(defaults)
+                defaults.append(cls_default or default)
+            else:
+                # depends on the object's content
+                default_index = None
+            probed[key] = child_prober_name, type_index, default_index
+        if default_index is None:
+            with dbytes:
+                dbytes.seek(start)
+                obj = getattr(classes, prober_name).maybe(dbytes)
+            default_index = len(defaults)
+            defaults.append(getattr(obj, 'default_transform', None)
+                            or default)
+        child_probers.append(child_prober_name)
+        type_rows.append(type_index)
+        default_rows.append(default_index)
+
+    objects = np.empty(n, dtype=OBJECT_DTYPE)
+    objects['offset'] = starts
+    objects['type'] = type_rows
+    objects['parent'] = parents
+    objects['layer'] = obj_layers
+    objects['depth'] = depths
+    pos, rot, scale, missing = _decode_transforms(
+        buf, np.array(tstarts, dtype=np.int64),
+        np.array(tends, dtype=np.int64))
+
+    # fill missing values with defaults
+    dvalues = np.full((len(defaults), 10), np.nan)
+    for i, transform in enumerate(defaults):
+        if transform:
+            for col, value in zip((0, 3, 7), transform):
+                if value:
+                    dvalues[i, col:col + len(value)] = value
+    drows = dvalues[np.array(default_rows, dtype=np.intp)]
+    for i, (arr, col, size) in enumerate(((pos, 0, 3), (rot, 3, 4),
+                                          (scale, 7, 3))):
+        fill = missing[:, i]
+        arr[fill] = drows[fill, col:col + size]
+    return TransformTable(objects, types, layers, pos, rot, scale, missing)
+
+
 def vec_angle(va, vb):
     ua = normalized(va)
     ub = normalized(vb)
@@ -2,6 +2,7 @@
 
 
 import os
+import argparse
 
 
 CACHE_PATH = os.path.expanduser('~/.cache/dst')
@@ -18,6 +19,22 @@ def get_profile_filename(filename):
     return os.path.join(PROFILE_PATH, filename)
 
 
+def job_count(arg):
+
+    """Parse a number of processes for argparse.
+
+    ``0`` means the number of CPUs. Negative values are rejected.
+
+    """
+
+    value = int(arg)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative: {arg!r}")
+    if value == 0:
+        return os.cpu_count() or 1
+    return value
+
+
 def handle_pipeerror(func):
     def result(*args, **kw):
         try:
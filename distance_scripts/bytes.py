@@ -3,13 +3,150 @@
 
 import sys
 import argparse
-from io import BytesIO
+from io import BytesIO, StringIO
 
 from distance.base import Fragment
 from distance.printing import PrintContext
 from distance.classes import CompositeProber
 from distance import DefaultClasses
-from ._common import handle_pipeerror
+from distance.sectionindex import iter_sections
+from ._common import handle_pipeerror, job_count
+
+
+def print_headers(p, source):
+    for header in iter_sections(source):
+        size = header.end_pos - header.start_pos
+        p(f"{'  ' * header.depth}0x{header.start_pos:08x} (0x{size:x} bytes)"
+          f" {header.to_section()!r}")
+
+
+def make_prober():
+    return CompositeProber(
+        probers=[DefaultClasses.fragments,
+                 DefaultClasses.file],
+        baseclass=Fragment,
+    )
+
+
+def dump_file(p, prober, fname, data=None, headers=False,
+              print_filename=False):
+
+    """Print the content of one file.
+
+    The file is read from `data` if given, from stdin if `fname` is ``-``,
+    or from the file `fname` otherwise. Exceptions are printed with `p`,
+    except for `BrokenPipeError`.
+
+    Returns
+    -------
+    error : bool
+        Whether an error occurred.
+
+    """
+
+    try:
+        if print_filename:
+            p("")
+            p(f"File: {fname!r}")
+        if data is not None:
+            srcarg = BytesIO(data)
+        elif fname == '-':
+            srcarg = BytesIO(sys.stdin.buffer.read())
+        else:
+            srcarg = fname
+        if headers:
+            print_headers(p, srcarg)
+        else:
+            obj = prober.maybe(srcarg)
+            p.print_object(obj)
+    except BrokenPipeError:
+        raise
+    except Exception as e:
+        p.print_exception(e)
+        return True
+    return False
+
+
+# state of pool workers, see _init_worker
+_worker = None
+
+
+def _init_worker(flags, headers, print_filename):
+    global _worker
+    _worker = make_prober(), flags, headers, print_filename
+
+
+def _dump_job(job):
+    # Dump a file in a pool worker. Returns the output and the error status.
+    fname, data = job
+    prober, flags, headers, print_filename = _worker
+    out = StringIO()
+    p = PrintContext(file=out, flags=flags)
+    error = dump_file(p, prober, fname, data, headers=headers,
+                      print_filename=print_filename)
+    return out.getvalue(), error
+
+
+def dump_parallel(files, jobs, flags, headers=False, print_filename=False,
+                  ordered=True, file=None):
+
+    """Print the content of files using a pool of processes.
+
+    Files are parsed and formatted by worker processes. The output of each
+    file is written as soon as it is available and all preceding files have
+    been written (or as soon as it is available, if `ordered` is False).
+
+    Parameters
+    ----------
+    files : sequence of str
+        The file names. ``-`` is read from stdin.
+    jobs : int
+        Number of worker processes.
+    flags : sequence of str
+        Printing flags.
+    headers : bool
+        Only print section headers.
+    print_filename : bool
+        Print the name of each file before its content.
+    ordered : bool
+        Write output in the order of `files`.
+    file : file
+        The file to write the output to. Default is stdout.
+
+    Returns
+    -------
+    error : bool
+        Whether an error occurred for any file.
+
+    """
+
+    from multiprocessing import Pool
+
+    if file is None:
+        file = sys.stdout
+
+    def iter_jobs():
+        for fname in files:
+            if fname == '-':
+                yield fname, sys.stdin.buffer.read()
+            else:
+                yield fname, None
+
+    # Send files to workers in chunks to reduce overhead for many small
+    # files, while keeping chunks small enough to balance the load.
+    chunksize = max(1, min(16, len(files) // (jobs * 4)))
+
+    have_error = False
+    with Pool(jobs, _init_worker, (flags, headers, print_filename)) as pool:
+        if ordered:
+            results = pool.imap(_dump_job, iter_jobs(), chunksize)
+        else:
+            results = pool.imap_unordered(_dump_job, iter_jobs(), chunksize)
+        for text, error in results:
+            file.write(text)
+            file.flush()
+            have_error = have_error or error
+    return have_error
 
 
 @handle_pipeerror
@@ -19,6 +156,14 @@ def main():
     parser.add_argument("FILE", nargs='+', help=".bytes filename")
     parser.add_argument("-f", "--flags", action='append',
                         help="Add flags.")
+    parser.add_argument("-H", "--headers", action='store_true',
+                        help="Only list section headers (fast).")
+    parser.add_argument("-j", "--jobs", type=job_count, default=1,
+                        help="Number of processes for reading files"
+                        " (0 for the number of CPUs).")
+    parser.add_argument("-u", "--unordered", action='store_true',
+                        help="With --jobs, print files as soon as they"
+                        " are done instead of in the given order.")
     parser.set_defaults(flags=[])
     args = parser.parse_args()
 
@@ -37,30 +182,22 @@ def main():
 
     print_filename = 'filename' in flags or len(args.FILE) > 1
 
-    prober = CompositeProber(
-        probers=[DefaultClasses.fragments,
-                 DefaultClasses.file],
-        baseclass=Fragment,
-    )
+    jobs = min(args.jobs, len(args.FILE))
+    if jobs > 1:
+        have_error = dump_parallel(args.FILE, jobs, flags,
+                                   headers=args.headers,
+                                   print_filename=print_filename,
+                                   ordered=not args.unordered)
+        return 1 if have_error else 0
+
+    prober = make_prober()
 
     p = PrintContext(flags=flags)
 
     have_error = False
     for fname in args.FILE:
-        try:
-            if print_filename:
-                p("")
-                p(f"File: {fname!r}")
-            if fname == '-':
-                srcarg = BytesIO(sys.stdin.buffer.read())
-            else:
-                srcarg = fname
-            obj = prober.maybe(srcarg)
-            p.print_object(obj)
-        except BrokenPipeError:
-            raise
-        except Exception as e:
-            p.print_exception(e)
+        if dump_file(p, prober, fname, headers=args.headers,
+                     print_filename=print_filename):
             have_error = True
     return 1 if have_error else 0
 
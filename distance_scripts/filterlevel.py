@@ -6,10 +6,12 @@ import sys
 import argparse
 from contextlib import contextmanager
 
-from distance import DefaultClasses
+from distance import DefaultClasses, Level
+from distance.lazy import iter_inflated
 from distance.levelobjects import LevelObject
 from distance.filter import getfilter
 from distance.printing import PrintContext
+from ._common import job_count
 
 
 level_objects = DefaultClasses.level_objects
@@ -30,17 +32,315 @@ def optcontext(obj, func, *args, **kw):
             yield o
 
 
-def apply_filters(filters, content, p=None, **kw):
+class _ContentState(object):
+
+    # Level objects and read fragments of content, found without reading
+    # anything new.
+
+    def __init__(self):
+        # level objects, including objects in groups
+        self.objects = {}
+        # fragments that have been read from the source
+        self.fragments = {}
+
+    @classmethod
+    def of(cls, content, extra=()):
+        state = cls()
+        if isinstance(content, Level):
+            for layer in iter_inflated(content.layers):
+                state._walk(layer.objects, True)
+        else:
+            state._walk([content], True)
+        state._walk(extra, True)
+        return state
+
+    def _walk(self, objs, members):
+        for obj in iter_inflated(objs):
+            if members:
+                self.objects[id(obj)] = obj
+            group = members and obj.is_object_group
+            for frag in iter_inflated(getattr(obj, '_fragments', ())):
+                if getattr(frag, '_read_state', None) is not None:
+                    self.fragments[id(frag)] = frag
+                children = getattr(frag, 'children', None)
+                if children:
+                    self._walk(children, group)
+
+
+class ProfileEntry(object):
+
+    """Measurements of a single step of a filter chain.
+
+    Attributes
+    ----------
+    name : str
+        Name of the step (the filter definition).
+    time : float
+        Wall time in seconds.
+    visited : int or None
+        Number of objects passed to the filter (calls of
+        `filter_any_object`), or None for filters that don't visit objects.
+    inflated : int
+        Number of fragments read from the source.
+    created, removed : int
+        Number of level objects (including objects in groups) added and
+        removed.
+    bytes : int or None
+        Number of bytes written, or None for filters.
+
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.time = 0.0
+        self.visited = None
+        self.inflated = 0
+        self.created = 0
+        self.removed = 0
+        self.bytes = None
+
+    def to_json(self):
+        return dict(name=self.name, time=self.time, visited=self.visited,
+                    inflated=self.inflated, created=self.created,
+                    removed=self.removed, bytes=self.bytes)
+
+
+class FilterProfile(object):
+
+    """Profile of a filter chain run, see ``--profile``.
+
+    Attributes
+    ----------
+    entries : list of ProfileEntry
+        The measured steps in order.
+
+    """
+
+    def __init__(self):
+        self.entries = []
+
+    @contextmanager
+    def measure(self, name, content, flt=None):
+
+        """Measure a step applied to content.
+
+        Counting objects and fragments walks the content before and after
+        the step, which is not included in the measured time. The walk only
+        visits objects and fragments that have been read already, so reading
+        the content lazily is measured as part of the step that needs it.
+
+        Parameters
+        ----------
+        name : str
+            Name of the step.
+        content : Level or Group
+            The content modified by the step.
+        flt : filter or None
+            If it visits objects (see `ObjectFilter.fused_passes`), the
+            calls of its `filter_any_object` method are counted.
+
+        Yields
+        ------
+        entry : ProfileEntry
+            The entry of this step.
+
+        """
+
+        from time import perf_counter
+        entry = ProfileEntry(name)
+        before = _ContentState.of(content)
+        # objects passed to the filter, including ones read by this step
+        seen = dict(before.objects)
+        counted = getattr(flt, 'fused_passes', lambda: None)() is not None
+        if counted:
+            entry.visited = 0
+            orig = flt.filter_any_object
+
+            def filter_any_object(obj, *args, **kw):
+                entry.visited += 1
+                seen[id(obj)] = obj
+                return orig(obj, *args, **kw)
+
+            flt.filter_any_object = filter_any_object
+        start = perf_counter()
+        try:
+            yield entry
+        finally:
+            entry.time = perf_counter() - start
+            if counted:
+                del flt.filter_any_object
+        after = _ContentState.of(content)
+        removed = [o for i, o in seen.items() if i not in after.objects]
+        # fragments may have been read before the objects were removed
+        after = _ContentState.of(content, removed)
+        entry.inflated = len(after.fragments.keys() - before.fragments.keys())
+        # objects that are new and not read from the source
+        entry.created = sum(
+            1 for i, o in after.objects.items()
+            if i not in seen and getattr(o, '_read_state', None) is None)
+        entry.removed = len(removed)
+        self.entries.append(entry)
+
+    def print_table(self, file):
+
+        """Print the entries as a table."""
+
+        def num(value):
+            return "-" if value is None else str(value)
+
+        rows = [("Step", "Time", "Visited", "Inflated", "Created", "Removed",
+                 "Bytes")]
+        for e in self.entries:
+            rows.append((e.name, f"{e.time * 1000:.1f} ms", num(e.visited),
+                         num(e.inflated), num(e.created), num(e.removed),
+                         num(e.bytes)))
+        total = sum(e.time for e in self.entries)
+        rows.append(("total", f"{total * 1000:.1f} ms",
+                     "", "", "", "", ""))
+        width = max(len(r[0]) for r in rows)
+        widths = [max(len(r[i]) for r in rows) for i in range(1, 7)]
+        for row in rows:
+            cols = [f"{c:>{w}}" for c, w in zip(row[1:], widths)]
+            line = f"{row[0]:<{width}}  " + "  ".join(cols)
+            print(line.rstrip(), file=file)
+
+    def to_json(self):
+        return dict(steps=[e.to_json() for e in self.entries],
+                    total_time=sum(e.time for e in self.entries))
+
+    def report(self, file, json_filename=None):
+
+        """Print the table and optionally write the JSON to a file."""
+
+        print("Profile:", file=file)
+        self.print_table(file)
+        if json_filename:
+            import json
+            with open(json_filename, 'w') as f:
+                json.dump(self.to_json(), f, indent=2)
+
+
+def apply_filters(filters, content, p=None, sequential=False, profile=None):
+
+    """Apply a filter chain to the given content.
+
+    By default, consecutive filters that support it (see
+    `ObjectFilter.fused_passes`) are applied in a single traversal of the
+    objects. Filters with a custom `apply` method run on their own, after
+    all filters before them. Filters with a custom `post_filter` method end
+    the traversal, so their `post_filter` runs before any later filter is
+    applied.
+
+    Parameters
+    ----------
+    filters : list
+        The filters to apply, in order.
+    content : Level or Group
+        The content to filter.
+    p : PrintContext or None
+        Where to print the filter summaries.
+    sequential : bool
+        Apply each filter in a separate traversal.
+    profile : FilterProfile or None
+        If given, each filter is measured in a separate traversal.
+
+    Returns
+    -------
+    success : bool
+        False if a filter aborted.
+
+    """
+
     if p:
         p(f"Filters: {len(filters)}")
     with optcontext(p, 'tree_children', count=len(filters)):
-        for f in filters:
+        if sequential or profile is not None:
+            for f in filters:
+                if p:
+                    p.tree_next_child()
+                    p(f"Filter: {f.__def_string}")
+                if profile is None:
+                    ok = _apply_one(f, content, p, sequential)
+                else:
+                    with profile.measure(f.__def_string, content, f):
+                        ok = _apply_one(f, content, p, True)
+                if not ok:
+                    return False
+            return True
+        return _apply_fused(filters, content, p)
+
+
+def _apply_one(f, content, p, sequential):
+    if isinstance(f, FileFilter):
+        return f.apply(content, p=p, sequential=sequential)
+    return f.apply(content, p=p)
+
+
+def _apply_fused(filters, content, p):
+    from distance.filter.base import apply_fused
+
+    stages = []
+    # hooks to run after the pending traversal
+    afters = []
+    # filters whose last pass is pending
+    finishing = []
+    # filters whose summary still needs to be printed
+    done = []
+
+    def flush():
+        if stages:
+            apply_fused(stages, content)
+            stages.clear()
+        for func in afters:
+            func()
+        afters.clear()
+        done.extend(finishing)
+        finishing.clear()
+
+    def finish():
+        for f in done:
             if p:
                 p.tree_next_child()
                 p(f"Filter: {f.__def_string}")
-            if not f.apply(content, p=p, **kw):
+            if not f.post_filter(content):
                 return False
-    return True
+            if p:
+                f.print_summary(p)
+        done.clear()
+        return True
+
+    for f in filters:
+        passes = getattr(f, 'fused_passes', lambda: None)()
+        if passes is None:
+            flush()
+            if not finish():
+                return False
+            if p:
+                p.tree_next_child()
+                p(f"Filter: {f.__def_string}")
+            if not _apply_one(f, content, p, False):
+                return False
+            continue
+        for i, (fkw, after) in enumerate(passes):
+            if i:
+                # this pass depends on the previous one being complete
+                flush()
+            stages.append((f, fkw))
+            if after is not None:
+                afters.append(after)
+        finishing.append(f)
+        if _has_post_filter(f):
+            # may abort or change the content before later filters run
+            flush()
+            if not finish():
+                return False
+    flush()
+    return finish()
+
+
+def _has_post_filter(f):
+    from distance.filter.base import ObjectFilter
+    return type(f).post_filter is not ObjectFilter.post_filter
 
 
 class FileFilter(object):
@@ -73,11 +373,11 @@ class FileFilter(object):
                             if l and not l.startswith('#')]
         self.aborted = False
 
-    def apply(self, content, p=None, **kw):
+    def apply(self, content, p=None, sequential=False):
         if p:
             p(f"File: {self.src!r}")
-            apply_filters(self.filters, content, p=p)
-        return True
+        return apply_filters(self.filters, content, p=p,
+                             sequential=sequential)
 
 
 def make_arglist(s):
@@ -103,7 +403,7 @@ def make_arglist(s):
     return [":" + ''.join(token) for token in iter_tokens(s)]
 
 
-def create_filter(option, defaults):
+def parse_filter(option, defaults):
     name, sep, argstr = option.partition(':')
     cls = filterlevel_getfilter(name)
 
@@ -114,12 +414,247 @@ def create_filter(option, defaults):
     parser.set_defaults(**defaults)
     cls.add_args(parser)
     args = parser.parse_args(make_arglist(argstr))
+    return option, cls, args
+
 
-    flt = cls(args)
+def instantiate_filter(parsed):
+    option, cls, args = parsed
+    # Filters may modify their args. Copy them, so that the parsed filter
+    # can be instantiated again.
+    flt = cls(argparse.Namespace(**vars(args)))
     flt.__def_string = option
     return flt
 
 
+def create_filter(option, defaults):
+    return instantiate_filter(parse_filter(option, defaults))
+
+
+def read_content(srcarg):
+    content = DefaultClasses.level_like.read(srcarg)
+    is_wrapped = False
+    if isinstance(content, LevelObject) and content.type != 'Group':
+        is_wrapped = True
+        content = DefaultClasses.level_objects.create('Group', children=[content])
+    return content, is_wrapped
+
+
+def unwrap_content(content, is_wrapped):
+    if is_wrapped and len(content.children) == 1:
+        return content.children[0]
+    return content
+
+
+def find_batch_files(source):
+
+    """Find the input files for batch mode.
+
+    Parameters
+    ----------
+    source : str
+        A directory, in which case all .bytes files inside it are used, or
+        a glob pattern.
+
+    Returns
+    -------
+    filenames : list of str
+        The sorted file names.
+
+    """
+
+    import glob
+    if os.path.isdir(source):
+        source = os.path.join(glob.escape(source), '*.bytes')
+    return sorted(f for f in glob.glob(source) if os.path.isfile(f))
+
+
+class BatchResult(object):
+
+    """Outcome of filtering a single file in batch mode.
+
+    Attributes
+    ----------
+    src, dest : str
+        Input and output file names.
+    output : str
+        Text printed while filtering (the summaries of the filters).
+    error : str or None
+        Description of the failure, or None if the file has been written.
+    size : int
+        Number of bytes written.
+
+    """
+
+    def __init__(self, src, dest, output="", error=None, size=0):
+        self.src = src
+        self.dest = dest
+        self.output = output
+        self.error = error
+        self.size = size
+
+
+# state of batch workers, see _init_batch_worker
+_batch_worker = None
+
+
+def _init_batch_worker(options, defaults, write_mode, list_, sequential):
+    global _batch_worker
+    # Parse filters once per worker. The filter modules are imported on the
+    # way, and invalid definitions fail here instead of for every file.
+    parsed = [parse_filter(f, defaults) for f in options]
+    _batch_worker = parsed, write_mode, list_, sequential
+
+
+def _batch_job(job):
+    src, dest = job
+    parsed, write_mode, list_, sequential = _batch_worker
+    return filter_batch_file(parsed, src, dest, write_mode=write_mode,
+                             list_=list_, sequential=sequential)
+
+
+def filter_batch_file(parsed, src, dest, write_mode='xb', list_=False,
+                      sequential=False):
+
+    """Apply a filter chain to a single file in batch mode.
+
+    Fresh filters are created from the parsed definitions, so no state is
+    shared between files. Exceptions are caught and reported in the result.
+
+    Parameters
+    ----------
+    parsed : list
+        Filter definitions as returned by `parse_filter`.
+    src, dest : str
+        Input and output file names.
+    write_mode : str
+        Mode used for opening `dest`.
+    list_ : bool
+        Print the resulting content.
+    sequential : bool
+        Apply each filter in a separate traversal, see `apply_filters`.
+
+    Returns
+    -------
+    result : BatchResult
+
+    """
+
+    from io import StringIO
+    out = StringIO()
+    p = PrintContext(file=out, flags=('groups', 'subobjects'))
+    result = BatchResult(src, dest)
+    try:
+        filters = [instantiate_filter(f) for f in parsed]
+        content, is_wrapped = read_content(src)
+        if not apply_filters(filters, content, p=p, sequential=sequential):
+            result.error = "filter aborted"
+        else:
+            content = unwrap_content(content, is_wrapped)
+            if list_:
+                p.print_object(content)
+            result.size = content.write(dest, write_mode=write_mode)
+    except FileExistsError:
+        result.error = "output file exists, pass -f to force"
+    except Exception as e:
+        p.print_exception(e)
+        result.error = f"{type(e).__name__}: {e}"
+    result.output = out.getvalue()
+    return result
+
+
+def run_batch(prog, options, defaults, source, outdir, jobs=1,
+              force=False, list_=False, sequential=False, file=None):
+
+    """Apply a filter chain to many files.
+
+    Parameters
+    ----------
+    prog : str
+        Program name for messages.
+    options : list of str
+        The filter definitions.
+    defaults : dict
+        Default arguments for filters.
+    source : str
+        A directory or glob pattern, see `find_batch_files`.
+    outdir : str
+        The output directory. Output files have the same name as the input.
+    jobs : int
+        Number of worker processes. If 1, files are processed in this
+        process.
+    force : bool
+        Allow overwriting existing output files.
+    list_ : bool
+        Print the resulting content of each file.
+    sequential : bool
+        Apply each filter in a separate traversal, see `apply_filters`.
+    file : file
+        The file to print the report to. Default is stderr.
+
+    Returns
+    -------
+    status : int
+        The exit status.
+
+    """
+
+    if file is None:
+        file = sys.stderr
+
+    srcs = find_batch_files(source)
+    if not srcs:
+        print(f"{prog}: no input files found for {source!r}.", file=file)
+        return 1
+    dests = [os.path.join(outdir, os.path.basename(f)) for f in srcs]
+    if len(set(dests)) != len(dests):
+        print(f"{prog}: input files with the same name.", file=file)
+        return 1
+    if any(os.path.abspath(s) == os.path.abspath(d)
+           for s, d in zip(srcs, dests)):
+        print(f"{prog}: output directory contains input files.", file=file)
+        return 1
+    os.makedirs(outdir, exist_ok=True)
+
+    write_mode = 'wb' if force else 'xb'
+    initargs = options, defaults, write_mode, list_, sequential
+    jobs = min(jobs, len(srcs))
+    if jobs > 1:
+        from multiprocessing import Pool
+        pool = Pool(jobs, _init_batch_worker, initargs)
+        results = pool.imap(_batch_job, zip(srcs, dests))
+    else:
+        pool = None
+        _init_batch_worker(*initargs)
+        results = map(_batch_job, zip(srcs, dests))
+
+    failures = []
+    total = 0
+    try:
+        for i, res in enumerate(results, 1):
+            status = "failed" if res.error else f"{res.size} bytes written"
+            print(f"[{i}/{len(srcs)}] {res.src}: {status}", file=file)
+            for line in res.output.splitlines():
+                print(f"    {line}", file=file)
+            if res.error:
+                failures.append(res)
+            else:
+                total += res.size
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    print(f"Files processed: {len(srcs)}", file=file)
+    print(f"Files written: {len(srcs) - len(failures)} ({total} bytes)",
+          file=file)
+    if failures:
+        print(f"Files failed: {len(failures)}", file=file)
+        for res in failures:
+            print(f"  {res.src}: {res.error}", file=file)
+        return 1
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description=__doc__)
@@ -132,6 +667,21 @@ def main():
                         help="Specify a filter option.")
     parser.add_argument("--list", action='store_true',
                         help="Dump result listing.")
+    parser.add_argument("-b", "--batch", action='store_true',
+                        help="Filter many files: IN is a directory or glob"
+                        " pattern, OUT is the output directory.")
+    parser.add_argument("-j", "--jobs", type=job_count, default=1,
+                        help="Number of processes for batch mode"
+                        " (0 for the number of CPUs).")
+    parser.add_argument("--sequential", action='store_true',
+                        help="Apply each filter in a separate pass over all"
+                        " objects instead of combining them.")
+    parser.add_argument("--profile", action='store_true',
+                        help="Measure each filter and print a table of the"
+                        " results (implies --sequential).")
+    parser.add_argument("--profile-json", metavar='FILE',
+                        help="Write the results of --profile to FILE as"
+                        " JSON (implies --profile).")
     parser.add_argument("IN", nargs='?',
                         help="Level .bytes filename.")
     parser.add_argument("OUT", nargs='?',
@@ -139,7 +689,7 @@ def main():
     args = parser.parse_args()
 
     defaults = dict(maxrecurse=args.maxrecurse)
-    filters = [create_filter(f, defaults) for f in args.objfilters]
+    parsed = [parse_filter(f, defaults) for f in args.objfilters]
 
     if args.IN is None:
         print(f"{parser.prog}: No input file specified.", file=sys.stderr)
@@ -149,6 +699,25 @@ def main():
         print(f"{parser.prog}: No output file specified.", file=sys.stderr)
         return 1
 
+    profile = None
+    if args.profile or args.profile_json:
+        profile = FilterProfile()
+
+    if args.batch:
+        if profile is not None:
+            print(f"{parser.prog}: cannot profile in batch mode.",
+                  file=sys.stderr)
+            return 1
+        if '-' in (args.IN, args.OUT):
+            print(f"{parser.prog}: cannot use stdin or stdout in batch mode.",
+                  file=sys.stderr)
+            return 1
+        return run_batch(parser.prog, args.objfilters, defaults,
+                         args.IN, args.OUT, jobs=args.jobs, force=args.force,
+                         list_=args.list, sequential=args.sequential)
+
+    filters = [instantiate_filter(f) for f in parsed]
+
     write_mode = 'xb'
     if args.force:
         write_mode = 'wb'
@@ -162,20 +731,18 @@ def main():
         srcarg = BytesIO(sys.stdin.buffer.read())
     else:
         srcarg = args.IN
-    content = DefaultClasses.level_like.read(srcarg)
-
-    is_wrapped = False
-    if isinstance(content, LevelObject) and content.type != 'Group':
-        is_wrapped = True
-        content = DefaultClasses.level_objects.create('Group', children=[content])
+    content, is_wrapped = read_content(srcarg)
 
     p = PrintContext(file=sys.stderr, flags=('groups', 'subobjects'))
 
-    if not apply_filters(filters, content, p=p):
+    if not apply_filters(filters, content, p=p, sequential=args.sequential,
+                         profile=profile):
+        if profile is not None:
+            # report the steps up to the aborting filter
+            profile.report(sys.stderr, args.profile_json)
         return 1
 
-    if is_wrapped and len(content.children) == 1:
-        content = content.children[0]
+    content = unwrap_content(content, is_wrapped)
 
     if args.list:
         p.print_object(content)
@@ -185,8 +752,14 @@ def main():
         destarg = sys.stdout.buffer
     else:
         destarg = args.OUT
-    n = content.write(destarg, write_mode=write_mode)
+    with optcontext(profile, 'measure', "write", content) as entry:
+        n = content.write(destarg, write_mode=write_mode)
+        if entry is not None:
+            entry.bytes = n
     print(f"{n} bytes written", file=sys.stderr)
+
+    if profile is not None:
+        profile.report(sys.stderr, args.profile_json)
     return 0
 
 
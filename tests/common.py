@@ -54,6 +54,8 @@ def write_read(obj, read_func=None, do_check_exceptions=True):
         read_func = type(obj)
 
     dbytes = DstBytes.in_memory()
+    # Always test encoding instead of copying unmodified source data.
+    dbytes.copy_unmodified = False
 
     obj.write(dbytes)
     dbytes.seek(0)
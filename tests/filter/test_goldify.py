@@ -34,7 +34,8 @@ class GoldifyTest(ExtraAssertMixin, unittest.TestCase):
         self.assertEqual(1, f.num_replaced)
 
     def test_with_animator(self):
-        import numpy as np
+        import numpy as np, quaternion
+        quaternion # suppress warning
 
         l = Level("tests/in/level/old cone with anim.bytes")
         old = l.layers[0].objects[0]
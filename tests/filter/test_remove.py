@@ -2,6 +2,8 @@ from argparse import Namespace
 import unittest
 
 from distance import Level
+from distance.bytes import Magic
+from distance.lazy import UNSET, LazyMappedSequence
 from distance.filter import RemoveFilter
 
 
@@ -46,6 +48,60 @@ class RemoveTest(unittest.TestCase):
                          [o.type for o in f.removed])
         self.assertEqual(3, f.num_matches)
 
+    def test_by_type_multiple(self):
+        l = Level("tests/in/level/test-straightroad.bytes")
+
+        f = RemoveFilter(mkargs(type=["StartZone", "^Empire.*Road"]))
+        f.apply(l)
+
+        self.assertEqual(['EmpireStartZone', 'EmpireSplineRoadStraight'],
+                         [o.type for o in f.removed])
+
+    def test_by_type_inline_flags(self):
+        l = Level("tests/in/level/test-straightroad.bytes")
+
+        f = RemoveFilter(mkargs(type=["(?i)^empire.*zone", "Road"]))
+        f.apply(l)
+
+        self.assertEqual(['EmpireStartZone', 'EmpireSplineRoadStraight',
+                          'EmpireEndZone'],
+                         [o.type for o in f.removed])
+
+    def test_by_type_backreference(self):
+        l = Level("tests/in/level/test-straightroad.bytes")
+
+        f = RemoveFilter(mkargs(type=["(Zone)", r"(l)\1"]))
+        f.apply(l)
+
+        self.assertEqual(['KillGridInfinitePlane', 'EmpireStartZone',
+                          'EmpireEndZone'],
+                         [o.type for o in f.removed])
+
+    def test_by_section_not_inflated(self):
+        l = Level("tests/in/level/test-straightroad.bytes")
+
+        f = RemoveFilter(mkargs(section=["3,9,1"]))
+        f.apply(l)
+
+        for obj in l.layers[0].objects:
+            frags = obj._fragments
+            self.assertEqual([UNSET] * len(frags),
+                             [LazyMappedSequence.peek(frags, i)
+                              for i in range(len(frags))])
+
+    def test_by_section_modified(self):
+        l = Level("tests/in/level/test-straightroad.bytes")
+        for obj in l.layers[0].objects:
+            obj.fragments = [frag for frag in obj.fragments
+                             if frag.container.to_key() != (Magic[3], 9, 1)]
+
+        f = RemoveFilter(mkargs(section=["3,9,1"]))
+        f.apply(l)
+
+        # zones still match by their subobjects
+        self.assertEqual(['EmpireStartZone', 'EmpireEndZone'],
+                         [o.type for o in f.removed])
+
     def test_invert(self):
         l = Level("tests/in/level/test-straightroad.bytes")
 
@@ -189,6 +189,32 @@ class BaseObjectTest(unittest.TestCase):
         self.assertEqual(obj.fragments[-1], gsfrag)
         self.assertEqual(obj.sections[-1], gsfrag.container)
 
+    def test_lookup_after_fragments_replaced(self):
+        obj = BaseObject(type='Test')
+        obj['Object']
+        gsfrag = GoldenSimplesFragment()
+
+        obj.fragments = [gsfrag]
+
+        self.assertFalse(obj.has_any('Object'))
+        self.assertIs(obj.get_any('GoldenSimples'), gsfrag)
+
+    def test_lookup_after_fragments_appended(self):
+        obj = BaseObject(type='Test')
+        self.assertFalse(obj.has_any('GoldenSimples'))
+        gsfrag = GoldenSimplesFragment()
+
+        obj.fragments.append(gsfrag)
+
+        self.assertIs(obj['GoldenSimples'], gsfrag)
+
+    def test_lookup_first_of_duplicates(self):
+        first = GoldenSimplesFragment()
+        obj = BaseObject(type='Test')
+        obj.fragments = [first, GoldenSimplesFragment()]
+
+        self.assertIs(obj['GoldenSimples'], first)
+
     def test_getitem_after_setitem_custom_impl(self):
         obj = BaseObject()
         frag = CustomGSFragment()
@@ -1,6 +1,10 @@
 import unittest
+from io import BytesIO
+from unittest.mock import patch
 
-from distance.bytes import DstBytes, Magic, Section
+from distance import Level
+from distance.bytes import DstBytes, Magic, Section, decode_str
+from .common import check_exceptions
 
 
 class DstBytesTest(unittest.TestCase):
@@ -33,6 +37,116 @@ class DstBytesTest(unittest.TestCase):
             self.assertTrue("'b' mode" in msg, msg=f"actual message: {msg!r}")
 
 
+class DstBytesMmapTest(unittest.TestCase):
+
+    def test_read(self):
+        dbytes = DstBytes.from_mmap("tests/in/customobject/2cubes.bytes")
+
+        self.assertEqual(Magic[6], dbytes.read_uint())
+
+    def test_read_view(self):
+        dbytes = DstBytes.from_mmap("tests/in/customobject/2cubes.bytes")
+
+        view = dbytes.read_view(4)
+
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(Magic[6], int.from_bytes(view, 'little'))
+        self.assertEqual(4, dbytes.tell())
+
+    def test_read_view_eof(self):
+        dbytes = DstBytes.from_mmap("tests/in/customobject/2cubes.bytes")
+        dbytes.seek(len(dbytes.view) - 2)
+
+        self.assertRaises(EOFError, dbytes.read_view, 4)
+
+    def test_read_past_end(self):
+        dbytes = DstBytes.from_mmap("tests/in/customobject/2cubes.bytes")
+        dbytes.seek(len(dbytes.view) + 10)
+
+        self.assertRaises(EOFError, dbytes.read_bytes, 1)
+
+    def test_level(self):
+        level = Level(DstBytes.from_mmap("tests/in/level/test-straightroad.bytes"))
+        orig = Level("tests/in/level/test-straightroad.bytes")
+
+        objs = level.layers[0].objects
+        self.assertEqual([o.type for o in objs],
+                         [o.type for o in orig.layers[0].objects])
+        frag = objs[0].fragments[0]
+        self.assertIsInstance(frag.raw_data, memoryview)
+        self.assertEqual(bytes(frag.raw_data),
+                         orig.layers[0].objects[0].fragments[0].raw_data)
+
+    def test_raw_data_copied_for_file(self):
+        level = Level("tests/in/level/test-straightroad.bytes")
+
+        frag = level.layers[0].objects[0].fragments[0]
+
+        self.assertIsInstance(frag.raw_data, bytes)
+
+    def test_truncated(self):
+        level = Level.maybe(DstBytes.from_mmap(
+            "tests/in/level/test-straightroad_truncated.bytes"))
+
+        self.assertRaises(EOFError, check_exceptions, level.layers[0].objects[2])
+        self.assertRaises(EOFError, check_exceptions, level.layers[0].objects[-1])
+        self.assertEqual(len(level.layers[0].objects), 3)
+
+
+class ReadStrTest(unittest.TestCase):
+
+    LONG = "test" * 100
+    DATA = (b'\x02a\x00' + b'\xa0\x06' + "test".encode('utf-16-le') * 100
+            + b'\x02a\x00')
+
+    def sources(self, data):
+        yield DstBytes.from_data(data)
+        yield DstBytes(BytesIO(data))
+
+    def test_read(self):
+        for db in self.sources(self.DATA):
+            with self.subTest(view=db.view is not None):
+                self.assertEqual("a", db.read_str())
+                self.assertEqual(self.LONG, db.read_str())
+                self.assertEqual("a", db.read_str())
+                self.assertEqual(len(self.DATA), db.tell())
+
+    def test_truncated(self):
+        for db in self.sources(b'\x02a\x00\x04a\x00'):
+            with self.subTest(view=db.view is not None):
+                db.read_str()
+                self.assertRaises(EOFError, db.read_str)
+
+    def test_eof(self):
+        for db in self.sources(b''):
+            with self.subTest(view=db.view is not None):
+                self.assertRaises(EOFError, db.read_str)
+
+    def test_table(self):
+        for db in self.sources(self.DATA):
+            with self.subTest(view=db.view is not None):
+                table = {}
+                first = db.read_str(table)
+                db.read_str(table)
+
+                self.assertIs(first, db.read_str(table))
+                self.assertEqual(2, len(table))
+
+    def test_decode_str(self):
+        self.assertEqual(("a", 3), decode_str(self.DATA, 0))
+        self.assertEqual((self.LONG, 805),
+                         decode_str(memoryview(self.DATA), 3, {}))
+
+    def test_table_limit(self):
+        db = DstBytes.from_data(self.DATA)
+        table = {}
+        with patch('distance.bytes.NAME_TABLE_LIMIT', 1):
+            first = db.read_str(table)
+            self.assertEqual(self.LONG, db.read_str(table))
+            self.assertIs(first, db.read_str(table))
+        self.assertEqual(1, len(table))
+
+
 class SectionTest(unittest.TestCase):
 
     def test_from_key_magic9(self):
@@ -43,5 +157,28 @@ class SectionTest(unittest.TestCase):
         self.assertEqual(sec.magic, Magic[9])
         self.assertEqual(sec.name, None)
 
+    def test_to_key_after_version_change(self):
+        sec = Section(Magic[2], 0x17, 2)
+        self.assertEqual(sec.to_key(), (Magic[2], 0x17, 2))
+
+        sec.version = 10
+
+        self.assertEqual(sec.to_key(), (Magic[2], 0x17, 10))
+        self.assertEqual(sec.to_key(noversion=True), (Magic[2], 0x17, None))
+
+    def test_to_key_after_type_change(self):
+        sec = Section(Magic[6], 'Test')
+        self.assertEqual(sec.to_key(), (Magic[6], 'Test'))
+
+        sec.type = 'Other'
+
+        self.assertEqual(sec.to_key(), (Magic[6], 'Other'))
+
+    def test_to_key_read(self):
+        level = Level("tests/in/level/test-straightroad.bytes")
+        sec = level.layers[0].objects[0].fragments[0].container
+
+        self.assertEqual(sec.to_key(), (Magic[3], 1, 0))
+
 
 # vim:set sw=4 ts=8 sts=4 et:
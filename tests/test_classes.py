@@ -1,8 +1,11 @@
+import os
+import sys
+import subprocess
 import unittest
 from contextlib import contextmanager
 
 from distance.bytes import DstBytes, Magic, Section
-from distance.classes import TagError, ProbeError, ClassLookupError, ClassCollector, ClassCollection, RegisterError
+from distance.classes import TagError, ProbeError, ClassLookupError, ClassCollector, ClassCollection, CompositeProber, RegisterError
 from distance.base import Fragment, BaseObject, ObjectFragment
 from distance.levelobjects import LevelObject
 from distance import DefaultClasses, Level, Replay, Leaderboard, WorkshopLevelInfos
@@ -66,6 +69,51 @@ class ProberTest(unittest.TestCase):
         dbytes.read_bytes = raise_error
         self.assertRaises(IOError, coll.maybe, dbytes)
 
+    def test_probe_memoized(self):
+        calls = []
+        def func(sec):
+            calls.append(sec)
+            return BaseObject
+        coll = ClassCollection()
+        coll.add_func(func, 'fallback')
+
+        coll.probe_section(Section(Magic[6], 'Test'))
+        coll.probe_section(Section(Magic[6], 'Test'))
+
+        self.assertEqual(len(calls), 1)
+
+    def test_probe_error_memoized(self):
+        coll = ClassCollection(baseclass=Fragment, probe_baseclass=False)
+
+        self.assertRaises(ProbeError, coll.probe_section, Section(Magic[6], 'Test'))
+        self.assertRaises(ProbeError, coll.probe_section, Section(Magic[6], 'Test'))
+
+    def test_probe_after_register(self):
+        coll = ClassCollection(baseclass=BaseObject)
+        self.assertIs(coll.probe_section(Section(Magic[6], 'Test')), BaseObject)
+
+        coll.add_object('Test', GoldenSimple)
+
+        self.assertIs(coll.probe_section(Section(Magic[6], 'Test')), GoldenSimple)
+
+    def test_composite_probe_after_register(self):
+        coll = ClassCollection(baseclass=BaseObject)
+        prober = CompositeProber(probers=[coll], baseclass=BaseObject)
+        self.assertIs(prober.probe_section(Section(Magic[6], 'Test')), BaseObject)
+
+        coll.add_object('Test', GoldenSimple)
+
+        self.assertIs(prober.probe_section(Section(Magic[6], 'Test')), GoldenSimple)
+
+    def test_probe_cache_size(self):
+        coll = ClassCollection(baseclass=BaseObject)
+        coll.probe_cache_size = 2
+
+        for name in ('A', 'B', 'C', 'D'):
+            coll.probe_section(Section(Magic[6], name))
+
+        self.assertLessEqual(len(coll._probe_cache), 2)
+
 
 class RegisteredTest(unittest.TestCase):
 
@@ -171,6 +219,47 @@ class VerifyTest(unittest.TestCase):
                          msg="autoload module is outdated")
 
 
+class AutoloadImportTest(unittest.TestCase):
+
+    def test_import_skips_impl_modules(self):
+        env = dict(os.environ)
+        env.pop('DISTANCEUTILS_AUTOLOAD', None)
+        code = ("import sys, distance; print('\\n'.join(sys.modules))")
+        output = subprocess.run([sys.executable, '-c', code], env=env,
+                                stdout=subprocess.PIPE, check=True,
+                                universal_newlines=True).stdout
+        modules = set(output.split())
+
+        self.assertIn('distance._autoload._classes', modules)
+        for name in ('numpy', 'construct', 'distance._impl.fragments.group',
+                     'distance._impl.level_objects.objects'):
+            self.assertNotIn(name, modules)
+
+    def _import_time(self, autoload):
+        env = dict(os.environ)
+        env.pop('DISTANCEUTILS_AUTOLOAD', None)
+        if not autoload:
+            env['DISTANCEUTILS_AUTOLOAD'] = '0'
+        stderr = subprocess.run([sys.executable, '-X', 'importtime',
+                                 '-c', "import distance"], env=env,
+                                stderr=subprocess.PIPE, check=True,
+                                universal_newlines=True).stderr
+        # lines are "import time: <self us> | <cumulative us> | <module>"
+        for line in stderr.splitlines():
+            parts = line.split('|')
+            if len(parts) == 3 and parts[2].strip() == 'distance':
+                return int(parts[1]) / 1e6
+        self.fail(f"no import time for distance in {stderr!r}")
+
+    def test_import_time(self):
+        with_autoload = self._import_time(autoload=True)
+        without_autoload = self._import_time(autoload=False)
+
+        # about 0.07s with the autoload module and 0.24s without
+        self.assertLess(with_autoload, 1.0)
+        self.assertLess(with_autoload, without_autoload)
+
+
 class VerifyClassInfoTest(unittest.TestCase):
 
     def test_create_fragment(self):
@@ -1,12 +1,21 @@
+import os
+import glob
+import shutil
+import tempfile
 import unittest
+from unittest.mock import patch
 
 import construct as Con
 from construct import ConstructError, FormatFieldError
 
-from distance.bytes import DstBytes, Magic, Section, SKIP_BYTES
+from distance import DefaultClasses
+from distance.bytes import DstBytes, Magic, Section, SKIP_BYTES, S_FLOAT3
+from distance.classes import ProbeError
+from distance.sectionindex import iter_sections
+from distance import construct as construct_module
 from distance.construct import (
-    BaseConstructFragment,
-    Byte, UInt, ULong, DstString,
+    BaseConstructFragment, compile_construct, get_fixed_layout,
+    Byte, UInt, ULong, Float, DstString,
     Struct, Default, DstOptional, Remainder,
 )
 from tests.common import write_read, check_exceptions
@@ -64,6 +73,29 @@ class RemainderFragment(BaseConstructFragment):
     )
 
 
+class FixedFragment(BaseConstructFragment):
+
+    default_container = test_section
+
+    _construct_ = Struct(
+        'uint' / Default(UInt, 3),
+        'floats' / Default(Float[3], (1, 2, 3)),
+        'raw' / Con.Bytes(2),
+        'new_byte' / Default(Con.If(Con.this._params.sec.version >= 43, Byte), 0),
+        'byte' / Byte,
+        'rem' / Remainder,
+    )
+
+
+class UncompiledFragment(BaseConstructFragment):
+
+    default_container = test_section
+
+    _compile_ = False
+
+    _construct_ = SimpleFragment._construct_
+
+
 class TestFragmentTest(unittest.TestCase):
 
     def setUp(self):
@@ -375,4 +407,241 @@ class OptionalTest(unittest.TestCase):
         self.assertEqual(db.file.read(), SKIP_BYTES)
 
 
+class CompileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        patcher = patch('distance.construct.cache_dir', self.tmpdir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # start without compiled parser
+        patcher = patch.object(SimpleFragment, '_parser_', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.dbytes = db = DstBytes.in_memory()
+        with db.write_section(test_section):
+            db.write_str("a string")
+            db.write_uint(64)
+        db.seek(0)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_compiled(self):
+        parser = compile_construct(SimpleFragment)
+
+        self.assertIsInstance(parser, Con.Compiled)
+        self.assertIs(compile_construct(SimpleFragment), parser)
+        self.assertEqual(len(os.listdir(self.tmpdir)), 1)
+
+    def test_cached(self):
+        compile_construct(SimpleFragment)
+        SimpleFragment._parser_ = None
+
+        parser = compile_construct(SimpleFragment)
+        frag = SimpleFragment(self.dbytes)
+
+        self.assertTrue(parser.module.__name__.startswith('_distance_construct_'))
+        self.assertEqual(frag.first_string, "a string")
+        self.assertEqual(frag.second_uint, 64)
+
+    def test_no_cache_dir(self):
+        with patch('distance.construct.cache_dir', None):
+            parser = compile_construct(SimpleFragment)
+
+        self.assertIsInstance(parser, Con.Compiled)
+        self.assertEqual(os.listdir(self.tmpdir), [])
+
+    def test_key_depends_on_bases(self):
+        import distance.base
+        key = construct_module._cache_key(SimpleFragment)
+        hashes = dict(construct_module._file_hashes)
+        hashes[distance.base.__file__] = 'modified'
+
+        with patch.dict(construct_module._file_hashes, hashes):
+            self.assertNotEqual(construct_module._cache_key(SimpleFragment),
+                                key)
+
+    def test_local_class_not_cached(self):
+        class TestFragment(BaseConstructFragment):
+            _construct_ = Struct(
+                'uint' / UInt,
+            )
+
+        self.assertIsInstance(compile_construct(TestFragment), Con.Compiled)
+        self.assertEqual(os.listdir(self.tmpdir), [])
+
+    def test_not_compilable(self):
+        def get_size(ctx):
+            return 4
+        class TestFragment(BaseConstructFragment):
+            _construct_ = Struct(
+                'value' / Con.Bytes(get_size),
+            )
+        db = DstBytes.in_memory()
+        with db.write_section(test_section):
+            db.write_uint(3)
+        db.seek(0)
+
+        frag = TestFragment(db)
+
+        self.assertIs(compile_construct(TestFragment), TestFragment._construct_)
+        self.assertEqual(frag.value, b'\x03\0\0\0')
+
+    def test_disabled(self):
+        frag = UncompiledFragment(self.dbytes)
+
+        self.assertIs(compile_construct(UncompiledFragment),
+                      UncompiledFragment._construct_)
+        self.assertEqual(frag.first_string, "a string")
+
+    def test_subclass(self):
+        class TestFragment(SimpleFragment):
+            pass
+
+        self.assertIs(compile_construct(TestFragment),
+                      compile_construct(SimpleFragment))
+
+
+class CompiledParityTest(unittest.TestCase):
+
+    def _parse(self, parser, dbytes, sec):
+        dbytes.seek(sec.content_start)
+        try:
+            return parser.parse_stream(dbytes.file, sec=sec)
+        except Exception:
+            # error types may differ, see BaseConstructFragment._parse
+            return Exception
+
+    def test_all_fragments(self):
+        classes = set()
+        for filename in sorted(glob.glob("tests/in/**/*.bytes",
+                                         recursive=True)):
+            with open(filename, 'rb') as f:
+                dbytes = DstBytes(f)
+                for header in iter_sections(dbytes):
+                    if header.magic not in (Magic[2], Magic[3]):
+                        continue
+                    sec = header.to_section()
+                    try:
+                        cls = DefaultClasses.fragments.probe_section(sec)
+                    except ProbeError:
+                        continue
+                    if not issubclass(cls, BaseConstructFragment):
+                        continue
+                    parser = compile_construct(cls)
+                    if parser is cls._construct_:
+                        continue
+                    classes.add(cls)
+                    with self.subTest(file=filename, cls=cls.__name__,
+                                      pos=sec.start_pos):
+                        self.assertEqual(
+                            self._parse(cls._construct_, dbytes, sec),
+                            self._parse(parser, dbytes, sec))
+
+        self.assertGreater(len(classes), 10)
+
+
+class LazyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dbytes = db = DstBytes.in_memory()
+        with db.write_section(test_section):
+            db.write_uint(7)
+            db.write_bytes(S_FLOAT3.pack(4, 5, 6))
+            db.write_bytes(b'ab')
+            db.write_bytes(b'\x09')
+            db.write_bytes(b'tail')
+        db.seek(0)
+
+    def test_layout(self):
+        layout = get_fixed_layout(FixedFragment, test_section)
+
+        self.assertEqual(layout.size, 19)
+        self.assertTrue(layout.has_tail)
+        self.assertEqual(list(layout.fields),
+                         ['uint', 'floats', 'raw', 'new_byte', 'byte', 'rem'])
+
+    def test_layout_version(self):
+        sec = Section(Magic[2], 0x1337, 43)
+
+        self.assertEqual(get_fixed_layout(FixedFragment, sec).size, 20)
+
+    def test_variable(self):
+        self.assertIsNone(get_fixed_layout(SimpleFragment, test_section))
+        self.assertIsNone(get_fixed_layout(ComplexFragment, test_section))
+
+    def test_read_field(self):
+        frag = FixedFragment(self.dbytes)
+
+        self.assertEqual(frag.floats, [4, 5, 6])
+        self.assertEqual(frag._data, {'floats': [4, 5, 6]})
+        self.assertEqual(frag.byte, 9)
+        self.assertIsNone(frag.new_byte)
+        self.assertEqual(frag.rem, b'tail')
+
+    def test_data(self):
+        frag = FixedFragment(self.dbytes)
+        frag.floats
+
+        data = frag.data
+
+        self.assertEqual(list(data.items()), [
+            ('uint', 7), ('floats', [4, 5, 6]), ('raw', b'ab'),
+            ('new_byte', None), ('byte', 9), ('rem', b'tail')])
+        self.assertIsNone(frag._lazy)
+
+    def test_same_as_parse(self):
+        frag = FixedFragment(self.dbytes)
+        with patch.object(FixedFragment, '_lazy_', False):
+            self.dbytes.seek(0)
+            parsed = FixedFragment(self.dbytes)
+
+        self.assertIsNone(parsed._lazy)
+        self.assertEqual(dict(frag.data), dict(parsed.data))
+
+    def test_set_field(self):
+        frag = FixedFragment(self.dbytes)
+
+        frag.uint = 20
+
+        self.assertEqual(frag.uint, 20)
+        self.assertEqual(frag.data['uint'], 20)
+        self.assertEqual(frag.byte, 9)
+
+    def test_write_read(self):
+        frag = FixedFragment(self.dbytes)
+        frag.byte = 10
+
+        res, rdb = write_read(frag)
+
+        self.assertEqual(res.uint, 7)
+        self.assertEqual(res.byte, 10)
+        self.assertEqual(res.rem, b'tail')
+
+    def test_too_short(self):
+        db = DstBytes.in_memory()
+        with db.write_section(test_section):
+            db.write_uint(7)
+        db.seek(0)
+
+        frag = FixedFragment.maybe(db)
+
+        self.assertIsInstance(frag.exception, ValueError)
+        self.assertIsInstance(frag.exception.__cause__, ConstructError)
+
+    def test_not_lazy(self):
+        db = DstBytes.in_memory()
+        with db.write_section(test_section):
+            db.write_str("a string")
+            db.write_uint(64)
+        db.seek(0)
+
+        frag = SimpleFragment(db)
+
+        self.assertIsNone(frag._lazy)
+        self.assertEqual(frag.first_string, "a string")
+
+
 # vim:set sw=4 ts=8 sts=4 et:
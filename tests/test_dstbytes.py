@@ -0,0 +1,81 @@
+import os
+import argparse
+import unittest
+from io import StringIO
+
+from distance.printing import PrintContext
+from distance_scripts.bytes import make_prober, dump_file, dump_parallel
+from distance_scripts._common import job_count
+
+
+FILES = [
+    "tests/in/level/test-straightroad_truncated.bytes",
+    "tests/in/level/test-straightroad.bytes",
+    "tests/in/customobject/2cubes.bytes",
+    "tests/in/does-not-exist.bytes",
+    "tests/in/leaderboard/version_1.bytes",
+]
+
+
+def dump_serial(files, flags, headers=False):
+    out = StringIO()
+    p = PrintContext(file=out, flags=flags)
+    prober = make_prober()
+    have_error = False
+    for fname in files:
+        if dump_file(p, prober, fname, headers=headers, print_filename=True):
+            have_error = True
+    return out.getvalue(), have_error
+
+
+def split_files(text):
+    return sorted(part.strip() for part in text.split("\nFile: "))
+
+
+class DumpParallelTest(unittest.TestCase):
+
+    def test_ordered(self):
+        expect, expect_error = dump_serial(FILES, ['groups'])
+        out = StringIO()
+
+        have_error = dump_parallel(FILES, 2, ['groups'], print_filename=True,
+                                   file=out)
+
+        self.assertEqual(expect, out.getvalue())
+        self.assertEqual(expect_error, have_error)
+        self.assertTrue(have_error)
+
+    def test_unordered(self):
+        expect, _ = dump_serial(FILES, [])
+        out = StringIO()
+
+        dump_parallel(FILES, 3, [], print_filename=True, ordered=False,
+                      file=out)
+
+        self.assertEqual(split_files(expect), split_files(out.getvalue()))
+
+    def test_headers(self):
+        files = FILES[:2]
+        expect, _ = dump_serial(files, [], headers=True)
+        out = StringIO()
+
+        have_error = dump_parallel(files, 2, [], headers=True,
+                                   print_filename=True, file=out)
+
+        self.assertEqual(expect, out.getvalue())
+        self.assertFalse(have_error)
+
+
+class JobCountTest(unittest.TestCase):
+
+    def test_valid(self):
+        self.assertEqual(4, job_count("4"))
+
+    def test_cpus(self):
+        self.assertEqual(os.cpu_count() or 1, job_count("0"))
+
+    def test_negative(self):
+        self.assertRaises(argparse.ArgumentTypeError, job_count, "-2")
+
+
+# vim:set sw=4 ts=8 sts=4 et:
@@ -1,6 +1,16 @@
+import os
+import json
+import shutil
+import tempfile
 import unittest
+from io import StringIO, BytesIO
 
-from distance_scripts.filterlevel import make_arglist
+from distance.lazy import iter_inflated
+from distance.printing import PrintContext
+from distance_scripts.filterlevel import (
+    make_arglist, create_filter, apply_filters, read_content, unwrap_content,
+    run_batch, FilterProfile,
+)
 
 
 class SplitArgsTest(unittest.TestCase):
@@ -21,4 +31,270 @@ class SplitArgsTest(unittest.TestCase):
         self.assertEqual([":type=te:st"], make_arglist("type=te\\:st"))
 
 
+class FusedTest(unittest.TestCase):
+
+    LEVEL_DIR = "tests/in/level"
+
+    CHAINS = [
+        ['goldify', 'unkill', 'vis'],
+        ['vis', 'rm:type=Empire.*:number=0:number=2', 'goldify'],
+        ['unkill', 'settings:name=fused', 'rm:section=3:all', 'vis'],
+    ]
+
+    def filter_file(self, fname, options, sequential):
+        filters = [create_filter(f, dict(maxrecurse=-1)) for f in options]
+        content, is_wrapped = read_content(fname)
+        out = StringIO()
+        p = PrintContext(file=out, flags=('groups', 'subobjects'))
+        self.assertTrue(apply_filters(filters, content, p=p,
+                                      sequential=sequential))
+        result = BytesIO()
+        unwrap_content(content, is_wrapped).write(result)
+        return result.getvalue(), out.getvalue()
+
+    def test_same_as_sequential(self):
+        for name in sorted(os.listdir(self.LEVEL_DIR)):
+            fname = os.path.join(self.LEVEL_DIR, name)
+            for options in self.CHAINS:
+                with self.subTest(name=name, options=options):
+                    try:
+                        expected = self.filter_file(fname, options, True)
+                    except Exception as e:
+                        with self.assertRaises(type(e)):
+                            self.filter_file(fname, options, False)
+                        continue
+
+                    result = self.filter_file(fname, options, False)
+
+                    self.assertEqual(result, expected)
+
+    def test_traversals(self):
+        from distance.filter import base
+        filters = [create_filter(f, dict(maxrecurse=-1))
+                   for f in ['goldify', 'unkill', 'vis', 'rm:type=Road']]
+        content, _ = read_content("tests/in/level/test-straightroad.bytes")
+        calls = []
+        orig = base.apply_fused
+
+        def apply_fused(stages, content):
+            calls.append([(type(f).__name__, kw) for f, kw in stages])
+            return orig(stages, content)
+
+        base.apply_fused = apply_fused
+        try:
+            self.assertTrue(apply_filters(filters, content))
+        finally:
+            base.apply_fused = orig
+
+        self.assertEqual(calls, [
+            [('GoldifyFilter', {}), ('UnkillFilter', {}),
+             ('VisualizeFilter', {'passnum': 0})],
+            [('VisualizeFilter', {'passnum': 1}), ('RemoveFilter', {})],
+        ])
+
+    def test_post_filter_ends_traversal(self):
+        from distance.filter import base
+        filters = [create_filter(f, dict(maxrecurse=-1))
+                   for f in ['unkill', 'rm:type=Empire.*:print', 'goldify']]
+        content, _ = read_content("tests/in/level/test-straightroad.bytes")
+        calls = []
+        orig = base.apply_fused
+
+        def apply_fused(stages, content):
+            calls.append([type(f).__name__ for f, kw in stages])
+            return orig(stages, content)
+
+        base.apply_fused = apply_fused
+        try:
+            self.assertFalse(apply_filters(filters, content))
+        finally:
+            base.apply_fused = orig
+
+        self.assertEqual(calls, [['UnkillFilter', 'RemoveFilter']])
+
+    def test_print_aborts(self):
+        filters = [create_filter(f, dict(maxrecurse=-1))
+                   for f in ['goldify', 'rm:type=Empire.*:print']]
+        content, _ = read_content("tests/in/level/test-straightroad.bytes")
+        out = StringIO()
+        p = PrintContext(file=out, flags=('groups', 'subobjects'))
+
+        self.assertFalse(apply_filters(filters, content, p=p))
+        self.assertIn("Goldified", out.getvalue())
+        self.assertNotIn("Removed matches", out.getvalue())
+
+
+class ProfileTest(unittest.TestCase):
+
+    def test_entries(self):
+        options = ['unkill', 'rm:type=Zone', 'settings:name=profiled']
+        filters = [create_filter(f, dict(maxrecurse=-1)) for f in options]
+        content, _ = read_content("tests/in/level/test-straightroad.bytes")
+        profile = FilterProfile()
+
+        self.assertTrue(apply_filters(filters, content, profile=profile))
+        with profile.measure("write", content) as entry:
+            entry.bytes = content.write(BytesIO())
+
+        self.assertEqual(options + ["write"],
+                         [e.name for e in profile.entries])
+        unkill, rm, settings, write = profile.entries
+        self.assertEqual(6, unkill.visited)
+        self.assertEqual(6, rm.visited)
+        self.assertEqual(2, rm.removed)
+        self.assertEqual(0, rm.created)
+        self.assertIsNone(settings.visited)
+        self.assertIsNone(rm.bytes)
+        self.assertGreater(write.bytes, 0)
+
+    def test_first_step(self):
+        filters = [create_filter('rm:type=Zone', dict(maxrecurse=-1))]
+        content, _ = read_content("tests/in/level/test-straightroad.bytes")
+        profile = FilterProfile()
+
+        self.assertTrue(apply_filters(filters, content, profile=profile))
+
+        rm, = profile.entries
+        self.assertEqual(6, rm.visited)
+        self.assertEqual(2, rm.removed)
+        self.assertEqual(0, rm.created)
+
+    def test_does_not_read(self):
+        content, _ = read_content("tests/in/level/test-straightroad.bytes")
+        profile = FilterProfile()
+
+        with profile.measure("nothing", content):
+            pass
+
+        self.assertEqual([], list(iter_inflated(content.layers)))
+
+    def test_inflated(self):
+        filters = [create_filter('rm:type=Zone', dict(maxrecurse=-1)),
+                   create_filter('vis', dict(maxrecurse=-1))]
+        content, _ = read_content("tests/in/level/test-straightroad.bytes")
+        profile = FilterProfile()
+
+        self.assertTrue(apply_filters(filters, content, profile=profile))
+
+        rm, vis = profile.entries
+        self.assertEqual(0, rm.inflated)
+        self.assertGreater(vis.inflated, 0)
+
+    def test_print(self):
+        filters = [create_filter('unkill', dict(maxrecurse=-1))]
+        content, _ = read_content("tests/in/level/test-straightroad.bytes")
+        profile = FilterProfile()
+        apply_filters(filters, content, profile=profile)
+        out = StringIO()
+
+        profile.print_table(out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(["Step", "Time", "Visited", "Inflated", "Created",
+                          "Removed", "Bytes"], lines[0].split())
+        self.assertTrue(lines[1].startswith("unkill "))
+        self.assertTrue(lines[2].startswith("total "))
+        self.assertEqual(1, len(profile.to_json()['steps']))
+
+
+    def test_report_aborted(self):
+        options = ['unkill', 'rm:type=Zone:print', 'goldify']
+        filters = [create_filter(f, dict(maxrecurse=-1)) for f in options]
+        content, _ = read_content("tests/in/level/test-straightroad.bytes")
+        profile = FilterProfile()
+        out = StringIO()
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        json_filename = os.path.join(tmpdir, "profile.json")
+
+        self.assertFalse(apply_filters(filters, content, p=PrintContext(out),
+                                       profile=profile))
+        profile.report(out, json_filename)
+
+        self.assertIn("Profile:", out.getvalue())
+        with open(json_filename) as f:
+            steps = json.load(f)['steps']
+        self.assertEqual(options[:2], [s['name'] for s in steps])
+
+class BatchTest(unittest.TestCase):
+
+    FILES = [
+        "tests/in/level/test-oldsimples.bytes",
+        "tests/in/level/test-straightroad_truncated.bytes",
+        "tests/in/customobject/2cubes.bytes",
+    ]
+
+    OPTIONS = ['goldify', 'vis']
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.indir = os.path.join(self.tmpdir, "in")
+        self.outdir = os.path.join(self.tmpdir, "out")
+        os.mkdir(self.indir)
+        for fname in self.FILES:
+            shutil.copy(fname, self.indir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def filter_single(self, fname):
+        filters = [create_filter(f, dict(maxrecurse=-1)) for f in self.OPTIONS]
+        content, is_wrapped = read_content(fname)
+        self.assertTrue(apply_filters(filters, content))
+        out = os.path.join(self.tmpdir, "single.bytes")
+        unwrap_content(content, is_wrapped).write(out, write_mode='wb')
+        with open(out, 'rb') as f:
+            return f.read()
+
+    def run_batch(self, source, **kw):
+        report = StringIO()
+        status = run_batch("test", self.OPTIONS, dict(maxrecurse=-1),
+                           source, self.outdir, file=report, **kw)
+        return status, report.getvalue()
+
+    def check_outputs(self):
+        for fname in self.FILES[0], self.FILES[2]:
+            name = os.path.basename(fname)
+            with open(os.path.join(self.outdir, name), 'rb') as f:
+                self.assertEqual(self.filter_single(fname), f.read())
+
+    def test_serial(self):
+        status, report = self.run_batch(self.indir)
+
+        self.assertEqual(1, status)
+        self.assertIn("Goldified simples: 3", report)
+        self.assertIn("Files written: 2", report)
+        self.assertIn("Files failed: 1", report)
+        self.assertIn("test-straightroad_truncated.bytes: EOFError", report)
+        self.check_outputs()
+
+    def test_parallel(self):
+        status, report = self.run_batch(self.indir, jobs=2)
+
+        self.assertEqual(1, status)
+        self.assertIn("Files written: 2", report)
+        self.check_outputs()
+
+    def test_glob(self):
+        status, report = self.run_batch(os.path.join(self.indir, "*oldsimples*"))
+
+        self.assertEqual(0, status)
+        self.assertEqual(["test-oldsimples.bytes"], os.listdir(self.outdir))
+
+    def test_exists(self):
+        self.run_batch(self.indir)
+
+        status, report = self.run_batch(self.indir)
+
+        self.assertEqual(1, status)
+        self.assertIn("Files failed: 3", report)
+        self.assertIn("output file exists", report)
+
+    def test_no_files(self):
+        status, report = self.run_batch(os.path.join(self.indir, "*.nothing"))
+
+        self.assertEqual(1, status)
+        self.assertIn("no input files", report)
+
+
 # vim:set sw=4 ts=8 sts=4 et:
@@ -0,0 +1,127 @@
+import unittest
+from io import BytesIO
+
+from distance import Level
+from distance.bytes import DstBytes
+from distance.instrument import count_reads
+from distance.sectionindex import SectionIndex
+
+
+STRAIGHTROAD = "tests/in/level/test-straightroad.bytes"
+
+
+class CountReadsTest(unittest.TestCase):
+
+    def test_object_types(self):
+        with count_reads() as stats:
+            level = Level(STRAIGHTROAD)
+            types = [o.type for o in level.layers[0].objects]
+
+        self.assertEqual(6, stats.inflated['LevelObject'])
+        self.assertEqual(0, stats.inflated['ObjectFragment'])
+        self.assertEqual({t: 1 for t in types + ['LevelSettings']},
+                         dict(stats.object_types))
+        self.assertGreater(stats.bytes_read, 0)
+        self.assertGreater(stats.read_time, 0)
+
+    def test_fragments(self):
+        with count_reads() as stats:
+            level = Level(STRAIGHTROAD)
+            for obj in level.layers[0].objects:
+                obj.real_transform
+
+        self.assertEqual(6, stats.inflated['ObjectFragment'])
+
+    def test_write_unmodified(self):
+        level = Level(STRAIGHTROAD)
+        # read all objects before counting
+        level.layers[0].objects[-1]
+        with count_reads() as stats:
+            level.write(BytesIO())
+
+        self.assertEqual(0, stats.inflated['ObjectFragment'])
+        self.assertEqual(0, sum(stats.object_types.values()))
+
+    def test_random_access(self):
+        with count_reads() as sequential:
+            level = Level(STRAIGHTROAD)
+            level.layers[0].objects[-1].type
+        with count_reads() as indexed:
+            level = Level(SectionIndex.open(STRAIGHTROAD))
+            level.layers[0].objects[-1].type
+
+        self.assertEqual(1, indexed.inflated['LevelObject'])
+        self.assertLess(indexed.inflated['LevelObject'],
+                        sequential.inflated['LevelObject'])
+
+    def test_seeks(self):
+        with count_reads() as stats:
+            dbytes = DstBytes.from_data(b'\x01\x02\x03\x04\x05\x06\x07\x08')
+            dbytes.read_bytes(2)
+            dbytes.seek(2)
+            dbytes.seek(6)
+            dbytes.read_bytes(2)
+
+        self.assertEqual(1, stats.seeks)
+        self.assertEqual(4, stats.bytes_read)
+
+    def test_contiguous_reads(self):
+        with count_reads() as stats:
+            dbytes = DstBytes.from_data(b'\x01\x02\x03\x04\x05\x06')
+            dbytes.read_bytes(2)
+            dbytes.read_bytes(2)
+            dbytes.seek(0)
+            dbytes.seek(4)
+            dbytes.read_view(2)
+
+        self.assertEqual(0, stats.seeks)
+        self.assertEqual(6, stats.bytes_read)
+
+    def test_opened_before(self):
+        level = Level(STRAIGHTROAD)
+        with count_reads() as stats:
+            for obj in level.layers[0].objects:
+                obj.real_transform
+
+        self.assertEqual(6, stats.inflated['LevelObject'])
+        self.assertEqual(6, stats.inflated['ObjectFragment'])
+        self.assertGreater(stats.bytes_read, 0)
+
+    def test_mapped_opened_before(self):
+        level = Level(SectionIndex.open(STRAIGHTROAD))
+        with count_reads() as stats:
+            level.layers[0].objects[-1].type
+
+        self.assertGreater(stats.bytes_read, 0)
+
+    def test_instances_unchanged(self):
+        with count_reads():
+            dbytes = DstBytes.from_data(b'\x01\x02')
+            self.assertIn("<memory size", repr(dbytes))
+        self.assertNotIn('read_bytes', vars(dbytes))
+        with count_reads() as stats:
+            dbytes.read_bytes(2)
+
+        self.assertEqual(2, stats.bytes_read)
+
+    def test_nested(self):
+        with count_reads() as outer:
+            Level(STRAIGHTROAD).layers[0].objects[0].type
+            with count_reads() as inner:
+                Level(STRAIGHTROAD).layers[0].objects[0].type
+
+        self.assertEqual(1, inner.inflated['Level'])
+        self.assertEqual(2, outer.inflated['Level'])
+        self.assertEqual(2 * inner.bytes_read, outer.bytes_read)
+
+    def test_inactive(self):
+        with count_reads() as stats:
+            pass
+        level = Level(STRAIGHTROAD)
+        level.layers[0].objects[0].type
+
+        self.assertEqual(0, sum(stats.inflated.values()))
+        self.assertEqual(0, stats.bytes_read)
+
+
+# vim:set sw=4 ts=8 sts=4 et:
@@ -21,6 +21,17 @@ class LevelTest(unittest.TestCase):
         p = PrintContext.for_test()
         p.print_object(Level("tests/in/level/test-straightroad.bytes"))
 
+    def test_shared_names(self):
+        obj1 = Level("tests/in/level/test-oldsimples.bytes").layers[0].objects[1]
+        obj2 = Level("tests/in/level/test-oldsimples.bytes").layers[0].objects[2]
+
+        self.assertIs(obj1.type, Level("tests/in/level/test-oldsimples.bytes")
+                      .layers[0].objects[1].type)
+        col1, = obj1.fragments[1].materials['Default-Diffuse']
+        col2, = obj2.fragments[1].materials['Cone']
+        self.assertEqual(col1, '_Color')
+        self.assertIs(col1, col2)
+
     def test_truncated(self):
         level = Level.maybe("tests/in/level/test-straightroad_truncated.bytes")
         self.assertEqual(level.name, "Test-straightroad")
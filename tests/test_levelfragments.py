@@ -13,6 +13,8 @@ from distance._impl.fragments.npfragments import (
     PopupBlockerLogicFragment,
     ObjectSpawnCircleFragment,
     StructNamedProperty,
+    StringNamedProperty,
+    named_property_getter,
 )
 from distance._impl.level_objects.objects import EventTrigger
 from distance.bytes import SKIP_BYTES, DstBytes, Section, Magic, S_UINT
@@ -331,6 +333,11 @@ class TypedNamedPropertyTest(unittest.TestCase):
 
         class TestFragment(NamedPropertiesFragment):
             uint_prop = StructNamedProperty('a_uint', S_UINT, default="default")
+            str_prop = StringNamedProperty('a_str')
+
+            @named_property_getter('a_uint', default=0)
+            def doubled(self, db):
+                return db.read_uint() * 2
 
         self.frag = TestFragment()
 
@@ -354,5 +361,64 @@ class TypedNamedPropertyTest(unittest.TestCase):
         del self.frag.uint_prop
         self.assertTrue('a_uint' not in self.frag.props)
 
+    def test_str(self):
+        self.frag.str_prop = "text"
+
+        self.assertEqual(self.frag.props['a_str'], b'\x08t\0e\0x\0t\0')
+        self.assertEqual(self.frag.str_prop, "text")
+
+    def test_cached(self):
+        self.frag.props['a_str'] = b'\x02a\0'
+
+        value = self.frag.str_prop
+
+        self.assertIs(self.frag.str_prop, value)
+
+    def test_props_modified(self):
+        self.frag.props['a_uint'] = b'\x04\x00\x00\x00'
+        self.assertEqual(self.frag.uint_prop, 4)
+
+        self.frag.props['a_uint'] = b'\x05\x00\x00\x00'
+
+        self.assertEqual(self.frag.uint_prop, 5)
+
+    def test_set_cached(self):
+        self.assertEqual(self.frag.uint_prop, "default")
+
+        self.frag.uint_prop = 4
+
+        self.assertEqual(self.frag.uint_prop, 4)
+
+    def test_del_cached(self):
+        self.frag.uint_prop = 4
+        self.assertEqual(self.frag.uint_prop, 4)
+
+        del self.frag.uint_prop
+
+        self.assertEqual(self.frag.uint_prop, "default")
+
+    def test_getter(self):
+        self.frag.props['a_uint'] = b'\x04\x00\x00\x00'
+
+        self.assertEqual(self.frag.doubled, 8)
+
+    def test_getter_default(self):
+        self.assertEqual(self.frag.doubled, 0)
+
+    def test_decode_props(self):
+        self.frag.props['a_uint'] = b'\x04\x00\x00\x00'
+        self.frag.props['a_str'] = b'\x02a\0'
+
+        values = self.frag.decode_props()
+
+        self.assertEqual(values, dict(uint_prop=4, str_prop="a", doubled=8))
+        self.assertIs(self.frag.str_prop, values['str_prop'])
+
+    def test_decode_props_default(self):
+        values = self.frag.decode_props()
+
+        self.assertEqual(values, dict(uint_prop="default", str_prop=None,
+                                      doubled=0))
+
 
 # vim:set sw=4 ts=8 sts=4 et:
@@ -1,4 +1,8 @@
-from distance import Level
+import unittest
+
+from distance import Level, DefaultClasses
+from distance.bytes import DstBytes
+from distance.lazy import UNSET, LazyMappedSequence
 
 
 class Base(object):
@@ -83,4 +87,138 @@ class BirthdayBashCourtS8Test(Base.WriteReadTest):
         self.assertEqual("birthday bash court", level.name)
 
 
+def write_bytes(obj, copy_unmodified=True):
+    dbytes = DstBytes.in_memory()
+    dbytes.copy_unmodified = copy_unmodified
+    obj.write(dbytes)
+    return dbytes.file.getvalue()
+
+
+def is_inflated(obj):
+    return any(LazyMappedSequence.peek(obj.fragments, i) is not UNSET
+               for i in range(len(obj.sections)))
+
+
+class CopyUnmodifiedTest(unittest.TestCase):
+
+    filename = "tests/in/level/test-straightroad.bytes"
+
+    def setUp(self):
+        with open(self.filename, 'rb') as f:
+            self.orig_bytes = f.read()
+        self.level = Level(DstBytes.from_data(self.orig_bytes))
+
+    def test_unmodified(self):
+        result = write_bytes(self.level)
+
+        self.assertEqual(self.orig_bytes, result)
+        objs = self.level.layers[0].objects
+        self.assertFalse(any(is_inflated(obj) for obj in objs))
+
+    def test_accessed(self):
+        objs = self.level.layers[0].objects
+        transforms = [obj.real_transform for obj in objs]
+
+        result = write_bytes(self.level)
+
+        self.assertEqual(self.orig_bytes, result)
+        self.assertEqual(transforms, [o.real_transform for o in objs])
+
+    def test_modified_transform(self):
+        objs = self.level.layers[0].objects
+        objs[1].real_transform = objs[1].real_transform.set(pos=(1, 2, 3))
+
+        result = Level(DstBytes.from_data(write_bytes(self.level)))
+
+        robjs = result.layers[0].objects
+        self.assertEqual((1, 2, 3), robjs[1].real_transform.pos)
+        self.assertEqual(len(objs), len(robjs))
+        self.assertFalse(is_inflated(objs[0]))
+        for obj, robj in zip(objs, robjs):
+            self.assertEqual(obj.type, robj.type)
+            self.assertEqual(obj.real_transform, robj.real_transform)
+
+    def test_modified_fragments_copied(self):
+        obj = self.level.layers[0].objects[1]
+        obj.real_transform = obj.real_transform.set(pos=(1, 2, 3))
+        expect_inflated = [LazyMappedSequence.peek(obj.fragments, i)
+                           is not UNSET for i in range(len(obj.sections))]
+
+        write_bytes(self.level)
+
+        self.assertEqual(expect_inflated,
+                         [LazyMappedSequence.peek(obj.fragments, i)
+                          is not UNSET for i in range(len(obj.sections))])
+
+    def test_same_as_encoded(self):
+        objs = self.level.layers[0].objects
+        objs[0].real_transform = objs[0].real_transform.set(pos=(1, 2, 3))
+
+        result = write_bytes(self.level)
+
+        self.assertEqual(write_bytes(self.level, copy_unmodified=False),
+                         result)
+
+    def test_removed_object(self):
+        layer = self.level.layers[0]
+        layer.objects = layer.objects[1:]
+
+        result = Level(DstBytes.from_data(write_bytes(self.level)))
+
+        self.assertEqual([o.type for o in self.level.layers[0].objects],
+                         [o.type for o in result.layers[0].objects])
+
+    def test_layer_flags(self):
+        self.level.layers[0].layer_flags = (1, 1, 1)
+
+        result = Level(DstBytes.from_data(write_bytes(self.level)))
+
+        self.assertEqual((1, 1, 1), tuple(result.layers[0].layer_flags))
+
+    def test_layer_name(self):
+        self.level.layers[0].container.name = "Changed"
+
+        result = Level(DstBytes.from_data(write_bytes(self.level)))
+
+        self.assertEqual("Changed", result.layers[0].layer_name)
+
+    def test_object_type(self):
+        obj = self.level.layers[0].objects[0]
+        obj.type = 'Changed'
+
+        result = Level(DstBytes.from_data(write_bytes(self.level)))
+
+        self.assertEqual('Changed', result.layers[0].objects[0].type)
+
+
+class CopyUnmodifiedGroupTest(unittest.TestCase):
+
+    def setUp(self):
+        with open("tests/in/customobject/2cubes.bytes", 'rb') as f:
+            self.orig_bytes = f.read()
+        self.group = DefaultClasses.level_objects.maybe(
+            DstBytes.from_data(self.orig_bytes))
+
+    def test_removed_child(self):
+        child = self.group.children[1]
+        self.group.children = [child]
+
+        result = DefaultClasses.level_objects.maybe(
+            DstBytes.from_data(write_bytes(self.group)))
+
+        self.assertEqual(1, len(result.children))
+        self.assertEqual(self.orig_bytes[child.start_pos:child.end_pos],
+                         write_bytes(result.children[0]))
+        self.assertFalse(is_inflated(child))
+
+    def test_child_modified(self):
+        child = self.group.children[0]
+        child.real_transform = child.real_transform.set(scale=(3, 3, 3))
+
+        result = DefaultClasses.level_objects.maybe(
+            DstBytes.from_data(write_bytes(self.group)))
+
+        self.assertEqual((3, 3, 3), result.children[0].real_transform.scale)
+
+
 # vim:set sw=4 ts=8 sts=4 et:
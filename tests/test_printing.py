@@ -4,7 +4,7 @@ from textwrap import dedent
 
 from trampoline import trampoline
 
-from distance.printing import PrintContext
+from distance.printing import PrintContext, need_counters
 from .common import small_stack
 
 
@@ -238,4 +238,18 @@ class TreeTest(BaseTest):
                 self.assertEqual(lines[-1], "   " * 100 + "└─ Last")
 
 
+class CountersTest(BaseTest):
+
+    def test_removed_on_error(self):
+        p = self.p
+
+        with self.assertRaises(ValueError):
+            with need_counters(p) as counters:
+                self.assertIsNotNone(counters)
+                raise ValueError
+
+        with need_counters(p) as counters:
+            self.assertIsNotNone(counters)
+
+
 # vim:set sw=4 ts=8 sts=4 et:
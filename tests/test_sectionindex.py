@@ -0,0 +1,189 @@
+import os
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+
+from distance import Level
+from distance.bytes import DstBytes, Magic
+from distance.lazy import UNSET, LazyMappedSequence
+from distance.printing import PrintContext
+from distance.sectionindex import (
+    SectionIndex, iter_sections, object_section_keys,
+)
+from .common import check_exceptions, iter_level_objects
+
+
+LEVEL_DIR = "tests/in/level"
+
+
+def print_to_str(obj):
+    out = StringIO()
+    PrintContext.for_test(file=out).print_object(obj)
+    return out.getvalue()
+
+
+class IterSectionsTest(unittest.TestCase):
+
+    def test_objects(self):
+        level = Level("tests/in/level/test-straightroad.bytes")
+        headers = {h.start_pos: h for h in
+                   iter_sections("tests/in/level/test-straightroad.bytes")}
+
+        for obj in iter_level_objects(level, with_groups=True):
+            header = headers[obj.start_pos]
+            self.assertEqual(header.type, obj.type)
+            self.assertEqual(header.end_pos, obj.end_pos)
+            for frag in obj.fragments:
+                header = headers[frag.start_pos]
+                self.assertEqual(header.to_key(), frag.container.to_key())
+
+    def test_level(self):
+        level = Level("tests/in/level/test-straightroad.bytes")
+
+        header = next(iter_sections("tests/in/level/test-straightroad.bytes"))
+
+        self.assertEqual(header.name, level.name)
+        self.assertEqual(header.count, len(level.layers))
+        self.assertEqual(header.depth, 0)
+
+    def test_to_section(self):
+        level = Level("tests/in/level/test-straightroad.bytes")
+        obj = level.layers[0].objects[0]
+        headers = {h.start_pos: h for h in
+                   iter_sections("tests/in/level/test-straightroad.bytes")}
+
+        sec = headers[obj.fragments[0].start_pos].to_section()
+
+        self.assertEqual(sec.to_key(), obj.fragments[0].container.to_key())
+        self.assertEqual(sec.content_start,
+                         obj.fragments[0].container.content_start)
+        self.assertEqual(sec.content_size,
+                         obj.fragments[0].container.content_size)
+
+    def test_object_section_keys(self):
+        level = Level("tests/in/level/test-straightroad.bytes")
+        with open("tests/in/level/test-straightroad.bytes", 'rb') as f:
+            data = f.read()
+
+        def read_keys(obj):
+            keys = {sec.to_key() for sec in obj.sections}
+            for child in obj.children:
+                keys.update(read_keys(child))
+            return keys
+
+        for obj in level.layers[0].objects:
+            con = obj.container
+            keys = object_section_keys(data[con.start_pos:con.end_pos])
+            self.assertEqual(keys, read_keys(obj))
+
+    def test_truncated(self):
+        headers = list(iter_sections(
+            "tests/in/level/test-straightroad_truncated.bytes"))
+
+        self.assertEqual(headers[0].magic, Magic[9])
+        self.assertEqual(len([h for h in headers if h.magic == Magic[6]
+                              and h.depth == 2]), 2)
+
+
+class SectionIndexTest(unittest.TestCase):
+
+    def test_scan(self):
+        index = SectionIndex.scan("tests/in/level/test-straightroad.bytes")
+
+        self.assertEqual(index.starts[0], 0)
+        self.assertEqual(index.magics[0], Magic[9])
+        self.assertEqual(len(index), len(index.ends))
+        self.assertIn('EmpireStartZone', index.types)
+
+    def test_list_positions(self):
+        index = SectionIndex.scan("tests/in/level/test-straightroad.bytes")
+        level = Level("tests/in/level/test-straightroad.bytes")
+        objs = level.layers[0].objects
+
+        positions = index.list_positions(objs[0].start_pos, len(objs))
+
+        self.assertEqual(list(positions), [o.start_pos for o in objs])
+
+    def test_list_positions_unknown(self):
+        index = SectionIndex.scan("tests/in/level/test-straightroad.bytes")
+
+        self.assertIsNone(index.list_positions(1, 1))
+
+    def test_list_positions_too_long(self):
+        index = SectionIndex.scan("tests/in/level/test-straightroad.bytes")
+
+        self.assertIsNone(index.list_positions(0, 2))
+
+    def test_random_access(self):
+        level = Level(SectionIndex.open("tests/in/level/test-straightroad.bytes"))
+        objs = level.layers[0].objects
+
+        last = objs[-1]
+
+        self.assertIsInstance(objs, LazyMappedSequence)
+        self.assertIs(LazyMappedSequence.peek(objs, 0), UNSET)
+        self.assertEqual(last.type, 'EmpireEndZone')
+
+    def test_mmap(self):
+        level = Level(SectionIndex.open("tests/in/level/test-straightroad.bytes",
+                                        mmap=True))
+
+        self.assertEqual(level.layers[0].objects[-1].type, 'EmpireEndZone')
+
+    def test_truncated(self):
+        level = Level.maybe(SectionIndex.open(
+            "tests/in/level/test-straightroad_truncated.bytes"))
+
+        self.assertRaises(EOFError, check_exceptions, level.layers[0].objects[2])
+        self.assertRaises(EOFError, check_exceptions, level.layers[0].objects[-1])
+        self.assertEqual(len(level.layers[0].objects), 3)
+
+    def test_same_as_sequential(self):
+        for name in sorted(os.listdir(LEVEL_DIR)):
+            with self.subTest(name=name):
+                filename = os.path.join(LEVEL_DIR, name)
+                try:
+                    expected = print_to_str(Level.maybe(filename))
+                except Exception as e:
+                    with self.assertRaises(type(e)):
+                        print_to_str(Level.maybe(SectionIndex.open(filename)))
+                    continue
+
+                result = print_to_str(Level.maybe(SectionIndex.open(filename)))
+
+                self.assertEqual(result, expected)
+
+
+class SectionIndexCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "level.bytes")
+        shutil.copyfile("tests/in/level/test-straightroad.bytes", self.filename)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_cached(self):
+        index = SectionIndex.for_file(self.filename)
+
+        self.assertIs(SectionIndex.for_file(self.filename), index)
+
+    def test_modified(self):
+        index = SectionIndex.for_file(self.filename)
+        st = os.stat(self.filename)
+        os.utime(self.filename, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        self.assertIsNot(SectionIndex.for_file(self.filename), index)
+
+    def test_in_memory_source(self):
+        with open(self.filename, 'rb') as f:
+            data = f.read()
+
+        index = SectionIndex.scan(DstBytes.from_data(data))
+
+        self.assertEqual(len(index), len(SectionIndex.for_file(self.filename)))
+
+
+# vim:set sw=4 ts=8 sts=4 et:
@@ -0,0 +1,72 @@
+import unittest
+
+from distance import Level
+from distance.bytes import Magic
+from distance.sectiontable import SectionTable
+from .common import iter_level_objects
+
+
+class SectionTableTest(unittest.TestCase):
+
+    filename = "tests/in/level/test-straightroad.bytes"
+
+    def setUp(self):
+        self.table = SectionTable.from_file(self.filename)
+        self.level = Level(self.filename)
+
+    def test_level(self):
+        sec = self.table.section(0)
+
+        self.assertEqual(sec.magic, Magic[9])
+        self.assertEqual(sec.name, self.level.name)
+        self.assertEqual(sec.count, len(self.level.layers))
+        self.assertEqual(self.table.rows[0]['parent'], -1)
+
+    def test_select_objects(self):
+        objs = [o for o in iter_level_objects(self.level, with_groups=True)
+                if o.type == 'EmpireEndZone']
+
+        indices = self.table.select(type='EmpireEndZone')
+
+        self.assertEqual(list(self.table.rows['offset'][indices]),
+                         [o.start_pos for o in objs])
+
+    def test_select_unknown_type(self):
+        self.assertEqual(len(self.table.select(type='NoSuchObject')), 0)
+
+    def test_select_fragments(self):
+        frags = [frag
+                 for obj in iter_level_objects(self.level, with_groups=True)
+                 for frag in obj.fragments
+                 if frag.container.to_key() == (Magic[3], 0x3, 1)]
+
+        # fragments of level objects, excluding subobjects
+        indices = self.table.select(magic=Magic[3], type=0x3, version=1,
+                                    depth=3)
+
+        self.assertTrue(frags)
+        self.assertEqual(list(self.table.rows['offset'][indices]),
+                         sorted(f.start_pos for f in frags))
+
+    def test_sections(self):
+        obj = self.level.layers[0].objects[0]
+        index, = self.table.select(type=obj.type, depth=2)
+
+        secs = self.table.sections(self.table.children(index))
+
+        self.assertEqual([s.to_key() for s in secs],
+                         [f.container.to_key() for f in obj.fragments])
+        self.assertEqual([s.content_start for s in secs],
+                         [f.container.content_start for f in obj.fragments])
+
+    def test_object_section(self):
+        obj = self.level.layers[0].objects[0]
+        index, = self.table.select(type=obj.type, depth=2)
+
+        sec = self.table.section(index)
+
+        self.assertEqual(sec.to_key(), (Magic[6], obj.type))
+        self.assertEqual(sec.end_pos, obj.end_pos)
+
+
+# vim:set sw=4 ts=8 sts=4 et:
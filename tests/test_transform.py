@@ -1,8 +1,16 @@
 import unittest
+from unittest.mock import patch
 from math import sin, cos, pi
 
+import numpy as np
+
 from distance.bytes import DstBytes, SKIP_BYTES, S_FLOAT3, S_FLOAT4
-from distance.base import Transform, TransformError
+from distance.base import (
+    Transform, TransformError, NoDefaultTransformError,
+    _qmul, _qdiv, _qrotate, _qangle, _rotation_matrix,
+)
+from distance import Level
+from distance.classes import DefaultClasses
 from tests.common import ExtraAssertMixin
 
 
@@ -139,6 +147,255 @@ class DstBytesTest(ExtraAssertMixin, unittest.TestCase):
         self.assertSeqAlmostEqual(((0, 0, 0.01), (1, 0, 0, 0), (1, 1, 1.01)), res)
 
 
+class QuaternionMathTest(ExtraAssertMixin, unittest.TestCase):
+
+    QUATS = [
+        (0, 0, 0, 1),
+        (2**.5/2, 0, 0, 2**.5/2),
+        (0.1, -0.3, 0.5, 0.8),
+        (-0.6, 0.2, 0.1, -0.4),
+    ]
+
+    def setUp(self):
+        import numpy as np, quaternion
+        self.np = np
+        self.quaternion = quaternion
+
+    def to_np(self, q):
+        return self.np.quaternion(q[3], *q[:3])
+
+    def to_tuple(self, q):
+        return (*q.imag, q.real)
+
+    def test_mul(self):
+        for a in self.QUATS:
+            for b in self.QUATS:
+                expect = self.to_tuple(self.to_np(a) * self.to_np(b))
+                self.assertSeqAlmostEqual(expect, _qmul(a, b))
+
+    def test_div(self):
+        for a in self.QUATS:
+            for b in self.QUATS:
+                expect = self.to_tuple(self.to_np(a) / self.to_np(b))
+                self.assertSeqAlmostEqual(expect, _qdiv(a, b))
+
+    def test_rotate(self):
+        for q in self.QUATS:
+            nq = self.to_np(q)
+            expect = (nq * self.np.quaternion(0, 1, 2, 3) / nq).imag
+            self.assertSeqAlmostEqual(expect, _qrotate(q, (1, 2, 3)))
+
+    def test_angle(self):
+        for q in self.QUATS:
+            self.assertAlmostEqual(self.to_np(q).angle(), _qangle(q))
+
+    def test_rotation_matrix(self):
+        for q in self.QUATS:
+            expect = self.quaternion.as_rotation_matrix(self.to_np(q))
+            for erow, row in zip(expect, _rotation_matrix(q)):
+                self.assertSeqAlmostEqual(erow, row)
+
+    def test_apply_rotated_frame(self):
+        rot = (0, sin(pi/4), 0, cos(pi/4))
+        t = Transform.fill((1, 2, 3), rot, (2, 2, 2))
+
+        res = t.apply((1, 0, 0), rot)
+
+        self.assertSeqAlmostEqual((1, 2, 1), res.pos)
+        self.assertSeqAlmostEqual((0, 1, 0, 0), res.rot)
+        self.assertSeqAlmostEqual((2, 2, 2), res.scale)
+
+
+class BatchTransformTest(ExtraAssertMixin, unittest.TestCase):
+
+    def setUp(self):
+        from distance import transform
+        self.transform = transform
+
+    def make_group(self):
+        Group = DefaultClasses.level_objects.klass('Group')
+        level = Level("tests/in/level/test-oldsimples.bytes")
+        children = [o for o in level.layers[0].objects
+                    if o.default_transform]
+        self.assertTrue(children)
+        return Group(children=children)
+
+    def assertTransformsAlmostEqual(self, expect, result):
+        for e, r in zip(expect, result):
+            for ev, rv in zip(e, r):
+                self.assertEqual(len(ev), len(rv))
+                self.assertSeqAlmostEqual(ev, rv, places=5)
+
+    def check_group_op(self, op, *args):
+        loop = self.make_group()
+        batch = self.make_group()
+
+        with patch('distance._impl.level_objects.group.BATCH_MIN_CHILDREN', 1000):
+            getattr(loop, op)(*args)
+        with patch('distance._impl.level_objects.group.BATCH_MIN_CHILDREN', 0):
+            getattr(batch, op)(*args)
+
+        self.assertTransformsAlmostEqual(
+            [o.real_transform for o in loop.children],
+            [o.real_transform for o in batch.children])
+
+    def test_get_set_roundtrip(self):
+        group = self.make_group()
+        expect = [o.real_transform for o in group.children]
+
+        self.transform.set_transforms(
+            group.children, *self.transform.get_transforms(group.children))
+
+        self.assertTransformsAlmostEqual(
+            expect, [o.real_transform for o in group.children])
+
+    def test_apply(self):
+        t = Transform.fill((1, 2, 3), (0.1, -0.3, 0.5, 0.8), (2, 2, 2))
+        objs = [((4, 5, 6), (0, 0, 0, 1), (1, 1, 1)),
+                ((0, 0, 0), (-0.6, 0.2, 0.1, -0.4), (1, 2, 3))]
+
+        pos, rot, scale = self.transform.apply_transforms(
+            t, *map(list, zip(*objs)))
+
+        for i, obj in enumerate(objs):
+            expect = t.apply(*obj)
+            self.assertSeqAlmostEqual(expect.pos, pos[i])
+            self.assertSeqAlmostEqual(expect.rot, rot[i])
+            self.assertSeqAlmostEqual(expect.scale, scale[i])
+
+    def test_apply_scale_axislock_error(self):
+        rot = (sin(pi/3), 0, 0, cos(pi/3))
+        t = Transform.fill(scale=(2, 2, 4))
+
+        self.assertRaisesRegex(
+            TransformError, r"Incompatible", self.transform.apply_transforms,
+            t, [(0, 0, 0), (0, 0, 0)], [(0, 0, 0, 1), rot], [(1, 1, 1)] * 2)
+
+    def test_recenter(self):
+        self.check_group_op('recenter', (10, -20, 30))
+
+    def test_rerotate(self):
+        self.check_group_op('rerotate', (0.1, -0.3, 0.5, 0.8))
+
+    def test_rescale(self):
+        self.check_group_op('rescale', (2, 2, 2))
+
+
+class TransformTableTest(ExtraAssertMixin, unittest.TestCase):
+
+    def setUp(self):
+        from distance import transform
+        self.transform = transform
+
+    def iter_objects(self, objs, parent_transform):
+        for obj in objs:
+            try:
+                transform = obj.transform
+            except NoDefaultTransformError:
+                transform = None
+            if transform is not None and parent_transform is not None:
+                global_transform = parent_transform.apply(*transform)
+            else:
+                global_transform = None
+            yield obj, transform, global_transform
+            yield from self.iter_objects(obj.children, global_transform)
+
+    def iter_level(self, level):
+        for layer in level.layers:
+            yield from self.iter_objects(layer.objects, Transform.fill())
+
+    def assertRowAlmostEqual(self, transform, table, arrays, i):
+        for value, arr in zip(transform, arrays):
+            self.assertSeqAlmostEqual(value, arr[i], places=4)
+
+    def test_local(self):
+        level = Level("tests/in/level/test-oldsimples.bytes")
+
+        table = level.transforms_array()
+
+        found = list(self.iter_level(level))
+        self.assertEqual(len(found), len(table))
+        arrays = table.pos, table.rot, table.scale
+        for i, (obj, transform, _) in enumerate(found):
+            self.assertEqual(obj.start_pos, table.objects[i]['offset'])
+            self.assertEqual(obj.type, table.types[table.objects[i]['type']])
+            self.assertEqual(
+                [not v for v in obj.real_transform or ((), (), ())],
+                list(table.defaulted[i]))
+            if transform is None:
+                for arr, defaulted in zip(arrays, table.defaulted[i]):
+                    self.assertEqual(defaulted, np.all(np.isnan(arr[i])))
+            else:
+                self.assertRowAlmostEqual(transform, table, arrays, i)
+
+    def test_global(self):
+        level = Level("tests/in/level/invalid-groupname.bytes")
+
+        table = level.transforms_array()
+
+        arrays = table.global_transforms()
+        checked = 0
+        for i, (obj, _, transform) in enumerate(self.iter_level(level)):
+            if transform is not None:
+                self.assertRowAlmostEqual(transform, table, arrays, i)
+                checked += 1
+        self.assertGreater(checked, 0)
+
+    def test_groups(self):
+        level = Level("tests/in/level/invalid-groupname.bytes")
+
+        table = level.transforms_array()
+
+        groups = np.flatnonzero(table.type_mask('Group'))
+        self.assertEqual(len(groups), 3)
+        children = np.flatnonzero(np.isin(table.objects['parent'], groups))
+        self.assertTrue(len(children))
+        self.assertTrue(np.all(table.objects['depth'][children] >= 1))
+        self.assertEqual(['Default'], table.layers)
+        self.assertTrue(np.all(table.objects['layer'] == 0))
+
+    def test_no_level_settings(self):
+        table = self.transform.read_transforms(
+            "tests/in/level/test-straightroad.bytes")
+
+        self.assertFalse(np.any(table.type_mask('LevelSettings')))
+
+    def test_default(self):
+        table = self.transform.read_transforms(
+            "tests/in/level/test-straightroad.bytes",
+            default=Transform.fill(scale=2))
+
+        self.assertFalse(np.any(np.isnan(table.pos)))
+        i = np.flatnonzero(table.type_mask('EmpireEndZone'))[0]
+        self.assertTrue(table.defaulted[i][2])
+        self.assertSeqAlmostEqual((2, 2, 2), table.scale[i])
+
+    def test_truncated(self):
+        table = self.transform.read_transforms(
+            "tests/in/level/test-straightroad_truncated.bytes")
+
+        self.assertEqual(len(table), len(table.pos))
+        self.assertEqual('LevelEditorCarSpawner', table.types[0])
+
+    def test_not_read(self):
+        self.assertRaises(ValueError, Level().transforms_array)
+
+    def test_global_incompatible(self):
+        pos = np.zeros((2, 3))
+        rot = np.array([(0, 0, 0, 1), (sin(pi/6), 0, 0, cos(pi/6))])
+        scale = np.array([(2., 2., 4.), (1., 1., 1.)])
+        objects = np.zeros(2, dtype=self.transform.OBJECT_DTYPE)
+        objects['parent'] = -1, 0
+        objects['depth'] = 0, 1
+        table = self.transform.TransformTable(
+            objects, ['Group'], [], pos, rot, scale, np.zeros((2, 3), bool))
+
+        gpos, grot, gscale = table.global_transforms()
+
+        self.assertSeqAlmostEqual((2, 2, 4), gscale[0])
+        self.assertTrue(np.all(np.isnan(gscale[1])))
+
+
 class ReadWriteTest(ExtraAssertMixin, unittest.TestCase):
 
     def test_read_skip(self):
@@ -1,8 +1,12 @@
 import unittest
 from io import BytesIO
+import os
 import struct
+import tempfile
 
-from distance.bytes import DstBytes
+from distance import Level
+from distance.bytes import DstBytes, Magic, Section
+from distance.base import Fragment, Transform
 
 
 def new_bytes():
@@ -134,4 +138,132 @@ class WriteSizeTest(unittest.TestCase):
                          b'\x04\x00\x00\x00\x00\x00\x00\x00test')
 
 
+class WriteSectionTest(unittest.TestCase):
+
+    def test_nested(self):
+        buf, dbytes = new_bytes()
+
+        with dbytes.write_section(Magic[6], 'Test', id=5):
+            with dbytes.write_section(Magic[2], 0x10, 2, id=6):
+                dbytes.write_bytes(b'data')
+            with dbytes.write_section(Magic[5]):
+                pass
+
+        dbytes.seek(0)
+        sec = Section(dbytes)
+        self.assertEqual((Magic[6], 'Test', 5, 2),
+                         (sec.magic, sec.type, sec.id, sec.count))
+        self.assertEqual(len(buf.getvalue()), sec.end_pos)
+        dbytes.seek(sec.content_start)
+        sub = Section(dbytes)
+        self.assertEqual((Magic[2], 0x10, 2, 6, 4),
+                         (sub.magic, sub.type, sub.version, sub.id,
+                          sub.content_size))
+
+    def test_error_restores_count(self):
+        buf, dbytes = new_bytes()
+
+        with self.assertRaises(struct.error):
+            with dbytes.write_section(Magic[2], -1, 0):
+                pass
+
+        self.assertEqual(1, dbytes.num_subsections)
+        self.assertEqual(b'', buf.getvalue())
+
+
+class WriteTransformTest(unittest.TestCase):
+
+    def _test_transform(self, transform):
+        buf, dbytes = new_bytes()
+
+        transform.write_to(dbytes)
+
+        dbytes.seek(0)
+        self.assertEqual(transform, Transform.read_from(dbytes))
+        self.assertEqual(len(buf.getvalue()), dbytes.tell())
+
+    def test_full(self):
+        self._test_transform(Transform.fill((1, 2, 3), (0, 0, 0, 1), (4, 5, 6)))
+
+    def test_partial(self):
+        self._test_transform(Transform((1, 2, 3), (), (4, 5, 6)))
+
+    def test_invalid(self):
+        buf, dbytes = new_bytes()
+
+        self.assertRaises(struct.error,
+                          Transform((1, 2, 3, 4), (1, 2, 3), (1, 2, 3)).write_to,
+                          dbytes)
+
+
+class PipeFile(object):
+
+    """Write-only file that does not support seeking."""
+
+    mode = 'wb'
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def getvalue(self):
+        return b''.join(self.chunks)
+
+
+class StreamWriteTest(unittest.TestCase):
+
+    filename = "tests/in/level/test-straightroad.bytes"
+
+    def setUp(self):
+        with open(self.filename, 'rb') as f:
+            self.orig_bytes = f.read()
+        self.level = Level(DstBytes.from_data(self.orig_bytes))
+
+    def encode(self, obj):
+        dbytes = DstBytes.in_memory()
+        dbytes.copy_unmodified = False
+        obj.write(dbytes)
+        return dbytes.file.getvalue()
+
+    def test_unseekable(self):
+        out = PipeFile()
+
+        n = self.level.write(out)
+
+        self.assertEqual(self.orig_bytes, out.getvalue())
+        self.assertEqual(len(self.orig_bytes), n)
+
+    def test_unseekable_modified(self):
+        for obj in self.level.layers[0].objects:
+            obj.real_transform = obj.real_transform.set(pos=(1, 2, 3))
+        out = PipeFile()
+
+        self.level.write(out)
+
+        self.assertEqual(self.encode(self.level), out.getvalue())
+
+    def test_filename(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "out.bytes")
+
+            n = self.level.write(filename)
+
+            with open(filename, 'rb') as f:
+                self.assertEqual(self.orig_bytes, f.read())
+        self.assertEqual(len(self.orig_bytes), n)
+
+    def test_inconsistent_write(self):
+        class Growing(Fragment):
+            default_container = Magic[8]
+            size = 0
+            def _write_section_data(self, dbytes, sec):
+                self.size += 1
+                dbytes.write_bytes(b'x' * self.size)
+
+        self.assertRaises(RuntimeError, Growing().write, PipeFile())
+
+
 # vim:set sw=4 ts=8 sts=4 et: